@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections import OrderedDict
 from datetime import timedelta
+import time
 from typing import Any, Dict, Mapping, Optional, Tuple, cast
 
 import jwt
@@ -12,9 +13,15 @@ from homeassistant import data_entry_flow
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.util import dt as dt_util
+from homeassistant.util.lru import LRU
 
 from . import auth_store, models
-from .const import ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN
+from .const import (
+    ACCESS_TOKEN_EXPIRATION,
+    ACCESS_TOKEN_LEEWAY,
+    GROUP_ID_ADMIN,
+    VERIFIED_ACCESS_TOKEN_CACHE_SIZE,
+)
 from .mfa_modules import MultiFactorAuthModule, auth_mfa_module_from_config
 from .providers import AuthProvider, LoginFlow, auth_provider_from_config
 
@@ -155,6 +162,8 @@ class AuthManager:
         self._providers = providers
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
+        # Verified access tokens with the refresh token id and expiration
+        self._verified_access_tokens = LRU(VERIFIED_ACCESS_TOKEN_CACHE_SIZE)
 
     @property
     def auth_providers(self) -> list[AuthProvider]:
@@ -506,6 +515,19 @@ class AuthManager:
         self, token: str
     ) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        verified = self._verified_access_tokens.get(token)
+        if verified is not None:
+            token_id, expiration = verified
+            refresh_token = await self._store.async_get_refresh_token(token_id)
+            if (
+                refresh_token is not None
+                and refresh_token.user.is_active
+                and time.time() <= expiration + ACCESS_TOKEN_LEEWAY
+            ):
+                return refresh_token
+            # Expired or revoked
+            self._verified_access_tokens.pop(token)
+
         try:
             unverif_claims = jwt.decode(token, verify=False)
         except jwt.InvalidTokenError:
@@ -523,13 +545,21 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token,
+                jwt_key,
+                leeway=ACCESS_TOKEN_LEEWAY,
+                issuer=issuer,
+                algorithms=["HS256"],
+            )
         except jwt.InvalidTokenError:
             return None
 
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        if "exp" in claims:
+            self._verified_access_tokens[token] = (refresh_token.id, claims["exp"])
         return refresh_token
 
     @callback
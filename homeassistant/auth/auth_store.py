@@ -37,6 +37,8 @@ class AuthStore:
         """Initialize the auth store."""
         self.hass = hass
         self._users: dict[str, models.User] | None = None
+        # Refresh tokens of all users by id
+        self._refresh_tokens: dict[str, models.RefreshToken] = {}
         self._groups: dict[str, models.Group] | None = None
         self._perm_lookup: PermissionLookup | None = None
         self._store = hass.helpers.storage.Store(
@@ -143,6 +145,8 @@ class AuthStore:
             assert self._users is not None
 
         self._users.pop(user.id)
+        for token_id in user.refresh_tokens:
+            self._refresh_tokens.pop(token_id, None)
         self._async_schedule_save()
 
     async def async_update_user(
@@ -227,6 +231,7 @@ class AuthStore:
 
         refresh_token = models.RefreshToken(**kwargs)
         user.refresh_tokens[refresh_token.id] = refresh_token
+        self._refresh_tokens[refresh_token.id] = refresh_token
 
         self._async_schedule_save()
         return refresh_token
@@ -239,10 +244,10 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            if user.refresh_tokens.pop(refresh_token.id, None):
-                self._async_schedule_save()
-                break
+        found = self._refresh_tokens.pop(refresh_token.id, None)
+        if found is not None:
+            found.user.refresh_tokens.pop(found.id, None)
+            self._async_schedule_save()
 
     async def async_get_refresh_token(
         self, token_id: str
@@ -252,12 +257,7 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            refresh_token = user.refresh_tokens.get(token_id)
-            if refresh_token is not None:
-                return refresh_token
-
-        return None
+        return self._refresh_tokens.get(token_id)
 
     async def async_get_refresh_token_by_token(
         self, token: str
@@ -269,10 +269,9 @@ class AuthStore:
 
         found = None
 
-        for user in self._users.values():
-            for refresh_token in user.refresh_tokens.values():
-                if hmac.compare_digest(refresh_token.token, token):
-                    found = refresh_token
+        for refresh_token in self._refresh_tokens.values():
+            if hmac.compare_digest(refresh_token.token, token):
+                found = refresh_token
 
         return found
 
@@ -478,6 +477,7 @@ class AuthStore:
                 version=rt_dict.get("version"),
             )
             users[rt_dict["user_id"]].refresh_tokens[token.id] = token
+            self._refresh_tokens[token.id] = token
 
         self._groups = groups
         self._users = users
@@ -3,6 +3,9 @@ from datetime import timedelta
 
 ACCESS_TOKEN_EXPIRATION = timedelta(minutes=30)
 MFA_SESSION_EXPIRATION = timedelta(minutes=5)
+# Leeway in seconds when checking the expiration of access tokens
+ACCESS_TOKEN_LEEWAY = 10
+VERIFIED_ACCESS_TOKEN_CACHE_SIZE = 1024
 
 GROUP_ID_ADMIN = "system-admin"
 GROUP_ID_USER = "system-users"
@@ -21,6 +21,7 @@ from homeassistant.const import REQUIRED_NEXT_PYTHON_DATE, REQUIRED_NEXT_PYTHON_
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import area_registry, device_registry, entity_registry
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
@@ -31,8 +32,15 @@ from homeassistant.setup import (
 )
 from homeassistant.util.async_ import gather_with_concurrency
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import save_json
 from homeassistant.util.logging import async_activate_log_queue_handler
 from homeassistant.util.package import async_get_user_site, is_virtual_env
+from homeassistant.util.startup_profile import (
+    DATA_STARTUP_PROFILE,
+    PHASE_STAGE,
+    StartupProfile,
+    startup_phase,
+)
 
 if TYPE_CHECKING:
     from .runner import RuntimeConfig
@@ -40,6 +48,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 ERROR_LOG_FILENAME = "home-assistant.log"
+STARTUP_PROFILE_FILENAME = "startup_profile.json"
 
 # hass.data key for logging information.
 DATA_LOGGING = "logging"
@@ -55,6 +64,9 @@ COOLDOWN_TIME = 60
 
 MAX_LOAD_CONCURRENTLY = 6
 
+MANIFEST_INDEX_STORAGE_KEY = "core.manifest_index"
+MANIFEST_INDEX_STORAGE_VERSION = 1
+
 DEBUGGER_INTEGRATIONS = {"debugpy"}
 CORE_INTEGRATIONS = ("homeassistant", "persistent_notification")
 LOGGING_INTEGRATIONS = {
@@ -87,6 +99,10 @@ async def async_setup_hass(
     hass = core.HomeAssistant()
     hass.config.config_dir = runtime_config.config_dir
 
+    profile = None
+    if runtime_config.profile_startup:
+        profile = hass.data[DATA_STARTUP_PROFILE] = StartupProfile()
+
     async_enable_logging(
         hass,
         runtime_config.verbose,
@@ -155,6 +171,8 @@ async def async_setup_hass(
         hass.config.internal_url = old_config.internal_url
         hass.config.external_url = old_config.external_url
         hass.config.config_dir = old_config.config_dir
+        if profile is not None:
+            hass.data[DATA_STARTUP_PROFILE] = profile
 
     if safe_mode:
         _LOGGER.info("Starting in safe mode")
@@ -167,12 +185,29 @@ async def async_setup_hass(
             hass,
         )
 
+    if profile is not None:
+        await _async_write_startup_profile(hass, profile)
+
     if runtime_config.open_ui:
         hass.add_job(open_hass_ui, hass)
 
     return hass
 
 
+async def _async_write_startup_profile(
+    hass: core.HomeAssistant, profile: StartupProfile
+) -> None:
+    """Stop profiling the startup and write the profile to the config dir."""
+    profile.finish()
+    path = hass.config.path(STARTUP_PROFILE_FILENAME)
+    try:
+        await hass.async_add_executor_job(save_json, path, profile.as_dict())
+    except HomeAssistantError:
+        # Already logged by save_json
+        return
+    _LOGGER.info("Startup profile written to %s", path)
+
+
 def open_hass_ui(hass: core.HomeAssistant) -> None:
     """Open the UI."""
     import webbrowser  # pylint: disable=import-outside-toplevel
@@ -203,6 +238,8 @@ async def async_from_config_dict(
     """
     start = monotonic()
 
+    manifest_index_store = await _async_load_manifest_index(hass)
+
     hass.config_entries = config_entries.ConfigEntries(hass, config)
     await hass.config_entries.async_initialize()
 
@@ -238,6 +275,8 @@ async def async_from_config_dict(
 
     await _async_set_up_integrations(hass, config)
 
+    await _async_save_manifest_index(hass, manifest_index_store)
+
     stop = monotonic()
     _LOGGER.info("Home Assistant initialized in %.2fs", stop - start)
 
@@ -258,6 +297,28 @@ async def async_from_config_dict(
     return hass
 
 
+async def _async_load_manifest_index(hass: core.HomeAssistant) -> Store:
+    """Load the manifest index so integrations resolve without reading manifests."""
+    store = Store(hass, MANIFEST_INDEX_STORAGE_VERSION, MANIFEST_INDEX_STORAGE_KEY)
+    try:
+        data = await store.async_load()
+    except HomeAssistantError as err:
+        _LOGGER.warning("Unable to load the manifest index: %s", err)
+        data = None
+
+    index = loader.ManifestIndex(data)  # type: ignore[arg-type]
+    await hass.async_add_executor_job(index.validate)
+    hass.data[loader.DATA_MANIFEST_INDEX] = index
+    return store
+
+
+async def _async_save_manifest_index(hass: core.HomeAssistant, store: Store) -> None:
+    """Save the manifest index if integrations were resolved from disk."""
+    index: loader.ManifestIndex = hass.data[loader.DATA_MANIFEST_INDEX]
+    if index.dirty:
+        await store.async_save(index.as_dict())
+
+
 @core.callback
 def async_enable_logging(
     hass: core.HomeAssistant,
@@ -541,7 +602,8 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                with startup_phase(hass, "bootstrap", PHASE_STAGE, "stage 1"):
+                    await async_setup_multi_components(hass, stage_1_domains, config)
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 1 - moving forward")
 
@@ -554,7 +616,8 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                with startup_phase(hass, "bootstrap", PHASE_STAGE, "stage 2"):
+                    await async_setup_multi_components(hass, stage_2_domains, config)
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 2 - moving forward")
 
@@ -575,6 +638,7 @@ async def _async_set_up_integrations(
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
         async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
+            with startup_phase(hass, "bootstrap", PHASE_STAGE, "wrap up"):
+                await hass.async_block_till_done()
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
@@ -7,6 +7,7 @@ import collections
 from collections.abc import Awaitable, Mapping
 from contextlib import suppress
 from datetime import datetime, timedelta
+from functools import partial
 import hashlib
 import logging
 import os
@@ -58,10 +59,12 @@ from .const import (
     CONF_DURATION,
     CONF_LOOKBACK,
     DATA_CAMERA_PREFS,
+    DATA_STILL_STREAMS,
     DOMAIN,
     SERVICE_RECORD,
 )
 from .prefs import CameraPreferences
+from .still_stream import FRAME_BOUNDARY, StillStream
 
 # mypy: allow-untyped-calls
 
@@ -141,14 +144,27 @@ async def async_get_image(
 
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
-            image = await camera.async_camera_image()
+            image = await _async_get_camera_image(camera)
 
             if image:
-                return Image(camera.content_type, image)
+                return image
 
     raise HomeAssistantError("Unable to get image")
 
 
+async def _async_get_camera_image(camera: Camera) -> Image | None:
+    """Fetch an image from the running stream of a camera or the camera."""
+    if camera.stream and camera.use_stream_for_stills:
+        content = await camera.stream.async_get_image()
+        if content:
+            return Image(DEFAULT_CONTENT_TYPE, content)
+
+    content = await camera.async_camera_image()
+    if content:
+        return Image(camera.content_type, content)
+    return None
+
+
 @bind_hass
 async def async_get_stream_source(hass: HomeAssistant, entity_id: str) -> str | None:
     """Fetch the stream source for a camera entity."""
@@ -175,42 +191,24 @@ async def async_get_still_stream(
 ) -> web.StreamResponse:
     """Generate an HTTP MJPEG stream from camera images.
 
+    All viewers of the same image callback, content type and interval share
+    the images, they are only fetched once.
+
     This method must be run in the event loop.
     """
     response = web.StreamResponse()
-    response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
+    response.content_type = CONTENT_TYPE_MULTIPART.format(FRAME_BOUNDARY)
     await response.prepare(request)
 
-    async def write_to_mjpeg_stream(img_bytes: bytes) -> None:
-        """Write image to stream."""
-        await response.write(
-            bytes(
-                "--frameboundary\r\n"
-                "Content-Type: {}\r\n"
-                "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
-                "utf-8",
-            )
-            + img_bytes
-            + b"\r\n"
+    hass: HomeAssistant = request.app["hass"]
+    streams: dict[tuple, StillStream] = hass.data.setdefault(DATA_STILL_STREAMS, {})
+    key = (image_cb, content_type, interval)
+    stream = streams.get(key)
+    if stream is None:
+        stream = streams[key] = StillStream(
+            hass, image_cb, content_type, interval, partial(streams.pop, key)
         )
-
-    last_image = None
-
-    while True:
-        img_bytes = await image_cb()
-        if not img_bytes:
-            break
-
-        if img_bytes != last_image:
-            await write_to_mjpeg_stream(img_bytes)
-
-            # Chrome seems to always ignore first picture,
-            # print it twice.
-            if last_image is None:
-                await write_to_mjpeg_stream(img_bytes)
-            last_image = img_bytes
-
-        await asyncio.sleep(interval)
+    await stream.async_add_viewer(response)
 
     return response
 
@@ -361,6 +359,11 @@ class Camera(Entity):
         """Return the camera model."""
         return None
 
+    @property
+    def use_stream_for_stills(self) -> bool:
+        """Return true if images are taken from the stream while it runs."""
+        return True
+
     @property
     def frame_interval(self) -> float:
         """Return the interval between frames of the mjpeg stream."""
@@ -525,10 +528,10 @@ class CameraImageView(CameraView):
         """Serve camera image."""
         with suppress(asyncio.CancelledError, asyncio.TimeoutError):
             async with async_timeout.timeout(CAMERA_IMAGE_TIMEOUT):
-                image = await camera.async_camera_image()
+                image = await _async_get_camera_image(camera)
 
             if image:
-                return web.Response(body=image, content_type=camera.content_type)
+                return web.Response(body=image.content, content_type=image.content_type)
 
         raise web.HTTPInternalServerError()
 
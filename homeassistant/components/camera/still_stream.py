@@ -0,0 +1,121 @@
+"""Share the images of an MJPEG stream of camera stills between viewers."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+import logging
+from typing import Callable
+
+from aiohttp import web
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+FRAME_BOUNDARY = "--frameboundary"
+
+
+class StillStream:
+    """Fetch the images of a still stream once for all of its viewers.
+
+    Each new image is turned into a multipart chunk once and that chunk is
+    written to every viewer. Viewers that read slower than images arrive
+    skip images instead of queueing them. Fetching stops when the last
+    viewer leaves or the image callback returns no image.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        image_cb: Callable[[], Awaitable[bytes | None]],
+        content_type: str,
+        interval: float,
+        on_close: Callable[[], object],
+    ) -> None:
+        """Initialize the still stream."""
+        self.hass = hass
+        self.closed = False
+        self._image_cb = image_cb
+        self._interval = interval
+        self._on_close = on_close
+        self._header = (
+            f"{FRAME_BOUNDARY}\r\nContent-Type: {content_type}\r\nContent-Length: "
+        ).encode("utf-8")
+        self._viewers = 0
+        self._chunk: bytes | None = None
+        self._chunk_changed: asyncio.Future[None] = hass.loop.create_future()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def viewers(self) -> int:
+        """Return the number of viewers."""
+        return self._viewers
+
+    async def async_add_viewer(self, response: web.StreamResponse) -> None:
+        """Write the images to a prepared response until the stream ends."""
+        self._viewers += 1
+        if self._task is None:
+            self._task = self.hass.loop.create_task(self._async_fetch_images())
+        try:
+            written = None
+            while True:
+                chunk = self._chunk
+                if chunk is None or chunk is written:
+                    if self.closed:
+                        break
+                    await asyncio.shield(self._chunk_changed)
+                    continue
+                await response.write(chunk)
+                # Chrome seems to always ignore first picture,
+                # print it twice.
+                if written is None:
+                    await response.write(chunk)
+                written = chunk
+        finally:
+            self._viewers -= 1
+            if not self._viewers:
+                self._async_close()
+                if self._task is not None:
+                    self._task.cancel()
+
+    async def _async_fetch_images(self) -> None:
+        """Fetch the images and publish the ones that changed."""
+        last_image = None
+        try:
+            while True:
+                img_bytes = await self._image_cb()
+                if not img_bytes:
+                    break
+                if img_bytes != last_image:
+                    last_image = img_bytes
+                    self._chunk = b"".join(
+                        (
+                            self._header,
+                            str(len(img_bytes)).encode("utf-8"),
+                            b"\r\n\r\n",
+                            img_bytes,
+                            b"\r\n",
+                        )
+                    )
+                    self._async_notify()
+                await asyncio.sleep(self._interval)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error fetching image for the still stream")
+        finally:
+            self._async_close()
+
+    @callback
+    def _async_notify(self) -> None:
+        """Wake up the viewers waiting for a new image."""
+        chunk_changed = self._chunk_changed
+        self._chunk_changed = self.hass.loop.create_future()
+        chunk_changed.set_result(None)
+
+    @callback
+    def _async_close(self) -> None:
+        """Stop accepting viewers and end the stream of every viewer."""
+        if self.closed:
+            return
+        self.closed = True
+        self._on_close()
+        self._async_notify()
@@ -14,7 +14,11 @@ import voluptuous as vol
 from homeassistant.components import websocket_api
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder import history, models as history_models
-from homeassistant.components.recorder.statistics import statistics_during_period
+from homeassistant.components.recorder.statistics import (
+    PERIOD_5MINUTE,
+    PERIOD_HOUR,
+    statistics_during_period,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import (
     CONF_DOMAINS,
@@ -120,6 +124,9 @@ class LazyState(history_models.LazyState):
         vol.Required("start_time"): str,
         vol.Optional("end_time"): str,
         vol.Optional("statistic_id"): str,
+        vol.Optional("period", default=PERIOD_HOUR): vol.In(
+            [PERIOD_5MINUTE, PERIOD_HOUR]
+        ),
     }
 )
 @websocket_api.async_response
@@ -153,6 +160,7 @@ async def ws_get_statistics_during_period(
         start_time,
         end_time,
         msg.get("statistic_id"),
+        msg["period"],
     )
     connection.send_result(msg["id"], {"statistics": statistics})
 
@@ -211,6 +219,14 @@ class HistoryPeriodView(HomeAssistantView):
 
         minimal_response = "minimal_response" in request.query
 
+        bucket_size = None
+        if "resolution" in request.query or "max_points" in request.query:
+            bucket_size = _bucket_size(request.query, start_time, end_time)
+            if bucket_size is None:
+                return self.json_message(
+                    "Invalid resolution or max_points", HTTP_BAD_REQUEST
+                )
+
         hass = request.app["hass"]
 
         if (
@@ -231,6 +247,7 @@ class HistoryPeriodView(HomeAssistantView):
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
+                bucket_size,
             ),
         )
 
@@ -243,24 +260,38 @@ class HistoryPeriodView(HomeAssistantView):
         include_start_time_state,
         significant_changes_only,
         minimal_response,
+        bucket_size=None,
     ):
         """Fetch significant stats from the database as json."""
         timer_start = time.perf_counter()
 
         with session_scope(hass=hass) as session:
-            result = (
-                history._get_significant_states(  # pylint: disable=protected-access
+            if bucket_size is not None:
+                result = history._get_significant_states_downsampled(  # pylint: disable=protected-access
                     hass,
                     session,
                     start_time,
                     end_time,
+                    bucket_size,
                     entity_ids,
                     self.filters,
                     include_start_time_state,
                     significant_changes_only,
-                    minimal_response,
                 )
-            )
+            else:
+                result = (
+                    history._get_significant_states(  # pylint: disable=protected-access
+                        hass,
+                        session,
+                        start_time,
+                        end_time,
+                        entity_ids,
+                        self.filters,
+                        include_start_time_state,
+                        significant_changes_only,
+                        minimal_response,
+                    )
+                )
 
         result = list(result.values())
         if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -283,6 +314,28 @@ class HistoryPeriodView(HomeAssistantView):
         return self.json(result)
 
 
+def _bucket_size(query, start_time, end_time):
+    """Return the bucket size for a resolution or max_points query.
+
+    Returns None if the query is invalid.
+    """
+    bucket_size = timedelta(seconds=1)
+    try:
+        if "resolution" in query:
+            resolution = timedelta(seconds=float(query["resolution"]))
+            if resolution <= timedelta(0):
+                return None
+            bucket_size = max(bucket_size, resolution)
+        if "max_points" in query:
+            max_points = int(query["max_points"])
+            if max_points <= 0:
+                return None
+            bucket_size = max(bucket_size, (end_time - start_time) / max_points)
+    except (ValueError, OverflowError):
+        return None
+    return bucket_size
+
+
 def sqlalchemy_filter_from_include_exclude_conf(conf):
     """Build a sql filter from config."""
     filters = Filters()
@@ -64,6 +64,8 @@ from .const import (
     CONF_PORT,
     CONF_PRECISION,
     CONF_RETRY_COUNT,
+    CONF_SPOOL,
+    CONF_SPOOL_MAX_SIZE,
     CONF_SSL,
     CONF_SSL_CA_CERT,
     CONF_TAGS,
@@ -75,6 +77,7 @@ from .const import (
     DEFAULT_API_VERSION,
     DEFAULT_HOST_V2,
     DEFAULT_MEASUREMENT_ATTR,
+    DEFAULT_SPOOL_MAX_SIZE,
     DEFAULT_SSL_V2,
     DOMAIN,
     EVENT_NEW_STATE,
@@ -93,12 +96,16 @@ from .const import (
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_DIRECTORY,
+    SPOOL_RESUMED_MESSAGE,
+    SPOOLING_MESSAGE,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
+from .spool import InfluxSpool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -160,6 +167,10 @@ _CUSTOMIZE_ENTITY_SCHEMA = vol.Schema(
 _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {
         vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
+        vol.Optional(CONF_SPOOL, default=False): cv.boolean,
+        vol.Optional(
+            CONF_SPOOL_MAX_SIZE, default=DEFAULT_SPOOL_MAX_SIZE
+        ): cv.positive_int,
         vol.Optional(CONF_DEFAULT_MEASUREMENT): cv.string,
         vol.Optional(CONF_MEASUREMENT_ATTR, default=DEFAULT_MEASUREMENT_ATTR): vol.In(
             ["unit_of_measurement", "domain__device_class", "entity_id"]
@@ -479,7 +490,14 @@ def setup(hass, config):
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    spool = None
+    if conf[CONF_SPOOL]:
+        spool = InfluxSpool(
+            hass.config.path(SPOOL_DIRECTORY), conf[CONF_SPOOL_MAX_SIZE] * 1024 * 1024
+        )
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, event_to_json, max_tries, spool
+    )
     instance.start()
 
     def shutdown(event):
@@ -496,15 +514,18 @@ def setup(hass, config):
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(self, hass, influx, event_to_json, max_tries, spool=None):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue = queue.Queue()
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
+        self.spool = spool
+        self.spooling = False
         self.write_errors = 0
         self.shutdown = False
+        self._spool_retry_at = 0.0
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     @callback
@@ -520,12 +541,16 @@ class InfluxThread(threading.Thread):
 
     def get_events_json(self):
         """Return a batch of events formatted for writing."""
+        if self.spool is not None and self.spool.pending:
+            return self._get_spooled_events_json()
+
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
 
         count = 0
         json = []
 
         dropped = 0
+        spooled = []
 
         with suppress(queue.Empty):
             while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
@@ -543,16 +568,68 @@ class InfluxThread(threading.Thread):
                         event_json = self.event_to_json(event)
                         if event_json:
                             json.append(event_json)
+                    elif self.spool is not None:
+                        event_json = self.event_to_json(event)
+                        if event_json:
+                            spooled.append(event_json)
                     else:
                         dropped += 1
 
         if dropped:
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
+        if spooled:
+            self.spool.append(spooled)
 
         return count, json
 
+    def _get_spooled_events_json(self):
+        """Move queued events to the spool and return the oldest spooled batch.
+
+        While InfluxDB is unreachable the queued events are spooled until
+        RETRY_DELAY has passed before the next write is tried.
+        """
+        count = 0
+        json = []
+
+        with suppress(queue.Empty):
+            while not self.shutdown:
+                timeout = self._spool_retry_at - time.monotonic()
+                if timeout > 0:
+                    item = self.queue.get(timeout=timeout)
+                else:
+                    item = self.queue.get_nowait()
+                count += 1
+
+                if item is None:
+                    self.shutdown = True
+                elif event_json := self.event_to_json(item[1]):
+                    json.append(event_json)
+                    if len(json) == BATCH_BUFFER_SIZE:
+                        self.spool.append(json)
+                        json = []
+
+        if json:
+            self.spool.append(json)
+
+        _LOGGER.debug(
+            "%d events spooled (%d bytes, %d dropped), %d events queued",
+            self.spool.pending,
+            self.spool.size,
+            self.spool.dropped,
+            self.queue.qsize(),
+        )
+
+        # Spooled events are kept for the next start
+        if self.shutdown:
+            return count, []
+
+        return count, self.spool.read(BATCH_BUFFER_SIZE)
+
     def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
+        """Write preprocessed events to influxdb, with retry.
+
+        Return False if InfluxDB could not be reached.
+        """
         for retry in range(self.max_tries + 1):
             try:
                 self.influx.write(json)
@@ -569,17 +646,45 @@ class InfluxThread(threading.Thread):
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
+                elif self.spool is not None:
+                    if not self.spooling:
+                        _LOGGER.error(SPOOLING_MESSAGE, err)
+                        self.spooling = True
+                    return False
                 else:
                     if not self.write_errors:
                         _LOGGER.error(err)
                     self.write_errors += len(json)
+                    return False
+
+        return True
+
+    def _update_spool(self, json, from_spool, written):
+        """Spool a batch that was not written or remove a written spooled batch."""
+        if not written:
+            self._spool_retry_at = time.monotonic() + RETRY_DELAY
+            if not from_spool:
+                self.spool.append(json)
+            return
+
+        if from_spool:
+            self.spool.commit()
+            if self.spooling and not self.spool.pending:
+                _LOGGER.warning(SPOOL_RESUMED_MESSAGE)
+                self.spooling = False
 
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
+            from_spool = self.spool is not None and self.spool.pending > 0
             count, json = self.get_events_json()
             if json:
-                self.write_to_influxdb(json)
+                written = self.write_to_influxdb(json)
+                if self.spool is not None:
+                    self._update_spool(json, from_spool, written)
+            elif from_spool:
+                # Only corrupt points were left in the spool
+                self._update_spool(json, from_spool, True)
             for _ in range(count):
                 self.queue.task_done()
 
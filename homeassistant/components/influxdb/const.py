@@ -32,6 +32,8 @@ CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
 CONF_SSL_CA_CERT = "ssl_ca_cert"
+CONF_SPOOL = "spool"
+CONF_SPOOL_MAX_SIZE = "spool_max_size"
 
 CONF_LANGUAGE = "language"
 CONF_QUERIES = "queries"
@@ -59,6 +61,7 @@ DEFAULT_RANGE_START = "-15m"
 DEFAULT_RANGE_STOP = "now()"
 DEFAULT_FUNCTION_FLUX = "|> limit(n: 1)"
 DEFAULT_MEASUREMENT_ATTR = "unit_of_measurement"
+DEFAULT_SPOOL_MAX_SIZE = 100  # MiB
 
 INFLUX_CONF_MEASUREMENT = "measurement"
 INFLUX_CONF_TAGS = "tags"
@@ -78,6 +81,9 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+SPOOL_DIRECTORY = "influxdb_spool"
+SPOOL_SEGMENT_SIZE = 1024 * 1024
+SPOOL_SEGMENT_SUFFIX = ".jsonl"
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -120,6 +126,9 @@ RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
+SPOOLING_MESSAGE = "%s Spooling events to disk until InfluxDB is reachable again."
+SPOOL_RESUMED_MESSAGE = "Resumed, wrote all spooled events."
+SPOOL_DROPPED_MESSAGE = "Spool is full, dropped %d old events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
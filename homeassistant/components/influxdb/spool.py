@@ -0,0 +1,188 @@
+"""Disk-backed spool for InfluxDB points that could not be written yet."""
+from __future__ import annotations
+
+from collections import deque
+import json
+import logging
+import os
+from typing import Any
+
+from homeassistant.helpers.json import JSONEncoder
+
+from .const import SPOOL_DROPPED_MESSAGE, SPOOL_SEGMENT_SIZE, SPOOL_SEGMENT_SUFFIX
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class InfluxSpool:
+    """Append-only spool of points stored as JSON lines in segment files.
+
+    Points are appended to the newest segment and read back in order from
+    the oldest one, so only the batch being written is kept in memory.
+    Fully written segments are deleted. When the spool grows beyond
+    max_size the oldest segments are dropped.
+
+    Not thread safe, the spool is only used by the InfluxDB thread.
+    """
+
+    def __init__(
+        self, path: str, max_size: int, segment_size: int = SPOOL_SEGMENT_SIZE
+    ) -> None:
+        """Initialize the spool and pick up segments left by an earlier run."""
+        self.path = path
+        self.max_size = max_size
+        self.segment_size = segment_size
+        self.dropped = 0
+        self.size = 0
+        self.pending = 0
+        self._segments: deque[int] = deque()
+        self._segment_sizes: dict[int, int] = {}
+        self._segment_points: dict[int, int] = {}
+        # Read position in the oldest segment
+        self._offset = 0
+        self._offset_points = 0
+        # Position after the last batch read
+        self._next_position: tuple[int, int, int] | None = None
+
+        os.makedirs(path, exist_ok=True)
+        for name in os.listdir(path):
+            if not name.endswith(SPOOL_SEGMENT_SUFFIX):
+                continue
+            try:
+                segment = int(name[: -len(SPOOL_SEGMENT_SUFFIX)])
+            except ValueError:
+                continue
+            self._segments.append(segment)
+        self._segments = deque(sorted(self._segments))
+
+        last_segment = self._segments[-1] if self._segments else None
+        for segment in self._segments:
+            points = 0
+            size = 0
+            with open(self._segment_path(segment), "r+b") as file:
+                for line in file:
+                    if segment == last_segment and not line.endswith(b"\n"):
+                        # Cut off a point that was not fully written, the
+                        # next append would run into it otherwise
+                        _LOGGER.warning("Dropping partially spooled point: %s", line)
+                        file.truncate(size)
+                        break
+                    points += 1
+                    size += len(line)
+            self._segment_sizes[segment] = size
+            self._segment_points[segment] = points
+            self.size += size
+            self.pending += points
+
+        if self.pending:
+            _LOGGER.debug("Found %d spooled points in %s", self.pending, path)
+
+    def _segment_path(self, segment: int) -> str:
+        """Return the path of a segment file."""
+        return os.path.join(self.path, f"{segment:010d}{SPOOL_SEGMENT_SUFFIX}")
+
+    def append(self, points: list[dict[str, Any]]) -> None:
+        """Append points to the spool."""
+        lines = []
+        for point in points:
+            try:
+                lines.append(json.dumps(point, cls=JSONEncoder).encode() + b"\n")
+            except (TypeError, ValueError):
+                _LOGGER.warning("Point is not JSON serializable: %s", point)
+        if not lines:
+            return
+
+        if (
+            not self._segments
+            or self._segment_sizes[self._segments[-1]] >= self.segment_size
+        ):
+            segment = self._segments[-1] + 1 if self._segments else 0
+            self._segments.append(segment)
+            self._segment_sizes[segment] = 0
+            self._segment_points[segment] = 0
+        else:
+            segment = self._segments[-1]
+
+        data = b"".join(lines)
+        with open(self._segment_path(segment), "ab") as file:
+            file.write(data)
+        self._segment_sizes[segment] += len(data)
+        self._segment_points[segment] += len(lines)
+        self.size += len(data)
+        self.pending += len(lines)
+
+        while self.size > self.max_size and len(self._segments) > 1:
+            self._drop_oldest_segment()
+
+    def _drop_oldest_segment(self) -> None:
+        """Drop the oldest segment to stay within the maximum size."""
+        segment = self._segments[0]
+        dropped = self._segment_points[segment] - self._offset_points
+        self._remove_oldest_segment()
+        self.dropped += dropped
+        _LOGGER.warning(SPOOL_DROPPED_MESSAGE, dropped)
+
+    def _remove_oldest_segment(self) -> None:
+        """Delete the oldest segment file."""
+        segment = self._segments.popleft()
+        self.size -= self._segment_sizes.pop(segment)
+        self.pending -= self._segment_points.pop(segment) - self._offset_points
+        self._offset = 0
+        self._offset_points = 0
+        self._next_position = None
+        try:
+            os.remove(self._segment_path(segment))
+        except FileNotFoundError:
+            pass
+
+    def read(self, max_points: int) -> list[dict[str, Any]]:
+        """Return up to max_points of the oldest points without removing them.
+
+        Call commit once the points are written to remove them. When only
+        corrupt points are left they are removed right away.
+        """
+        points: list[dict[str, Any]] = []
+        offset = self._offset
+        offset_points = self._offset_points
+        segment = None
+
+        for segment in self._segments:
+            with open(self._segment_path(segment), "rb") as file:
+                file.seek(offset)
+                for line in file:
+                    offset += len(line)
+                    offset_points += 1
+                    try:
+                        points.append(json.loads(line))
+                    except ValueError:
+                        _LOGGER.warning("Skipping corrupt spooled point: %s", line)
+                        continue
+                    if len(points) == max_points:
+                        break
+            if len(points) == max_points:
+                break
+            if segment != self._segments[-1]:
+                offset = 0
+                offset_points = 0
+
+        if segment is not None:
+            self._next_position = (segment, offset, offset_points)
+            if not points:
+                self.commit()
+        return points
+
+    def commit(self) -> None:
+        """Remove the points returned by the last read."""
+        if self._next_position is None:
+            return
+        segment, offset, offset_points = self._next_position
+        self._next_position = None
+
+        while self._segments[0] != segment:
+            self._remove_oldest_segment()
+
+        self.pending -= offset_points - self._offset_points
+        self._offset = offset
+        self._offset_points = offset_points
+        if offset >= self._segment_sizes[segment]:
+            self._remove_oldest_segment()
@@ -1,20 +1,27 @@
 """Event parser and human readable log generator."""
+import asyncio
 from contextlib import suppress
 from datetime import timedelta
-from itertools import groupby
+from itertools import groupby, islice
 import json
+import logging
 import re
 
+from aiohttp import web
+from aiohttp.hdrs import CONTENT_TYPE
 import sqlalchemy
 from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import literal
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.history import sqlalchemy_filter_from_include_exclude_conf
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
     process_timestamp_to_utc_isoformat,
 )
@@ -27,12 +34,15 @@ from homeassistant.const import (
     ATTR_ICON,
     ATTR_NAME,
     ATTR_SERVICE,
+    ATTR_UNIT_OF_MEASUREMENT,
+    CONTENT_TYPE_JSON,
     EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_LOGBOOK_ENTRY,
     EVENT_STATE_CHANGED,
     HTTP_BAD_REQUEST,
+    MATCH_ALL,
 )
 from homeassistant.core import DOMAIN as HA_DOMAIN, callback, split_entity_id
 from homeassistant.exceptions import InvalidEntityFormatError
@@ -45,8 +55,12 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
+from homeassistant.helpers.json import json_bytes
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
+from homeassistant.util.lru import LRU
+
+_LOGGER = logging.getLogger(__name__)
 
 ENTITY_ID_JSON_TEMPLATE = '"entity_id": "{}"'
 ENTITY_ID_JSON_EXTRACT = re.compile('"entity_id": "([^"]+)"')
@@ -61,6 +75,17 @@ DOMAIN = "logbook"
 
 GROUP_BY_MINUTES = 15
 
+# The number of entries serialized and written to the response at once
+STREAM_BATCH_SIZE = 500
+
+# The number of contexts kept to describe the cause of live entries
+LIVE_CONTEXT_LOOKUP_SIZE = 2048
+
+# Seconds to wait for the recorder to commit before fetching recorded entries
+RECORDER_COMMIT_TIMEOUT = 10
+
+DATA_FILTERS = "logbook_filters"
+
 EMPTY_JSON_OBJECT = "{}"
 UNIT_OF_MEASUREMENT_JSON = '"unit_of_measurement":'
 
@@ -95,6 +120,12 @@ EVENT_COLUMNS = [
     Events.context_parent_id,
 ]
 
+# Attributes are either stored in the states table
+# or in the shared attributes table
+STATE_ATTRIBUTES_JSON = sqlalchemy.func.coalesce(
+    States.attributes, StateAttributes.shared_attrs
+)
+
 SCRIPT_AUTOMATION_EVENTS = [EVENT_AUTOMATION_TRIGGERED, EVENT_SCRIPT_STARTED]
 
 LOG_MESSAGE_SCHEMA = vol.Schema(
@@ -160,7 +191,9 @@ async def async_setup(hass, config):
         filters = None
         entities_filter = None
 
+    hass.data[DATA_FILTERS] = (filters, entities_filter)
     hass.http.register_view(LogbookView(conf, filters, entities_filter))
+    websocket_api.async_register_command(hass, ws_event_stream)
 
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
 
@@ -239,22 +272,178 @@ class LogbookView(HomeAssistantView):
                 "Can't combine entity with context_id", HTTP_BAD_REQUEST
             )
 
-        def json_events():
-            """Fetch events and generate JSON."""
-            return self.json(
-                _get_events(
-                    hass,
-                    start_day,
-                    end_day,
-                    entity_ids,
-                    self.filters,
-                    self.entities_filter,
-                    entity_matches_only,
-                    context_id,
-                )
+        response = web.StreamResponse(headers={CONTENT_TYPE: CONTENT_TYPE_JSON})
+        response.enable_compression()
+
+        def stream_events():
+            """Fetch events and write them to the response as JSON.
+
+            The response is only prepared once the first batch is serialized,
+            so errors up to then still return an error status.
+            """
+
+            def run(coro):
+                """Run a coroutine on the event loop and wait for it."""
+                return asyncio.run_coroutine_threadsafe(coro, hass.loop).result()
+
+            events = _iter_events(
+                hass,
+                start_day,
+                end_day,
+                entity_ids,
+                self.filters,
+                self.entities_filter,
+                entity_matches_only,
+                context_id,
+            )
+            first_batch = json_bytes(list(islice(events, STREAM_BATCH_SIZE)))
+            run(response.prepare(request))
+            run(response.write(first_batch[:-1]))
+            if first_batch != b"[]":
+                while batch := list(islice(events, STREAM_BATCH_SIZE)):
+                    run(response.write(b"," + json_bytes(batch)[1:-1]))
+            run(response.write(b"]"))
+
+        try:
+            await hass.async_add_executor_job(stream_events)
+        except ConnectionResetError:
+            _LOGGER.debug("Logbook client disconnected")
+            return response
+        except Exception:  # pylint: disable=broad-except
+            if not response.prepared:
+                raise
+            _LOGGER.exception("Error streaming the logbook")
+            # The status is already sent, close the connection without ending
+            # the response so the client sees it is incomplete
+            if request.transport is not None:
+                request.transport.close()
+            return response
+        await response.write_eof()
+        return response
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "logbook/event_stream",
+        vol.Required("start_time"): str,
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+@websocket_api.async_response
+async def ws_event_stream(hass, connection, msg):
+    """Send the logbook entries since start_time and then new ones as they happen.
+
+    The recorded entries are fetched from the database once, the new entries
+    are described from the events on the bus.
+    """
+    start_time = dt_util.parse_datetime(msg["start_time"])
+    if start_time is None:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+    start_time = dt_util.as_utc(start_time)
+
+    msg_id = msg["id"]
+    entity_ids = msg.get("entity_ids")
+    filters, entities_filter = hass.data[DATA_FILTERS]
+    if entity_ids is not None:
+        entities_filter = generate_filter([], entity_ids, [], [])
+    external_events = hass.data[DOMAIN]
+    entity_attr_cache = EntityAttributeCache(hass)
+    context_lookup = LRU(LIVE_CONTEXT_LOOKUP_SIZE)
+    # Live events are held back until the recorded entries are sent
+    pending = []
+
+    @callback
+    def _async_send_entries(events):
+        """Describe events and send the entries."""
+        entries = list(humanify(hass, events, entity_attr_cache, context_lookup))
+        if entries:
+            connection.send_message(
+                websocket_api.event_message(msg_id, {"events": entries})
+            )
+
+    @callback
+    def _async_event_filter(event):
+        """Filter the events that can be or cause an entry."""
+        return (
+            event.event_type in ALL_EVENT_TYPES
+            or event.event_type == EVENT_CALL_SERVICE
+            or event.event_type in external_events
+        )
+
+    @callback
+    def _async_on_event(event):
+        """Describe a new event."""
+        live_event = LiveEventPartialState(event)
+        if live_event.context_id not in context_lookup:
+            context_lookup[live_event.context_id] = live_event
+        if not _keep_live_event(hass, live_event, event, entity_ids, entities_filter):
+            return
+        if pending is not None:
+            pending.append(live_event)
+            return
+        _async_send_entries([live_event])
+
+    subscribed_at = dt_util.utcnow()
+    connection.subscriptions[msg_id] = hass.bus.async_listen(
+        MATCH_ALL, _async_on_event, event_filter=_async_event_filter
+    )
+    connection.send_result(msg_id)
+
+    # Events fired before subscribing are only in the database once the
+    # recorder has committed them
+    try:
+        await asyncio.wait_for(
+            hass.data[DATA_INSTANCE].async_commit(), RECORDER_COMMIT_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        _LOGGER.warning(
+            "Recorder did not commit in time, recent logbook entries may be missing"
+        )
+    entries = await hass.async_add_executor_job(
+        _get_events,
+        hass,
+        start_time,
+        subscribed_at,
+        entity_ids,
+        filters,
+        entities_filter,
+    )
+    for offset in range(0, len(entries), STREAM_BATCH_SIZE):
+        connection.send_message(
+            websocket_api.event_message(
+                msg_id, {"events": entries[offset : offset + STREAM_BATCH_SIZE]}
             )
+        )
+
+    if pending:
+        _async_send_entries(pending)
+    pending = None
+
 
-        return await hass.async_add_executor_job(json_events)
+def _keep_live_event(hass, live_event, event, entity_ids, entities_filter):
+    """Return if a live event is described in the logbook.
+
+    Mirrors the filters of the logbook database queries.
+    """
+    if event.event_type == EVENT_CALL_SERVICE:
+        return False
+
+    if event.event_type != EVENT_STATE_CHANGED:
+        return _keep_event(hass, live_event, entities_filter)
+
+    old_state = event.data.get("old_state")
+    new_state = event.data.get("new_state")
+    if old_state is None or new_state is None or old_state.state == new_state.state:
+        return False
+    if (
+        new_state.domain in CONTINUOUS_DOMAINS
+        and ATTR_UNIT_OF_MEASUREMENT in new_state.attributes
+    ):
+        return False
+    if entity_ids is not None:
+        return new_state.entity_id in entity_ids
+    return entities_filter is None or entities_filter(new_state.entity_id)
 
 
 def humanify(hass, events, entity_attr_cache, context_lookup):
@@ -411,7 +600,12 @@ def humanify(hass, events, entity_attr_cache, context_lookup):
                 yield data
 
 
-def _get_events(
+def _get_events(*args, **kwargs):
+    """Get events for a period of time."""
+    return list(_iter_events(*args, **kwargs))
+
+
+def _iter_events(
     hass,
     start_day,
     end_day,
@@ -421,7 +615,11 @@ def _get_events(
     entity_matches_only=False,
     context_id=None,
 ):
-    """Get events for a period of time."""
+    """Generate the events for a period of time.
+
+    The events are fetched from the database while the generator is consumed,
+    the generator must be consumed in a single thread.
+    """
     assert not (
         entity_ids and context_id
     ), "can't pass in both entity_ids and context_id"
@@ -482,8 +680,8 @@ def _get_events(
 
         query = query.order_by(Events.time_fired)
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+        yield from humanify(
+            hass, yield_events(query), entity_attr_cache, context_lookup
         )
 
 
@@ -493,7 +691,7 @@ def _generate_events_query(session):
         States.state,
         States.entity_id,
         States.domain,
-        States.attributes,
+        STATE_ATTRIBUTES_JSON.label("attributes"),
     )
 
 
@@ -511,6 +709,9 @@ def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
     return (
         _generate_events_query(session)
         .outerjoin(Events, (States.event_id == Events.event_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
         .filter(_missing_state_matcher(old_state))
         .filter(_continuous_entity_matcher())
@@ -525,6 +726,9 @@ def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
 def _apply_events_types_and_states_filter(hass, query, old_state):
     events_query = (
         query.outerjoin(States, (Events.event_id == States.event_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
         .filter(
             (Events.event_type != EVENT_STATE_CHANGED)
@@ -555,7 +759,7 @@ def _continuous_entity_matcher():
     #
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
-        sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(STATE_ATTRIBUTES_JSON.contains(UNIT_OF_MEASUREMENT_JSON)),
     )
 
 
@@ -770,6 +974,62 @@ class LazyEventPartialState:
         return self._time_fired_isoformat
 
 
+class LiveEventPartialState:
+    """A LazyEventPartialState for an event fired on the bus."""
+
+    __slots__ = [
+        "time_fired_isoformat",
+        "attributes",
+        "data",
+        "event_type",
+        "entity_id",
+        "state",
+        "domain",
+        "context_id",
+        "context_user_id",
+        "context_parent_id",
+        "time_fired_minute",
+    ]
+
+    def __init__(self, event):
+        """Init the live event."""
+        self.time_fired_isoformat = process_timestamp_to_utc_isoformat(event.time_fired)
+        self.event_type = event.event_type
+        self.context_id = event.context.id
+        self.context_user_id = event.context.user_id
+        self.context_parent_id = event.context.parent_id
+        self.time_fired_minute = event.time_fired.minute
+        new_state = None
+        if event.event_type == EVENT_STATE_CHANGED:
+            new_state = event.data.get("new_state")
+        if new_state is None:
+            # Like in the database, the data of state changes is not kept
+            self.data = {} if event.event_type == EVENT_STATE_CHANGED else event.data
+            self.attributes = {}
+            self.entity_id = self.state = self.domain = None
+        else:
+            self.data = {}
+            self.attributes = new_state.attributes
+            self.entity_id = new_state.entity_id
+            self.state = new_state.state
+            self.domain = new_state.domain
+
+    @property
+    def attributes_icon(self):
+        """Return the icon of the state."""
+        return self.attributes.get(ATTR_ICON)
+
+    @property
+    def data_entity_id(self):
+        """Return the entity id of the event data."""
+        return self.data.get(ATTR_ENTITY_ID)
+
+    @property
+    def data_domain(self):
+        """Return the domain of the event data."""
+        return self.data.get(ATTR_DOMAIN)
+
+
 class EntityAttributeCache:
     """A cache to lookup static entity_id attribute.
 
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from functools import lru_cache, partial, wraps
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
@@ -74,6 +74,7 @@ from .const import (
 )
 from .discovery import LAST_DISCOVERY
 from .models import Message, MessageCallbackType, PublishPayloadType
+from .trie import TopicTrie
 from .util import _VALID_QOS_SCHEMA, valid_publish_topic, valid_subscribe_topic
 
 _LOGGER = logging.getLogger(__name__)
@@ -536,7 +537,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str = attr.ib(default="utf-8")
@@ -560,6 +560,7 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: list[Subscription] = []
+        self._subscription_trie: TopicTrie[Subscription] = TopicTrie()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -735,11 +736,9 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._subscription_trie.add(topic, subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -752,9 +751,9 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
+            self._subscription_trie.remove(topic, subscription)
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if self._subscription_trie.has_topic_filter(topic):
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
@@ -845,14 +844,6 @@ class MQTT:
         """Message received callback."""
         self.hass.add_job(self._mqtt_handle_message, msg)
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
-
     @callback
     def _mqtt_handle_message(self, msg) -> None:
         _LOGGER.debug(
@@ -863,7 +854,7 @@ class MQTT:
         )
         timestamp = dt_util.utcnow()
 
-        subscriptions = self._matching_subscriptions(msg.topic)
+        subscriptions = self._subscription_trie.match(msg.topic)
 
         for subscription in subscriptions:
 
@@ -963,16 +954,6 @@ def _raise_on_error(result_code: int) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
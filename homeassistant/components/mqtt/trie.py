@@ -0,0 +1,131 @@
+"""Topic trie to match MQTT topics against subscribed topic filters."""
+from __future__ import annotations
+
+from itertools import chain, count
+from operator import itemgetter
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+MULTI_LEVEL_WILDCARD = "#"
+SINGLE_LEVEL_WILDCARD = "+"
+
+
+class _Node(Generic[_T]):
+    """Node of the topic trie, one for each level of a topic filter."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _Node[_T]] = {}
+        # (insertion order, value) of the filters ending at this node
+        self.values: list[tuple[int, _T]] = []
+
+
+class TopicTrie(Generic[_T]):
+    """Store values by MQTT topic filter and find the ones matching a topic.
+
+    Matching walks one level of the trie per topic level, following the
+    literal level as well as the single-level and multi-level wildcards, so
+    the cost grows with the depth of the topic and not with the number of
+    topic filters. Matches are returned in the order they were added.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the topic trie."""
+        self._root: _Node[_T] = _Node()
+        self._counter = count()
+        self._len = 0
+
+    def __len__(self) -> int:
+        """Return the number of values in the trie."""
+        return self._len
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _Node()
+            node = child
+        node.values.append((next(self._counter), value))
+        self._len += 1
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value for a topic filter.
+
+        Raises KeyError if the value was not added for the topic filter.
+        """
+        levels = topic_filter.split("/")
+        path = [self._root]
+        for level in levels:
+            child = path[-1].children.get(level)
+            if child is None:
+                raise KeyError(topic_filter)
+            path.append(child)
+
+        node = path[-1]
+        for index, (_, node_value) in enumerate(node.values):
+            if node_value is value:
+                del node.values[index]
+                break
+        else:
+            raise KeyError(topic_filter)
+        self._len -= 1
+
+        # Prune the nodes that no longer lead to a value
+        for depth in range(len(levels), 0, -1):
+            node = path[depth]
+            if node.values or node.children:
+                break
+            del path[depth - 1].children[levels[depth - 1]]
+
+    def has_topic_filter(self, topic_filter: str) -> bool:
+        """Return if any value is stored for the topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            child = node.children.get(level)
+            if child is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of all topic filters matching a topic."""
+        levels = topic.split("/")
+        # Topics starting with $ are not matched by a wildcard on the first level
+        wildcards = not topic.startswith("$")
+        matches: list[list[tuple[int, _T]]] = []
+        nodes = [self._root]
+
+        for level in levels:
+            next_nodes = []
+            for node in nodes:
+                children = node.children
+                if wildcards:
+                    if (child := children.get(MULTI_LEVEL_WILDCARD)) is not None:
+                        matches.append(child.values)
+                    if (child := children.get(SINGLE_LEVEL_WILDCARD)) is not None:
+                        next_nodes.append(child)
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+            if not next_nodes:
+                break
+            nodes = next_nodes
+            wildcards = True
+        else:
+            for node in nodes:
+                matches.append(node.values)
+                # A multi-level wildcard also matches the parent level
+                child = node.children.get(MULTI_LEVEL_WILDCARD)
+                if child is not None:
+                    matches.append(child.values)
+
+        matches = [values for values in matches if values]
+        if not matches:
+            return []
+        if len(matches) == 1:
+            return [value for _, value in matches[0]]
+        return [value for _, value in sorted(chain(*matches), key=itemgetter(0))]
@@ -17,11 +17,13 @@ import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
 
 from .const import DOMAIN
+from .sampler import StackSampler
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -30,7 +32,9 @@ SERVICE_STOP_LOG_OBJECTS = "stop_log_objects"
 SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
-
+SERVICE_START_SAMPLER = "start_sampler"
+SERVICE_STOP_SAMPLER = "stop_sampler"
+SERVICE_DUMP_SAMPLES = "dump_samples"
 
 SERVICES = (
     SERVICE_START,
@@ -40,13 +44,24 @@ SERVICES = (
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_START_SAMPLER,
+    SERVICE_STOP_SAMPLER,
+    SERVICE_DUMP_SAMPLES,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 CONF_SECONDS = "seconds"
+CONF_INTERVAL = "interval"
+CONF_WINDOW = "window"
+CONF_BLOCK_THRESHOLD = "block_threshold"
+
+DEFAULT_SAMPLE_INTERVAL = 0.05
+DEFAULT_SAMPLE_WINDOW = 60.0
+DEFAULT_BLOCK_THRESHOLD = 1.0
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
+SAMPLER = "sampler"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -128,6 +143,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             arepr.max_string = original_maxstring
             arepr.max_other = original_maxother
 
+    async def _async_start_sampler(call: ServiceCall) -> None:
+        """Start sampling the stacks of the threads."""
+        if SAMPLER in domain_data:
+            domain_data.pop(SAMPLER).async_stop()
+        sampler = domain_data[SAMPLER] = StackSampler(
+            hass,
+            call.data[CONF_INTERVAL],
+            call.data[CONF_WINDOW],
+            call.data[CONF_BLOCK_THRESHOLD],
+        )
+        sampler.async_start()
+
+    async def _async_stop_sampler(call: ServiceCall) -> None:
+        """Stop sampling the stacks of the threads."""
+        if SAMPLER in domain_data:
+            domain_data.pop(SAMPLER).async_stop()
+
+    async def _async_dump_samples(call: ServiceCall) -> None:
+        """Write the stack samples in the folded format."""
+        if SAMPLER not in domain_data:
+            raise HomeAssistantError("The sampler is not running")
+        start_time = int(time.time() * 1000000)
+        path = hass.config.path(f"samples.{start_time}.folded")
+        await hass.async_add_executor_job(domain_data[SAMPLER].write, path)
+        hass.components.persistent_notification.async_create(
+            f"Wrote stack samples to {path}",
+            title="Samples Complete",
+            notification_id=f"profiler_samples_{start_time}",
+        )
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -191,6 +236,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_SAMPLER,
+        _async_start_sampler,
+        schema=vol.Schema(
+            {
+                vol.Optional(CONF_INTERVAL, default=DEFAULT_SAMPLE_INTERVAL): vol.All(
+                    vol.Coerce(float), vol.Range(min=0.001)
+                ),
+                vol.Optional(CONF_WINDOW, default=DEFAULT_SAMPLE_WINDOW): vol.All(
+                    vol.Coerce(float), vol.Range(min=1)
+                ),
+                vol.Optional(
+                    CONF_BLOCK_THRESHOLD, default=DEFAULT_BLOCK_THRESHOLD
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+            }
+        ),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_SAMPLER,
+        _async_stop_sampler,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_DUMP_SAMPLES,
+        _async_dump_samples,
+    )
+
     return True
 
 
@@ -200,6 +279,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    if SAMPLER in hass.data[DOMAIN]:
+        hass.data[DOMAIN][SAMPLER].async_stop()
     hass.data.pop(DOMAIN)
     return True
 
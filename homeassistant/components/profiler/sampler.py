@@ -0,0 +1,165 @@
+"""Continuous stack sampler for the profiler integration."""
+from __future__ import annotations
+
+from collections import Counter, deque
+import logging
+import sys
+import threading
+import time
+from types import CodeType, FrameType
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+# Threads sampled besides the event loop
+SAMPLED_THREAD_PREFIXES = ("Recorder", "SyncWorker")
+
+THREAD_NAMES_REFRESH_INTERVAL = 1.0
+MAX_INTERNED_STACKS = 10000
+
+
+class StackSampler:
+    """Sample the stacks of the event loop, recorder and executor threads.
+
+    The samples of the last window seconds are kept and can be written in
+    the folded format read by flamegraph.pl and speedscope. When the event
+    loop is blocked for longer than block_threshold seconds the samples are
+    written automatically, once for each time the loop is blocked.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        interval: float,
+        window: float,
+        block_threshold: float,
+    ) -> None:
+        """Initialize the sampler."""
+        self.hass = hass
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self._samples: deque[tuple[tuple[str, str], ...]] = deque(
+            maxlen=max(1, round(window / interval))
+        )
+        self._labels: dict[CodeType, str] = {}
+        # Identical stacks share one string to keep the window small
+        self._stacks: dict[str, str] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._loop_thread_id: int | None = None
+        self._heartbeat_interval = block_threshold / 4
+        self._heartbeat = time.monotonic()
+        self._heartbeat_handle: object | None = None
+        self._blocked = False
+
+    @callback
+    def async_start(self) -> None:
+        """Start sampling."""
+        self._loop_thread_id = threading.get_ident()
+        self._async_heartbeat()
+        self._thread = threading.Thread(
+            target=self._run, name="ProfilerSampler", daemon=True
+        )
+        self._thread.start()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        if self._heartbeat_handle is not None:
+            self._heartbeat_handle.cancel()  # type: ignore[attr-defined]
+            self._heartbeat_handle = None
+
+    @callback
+    def _async_heartbeat(self) -> None:
+        """Record that the event loop is running."""
+        self._heartbeat = time.monotonic()
+        self._heartbeat_handle = self.hass.loop.call_later(
+            self._heartbeat_interval, self._async_heartbeat
+        )
+
+    def _run(self) -> None:
+        """Take samples until stopped."""
+        thread_names: dict[int, str] = {}
+        names_refreshed = 0.0
+        while not self._stop.wait(self.interval):
+            now = time.monotonic()
+            if now - names_refreshed > THREAD_NAMES_REFRESH_INTERVAL:
+                thread_names = {
+                    thread.ident: thread.name
+                    for thread in threading.enumerate()
+                    if thread.ident is not None
+                }
+                names_refreshed = now
+            self.sample(thread_names)
+            self._check_blocked(now)
+
+    def sample(self, thread_names: dict[int, str]) -> None:
+        """Take one sample of the stacks of the sampled threads."""
+        stacks = []
+        # pylint: disable=protected-access
+        for ident, frame in sys._current_frames().items():
+            name = thread_names.get(ident)
+            if ident != self._loop_thread_id and (
+                name is None or not name.startswith(SAMPLED_THREAD_PREFIXES)
+            ):
+                continue
+            stacks.append((name or "MainThread", self._folded_stack(frame)))
+        self._samples.append(tuple(stacks))
+
+    def _folded_stack(self, frame: FrameType | None) -> str:
+        """Return the stack of a frame with the outermost call first."""
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = self._labels[
+                    code
+                ] = f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+            labels.append(label)
+            frame = frame.f_back
+        labels.reverse()
+        stack = ";".join(labels)
+
+        interned = self._stacks.get(stack)
+        if interned is not None:
+            return interned
+        if len(self._stacks) >= MAX_INTERNED_STACKS:
+            # Only keep the stacks still in the window
+            self._stacks = {
+                stack: stack for stacks in self._samples for _, stack in stacks
+            }
+        self._stacks[stack] = stack
+        return stack
+
+    def _check_blocked(self, now: float) -> None:
+        """Write the samples when the event loop is blocked."""
+        blocked_for = now - self._heartbeat - self._heartbeat_interval
+        if blocked_for < self.block_threshold:
+            self._blocked = False
+            return
+        if self._blocked:
+            return
+        self._blocked = True
+        path = self.hass.config.path(f"samples.{int(time.time() * 1000000)}.folded")
+        self.write(path)
+        _LOGGER.warning(
+            "The event loop has been blocked for %.1f seconds, wrote stack samples to %s",
+            blocked_for,
+            path,
+        )
+
+    def folded(self) -> str:
+        """Return the samples in the folded stack format."""
+        counts: Counter[str] = Counter()
+        for stacks in list(self._samples):
+            for name, stack in stacks:
+                counts[f"{name};{stack}"] += 1
+        return "".join(f"{stack} {count}\n" for stack, count in counts.items())
+
+    def write(self, path: str) -> None:
+        """Write the samples to a file."""
+        with open(path, "w", encoding="utf8") as file:
+            file.write(self.folded())
@@ -47,14 +47,17 @@ from homeassistant.helpers.service import async_extract_entity_ids
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
+from homeassistant.util.lru import LRU
 
 from . import history, migration, purge, statistics
+from .bulk import BulkWriter
 from .const import CONF_DB_INTEGRITY_CHECK, DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
-from .models import Base, Events, RecorderRuns, States
+from .models import Base, Events, RecorderRuns, StateAttributes, States
 from .pool import RecorderPool
 from .util import (
     dburl_to_path,
     end_incomplete_runs,
+    find_shared_attributes_ids,
     move_away_broken_database,
     perodic_db_cleanups,
     session_scope,
@@ -103,20 +106,27 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 1
+DEFAULT_SHORT_TERM_STATISTICS_KEEP_DAYS = 10
 KEEPALIVE_TIME = 30
 
 # Controls how often we clean up
 # States and Events objects
 EXPIRE_AFTER_COMMITS = 120
 
+# The number of shared attributes ids we keep in memory
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
+
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
+CONF_SHORT_TERM_STATISTICS_KEEP_DAYS = "short_term_statistics_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_INSERT = "bulk_insert"
+CONF_SHARED_ATTRIBUTES = "shared_attributes"
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -140,6 +150,10 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(CONF_PURGE_KEEP_DAYS, default=10): vol.All(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
+                    vol.Optional(
+                        CONF_SHORT_TERM_STATISTICS_KEEP_DAYS,
+                        default=DEFAULT_SHORT_TERM_STATISTICS_KEEP_DAYS,
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
                     vol.Optional(CONF_DB_URL): cv.string,
                     vol.Optional(
@@ -154,6 +168,8 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_BULK_INSERT, default=False): cv.boolean,
+                    vol.Optional(CONF_SHARED_ATTRIBUTES, default=False): cv.boolean,
                 }
             ),
         )
@@ -233,12 +249,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         hass=hass,
         auto_purge=auto_purge,
         keep_days=keep_days,
+        short_term_statistics_keep_days=conf[CONF_SHORT_TERM_STATISTICS_KEEP_DAYS],
         commit_interval=commit_interval,
         uri=db_url,
         db_max_retries=db_max_retries,
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_t=exclude_t,
+        bulk_insert=conf[CONF_BULK_INSERT],
+        shared_attributes=conf[CONF_SHARED_ATTRIBUTES],
     )
     instance.async_initialize()
     instance.start()
@@ -325,12 +344,19 @@ class StatisticsTask(NamedTuple):
     """An object to insert into the recorder queue to run a statistics task."""
 
     start: datetime.datetime
+    period: str = statistics.PERIOD_HOUR
 
 
 class WaitTask:
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
 
 
+class CommitTask(NamedTuple):
+    """An object to insert into the recorder queue to commit the events before it."""
+
+    done: concurrent.futures.Future
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -345,6 +371,9 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_t: list[str],
+        bulk_insert: bool = False,
+        shared_attributes: bool = False,
+        short_term_statistics_keep_days: int = DEFAULT_SHORT_TERM_STATISTICS_KEEP_DAYS,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -352,6 +381,7 @@ class Recorder(threading.Thread):
         self.hass = hass
         self.auto_purge = auto_purge
         self.keep_days = keep_days
+        self.short_term_statistics_keep_days = short_term_statistics_keep_days
         self.commit_interval = commit_interval
         self.queue: Any = queue.SimpleQueue()
         self.recording_start = dt_util.utcnow()
@@ -372,6 +402,14 @@ class Recorder(threading.Thread):
         self._keepalive_count = 0
         self._old_states = {}
         self._pending_expunge = []
+        self.shared_attributes = shared_attributes
+        self.state_attributes_ids = LRU(STATE_ATTRIBUTES_ID_CACHE_SIZE)
+        self._pending_state_attributes = {}
+        self.bulk_writer = None
+        if bulk_insert:
+            self.bulk_writer = BulkWriter(
+                self.state_attributes_ids if shared_attributes else None
+            )
         self.event_session = None
         self.get_session = None
         self._completed_first_database_setup = None
@@ -461,6 +499,11 @@ class Recorder(threading.Thread):
     def do_adhoc_statistics(self, **kwargs):
         """Trigger an adhoc statistics run."""
         start = kwargs.get("start")
+        if kwargs.get("period") == statistics.PERIOD_5MINUTE:
+            if not start:
+                start = statistics.get_start_time_short_term()
+            self.queue.put(StatisticsTask(start, statistics.PERIOD_5MINUTE))
+            return
         if not start:
             start = statistics.get_start_time()
         self.queue.put(StatisticsTask(start))
@@ -548,6 +591,12 @@ class Recorder(threading.Thread):
         start = statistics.get_start_time()
         self.queue.put(StatisticsTask(start))
 
+    @callback
+    def async_five_minute_statistics(self, now):
+        """Trigger the 5 minute statistics run."""
+        start = statistics.get_start_time_short_term()
+        self.queue.put(StatisticsTask(start, statistics.PERIOD_5MINUTE))
+
     def _async_setup_periodic_tasks(self):
         """Prepare periodic tasks."""
         # Run nightly tasks at 4:12am
@@ -558,6 +607,10 @@ class Recorder(threading.Thread):
         async_track_time_change(
             self.hass, self.async_hourly_statistics, minute=12, second=0
         )
+        # Compile short term statistics every 5 minutes
+        async_track_time_change(
+            self.hass, self.async_five_minute_statistics, minute="/5", second=10
+        )
 
     def run(self):
         """Start processing events to save."""
@@ -714,12 +767,16 @@ class Recorder(threading.Thread):
         # Schedule a new purge task if this one didn't finish
         self.queue.put(PurgeEntitiesTask(entity_filter))
 
-    def _run_statistics(self, start):
+    def _run_statistics(self, start, period):
         """Run statistics task."""
-        if statistics.compile_statistics(self, start):
+        if period == statistics.PERIOD_5MINUTE:
+            compile_statistics = statistics.compile_short_term_statistics
+        else:
+            compile_statistics = statistics.compile_statistics
+        if compile_statistics(self, start):
             return
         # Schedule a new statistics task if this one didn't finish
-        self.queue.put(StatisticsTask(start))
+        self.queue.put(StatisticsTask(start, period))
 
     def _process_one_event(self, event):
         """Process one event."""
@@ -733,11 +790,18 @@ class Recorder(threading.Thread):
             perodic_db_cleanups(self)
             return
         if isinstance(event, StatisticsTask):
-            self._run_statistics(event.start)
+            self._run_statistics(event.start, event.period)
             return
         if isinstance(event, WaitTask):
             self._queue_watch.set()
             return
+        if isinstance(event, CommitTask):
+            if event.done.set_running_or_notify_cancel():
+                try:
+                    self._commit_event_session_or_retry()
+                finally:
+                    event.done.set_result(None)
+            return
         if event.event_type == EVENT_TIME_CHANGED:
             self._keepalive_count += 1
             if self._keepalive_count >= KEEPALIVE_TIME:
@@ -753,6 +817,21 @@ class Recorder(threading.Thread):
         if not self.enabled:
             return
 
+        if self.bulk_writer:
+            self.bulk_writer.add_event(event)
+            if not self.commit_interval:
+                self._commit_event_session_or_retry()
+            return
+
+        self._add_event_to_session(event)
+
+        # If they do not have a commit interval
+        # than we commit right away
+        if not self.commit_interval:
+            self._commit_event_session_or_retry()
+
+    def _add_event_to_session(self, event):
+        """Add an event and its state to the event session."""
         try:
             if event.event_type == EVENT_STATE_CHANGED:
                 dbevent = Events.from_event(event, event_data="{}")
@@ -776,6 +855,8 @@ class Recorder(threading.Thread):
                         dbstate.old_state = old_state
                 if not has_new_state:
                     dbstate.state = None
+                if self.shared_attributes:
+                    self._share_state_attributes(dbstate)
                 dbstate.event = dbevent
                 dbstate.created = event.time_fired
                 self.event_session.add(dbstate)
@@ -788,10 +869,26 @@ class Recorder(threading.Thread):
                     event.data.get("new_state"),
                 )
 
-        # If they do not have a commit interval
-        # than we commit right away
-        if not self.commit_interval:
-            self._commit_event_session_or_retry()
+    def _share_state_attributes(self, dbstate):
+        """Store the attributes of a state in the shared attributes table."""
+        shared_attrs = dbstate.attributes
+        dbstate.attributes = None
+        if attributes_id := self.state_attributes_ids.get(shared_attrs):
+            dbstate.attributes_id = attributes_id
+            return
+        if pending_attributes := self._pending_state_attributes.get(shared_attrs):
+            dbstate.state_attributes = pending_attributes
+            return
+        with self.event_session.no_autoflush:
+            found = find_shared_attributes_ids(self.event_session, [shared_attrs])
+        if attributes_id := found.get(shared_attrs):
+            self.state_attributes_ids[shared_attrs] = attributes_id
+            dbstate.attributes_id = attributes_id
+            return
+        dbattributes = StateAttributes.from_shared_attrs(shared_attrs)
+        dbstate.state_attributes = dbattributes
+        self.event_session.add(dbattributes)
+        self._pending_state_attributes[shared_attrs] = dbattributes
 
     def _handle_database_error(self, err):
         """Handle a database error that may result in moving away the corrupt db."""
@@ -805,7 +902,11 @@ class Recorder(threading.Thread):
 
     def _commit_event_session_or_retry(self):
         """Commit the event session if there is work to do."""
-        if not self.event_session.new and not self.event_session.dirty:
+        if (
+            not self.event_session.new
+            and not self.event_session.dirty
+            and not (self.bulk_writer and self.bulk_writer.has_pending_rows)
+        ):
             return
         tries = 1
         while tries <= self.db_max_retries:
@@ -826,6 +927,12 @@ class Recorder(threading.Thread):
                 time.sleep(self.db_retry_wait)
 
     def _commit_event_session(self):
+        if self.bulk_writer:
+            # Rows are written with plain inserts so
+            # there is nothing to expunge or expire
+            self.bulk_writer.write(self.event_session)
+            return
+
         self._commits_without_expire += 1
 
         if self._pending_expunge:
@@ -838,6 +945,12 @@ class Recorder(threading.Thread):
             self._pending_expunge = []
         self.event_session.commit()
 
+        # The shared attributes now have their
+        # attributes_id so they can be referenced by id
+        for shared_attrs, dbattributes in self._pending_state_attributes.items():
+            self.state_attributes_ids[shared_attrs] = dbattributes.attributes_id
+        self._pending_state_attributes = {}
+
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
         # do it after EXPIRE_AFTER_COMMITS commits
@@ -856,6 +969,10 @@ class Recorder(threading.Thread):
     def _close_event_session(self):
         """Close the event session."""
         self._old_states = {}
+        self._pending_state_attributes = {}
+        self.state_attributes_ids.clear()
+        if self.bulk_writer:
+            self.bulk_writer.reset()
 
         if not self.event_session:
             return
@@ -888,6 +1005,14 @@ class Recorder(threading.Thread):
         """Listen for new events and put them in the process queue."""
         self.queue.put(event)
 
+    async def async_commit(self) -> None:
+        """Wait until the events fired so far are committed to the database."""
+        # Let the event listener queue the events fired before this call
+        await asyncio.sleep(0)
+        done: concurrent.futures.Future = concurrent.futures.Future()
+        self.queue.put(CommitTask(done))
+        await asyncio.wrap_future(done)
+
     def block_till_done(self):
         """Block till all events processed.
 
@@ -0,0 +1,349 @@
+"""Bulk insert write path for the recorder."""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from sqlalchemy import Table, bindparam, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.session import Session
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, split_entity_id
+from homeassistant.helpers.json import json_dumps_stable
+from homeassistant.util.lru import LRU
+
+from .const import MAX_ROWS_TO_INSERT, SQLITE_MAX_BIND_VARS
+from .models import Events, StateAttributes, States
+from .util import find_shared_attributes_ids
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_COLUMNS = (
+    "event_type",
+    "event_data",
+    "origin",
+    "time_fired",
+    "created",
+    "context_id",
+    "context_user_id",
+    "context_parent_id",
+)
+STATE_COLUMNS = (
+    "domain",
+    "entity_id",
+    "state",
+    "attributes",
+    "event_id",
+    "last_changed",
+    "last_updated",
+    "created",
+    "old_state_id",
+    "attributes_id",
+)
+STATE_ATTRIBUTES_INDEX = STATE_COLUMNS.index("attributes")
+STATE_EVENT_ID_INDEX = STATE_COLUMNS.index("event_id")
+STATE_ATTRIBUTES_COLUMNS = ("hash", "shared_attrs")
+
+MYSQL_CONSECUTIVE_IDS = "recorder_mysql_consecutive_ids"
+
+
+class BulkWriter:
+    """Collect events and states as plain rows and write them in bulk.
+
+    Rows are kept as tuples until the commit interval is reached and are
+    then written with multi-row inserts. The state_id of the last written
+    state of each entity is tracked here to fill in old_state_id instead of
+    going through the ORM relationship.
+
+    When state_attributes_ids is passed, attributes are stored in the
+    shared attributes table and the cache is used to find their ids.
+    """
+
+    def __init__(self, state_attributes_ids: LRU | None = None) -> None:
+        """Initialize the bulk writer."""
+        self._state_attributes_ids = state_attributes_ids
+        self._events: list[tuple] = []
+        self._states: list[tuple] = []
+        # (state row, old state row) pairs for entities that
+        # changed more than once in the pending batch
+        self._state_links: list[tuple[int, int]] = []
+        self._pending_state_rows: dict[str, int] = {}
+        # Attributes ids of the batch being written
+        self._pending_attributes_ids: dict[str, int] = {}
+        self._old_state_ids: dict[str, int] = {}
+        self._last_write = time.monotonic()
+        self.events_per_second = 0.0
+        self.rows_per_commit = 0
+
+    @property
+    def has_pending_rows(self) -> bool:
+        """Return if there are rows waiting to be written."""
+        return bool(self._events)
+
+    def reset(self) -> None:
+        """Drop pending rows and forget the old state ids."""
+        self._clear_pending()
+        self._old_state_ids = {}
+
+    def add_event(self, event: Event) -> None:
+        """Add an event and its state to the pending rows."""
+        is_state_changed = event.event_type == EVENT_STATE_CHANGED
+        try:
+            event_data = "{}" if is_state_changed else json_dumps_stable(event.data)
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+            return
+
+        context = event.context
+        event_row = len(self._events)
+        self._events.append(
+            (
+                event.event_type,
+                event_data,
+                str(event.origin.value),
+                event.time_fired,
+                event.time_fired,
+                context.id,
+                context.user_id,
+                context.parent_id,
+            )
+        )
+
+        if is_state_changed:
+            self._add_state(event, event_row)
+
+    def _add_state(self, event: Event, event_row: int) -> None:
+        """Add the state of a state_changed event to the pending rows."""
+        entity_id = event.data["entity_id"]
+        new_state = event.data.get("new_state")
+
+        if new_state is None:
+            domain = split_entity_id(entity_id)[0]
+            state = None
+            attributes = "{}"
+            last_changed = last_updated = event.time_fired
+        else:
+            try:
+                attributes = json_dumps_stable(dict(new_state.attributes))
+            except (TypeError, ValueError):
+                _LOGGER.warning("State is not JSON serializable: %s", new_state)
+                return
+            domain = new_state.domain
+            state = new_state.state
+            last_changed = new_state.last_changed
+            last_updated = new_state.last_updated
+
+        state_row = len(self._states)
+        old_state_id = None
+        old_state_row = self._pending_state_rows.pop(entity_id, None)
+        if old_state_row is not None:
+            self._state_links.append((state_row, old_state_row))
+        else:
+            old_state_id = self._old_state_ids.pop(entity_id, None)
+
+        self._states.append(
+            (
+                domain,
+                entity_id,
+                state,
+                attributes,
+                event_row,
+                last_changed,
+                last_updated,
+                event.time_fired,
+                old_state_id,
+                None,
+            )
+        )
+        if new_state is not None:
+            self._pending_state_rows[entity_id] = state_row
+
+    def write(self, session: Session) -> None:
+        """Write the pending rows and commit the session."""
+        try:
+            state_ids = self._insert_pending_rows(session.connection())
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+        now = time.monotonic()
+        elapsed = now - self._last_write
+        self._last_write = now
+        self.rows_per_commit = len(self._events) + len(self._states)
+        self.events_per_second = len(self._events) / elapsed if elapsed else 0.0
+        _LOGGER.debug(
+            "Wrote %s rows (%.1f events/s)",
+            self.rows_per_commit,
+            self.events_per_second,
+        )
+
+        for entity_id, state_row in self._pending_state_rows.items():
+            self._old_state_ids[entity_id] = state_ids[state_row]
+        if self._state_attributes_ids is not None:
+            for shared_attrs, attributes_id in self._pending_attributes_ids.items():
+                self._state_attributes_ids[shared_attrs] = attributes_id
+        self._clear_pending()
+
+    def _insert_pending_rows(self, connection: Connection) -> list[int]:
+        """Insert the pending rows and return the new state ids."""
+        event_ids = _insert_rows(
+            connection, Events.__table__, EVENT_COLUMNS, self._events
+        )
+        state_rows = [
+            (
+                *row[:STATE_EVENT_ID_INDEX],
+                event_ids[row[STATE_EVENT_ID_INDEX]],
+                *row[STATE_EVENT_ID_INDEX + 1 :],
+            )
+            for row in self._states
+        ]
+        if self._state_attributes_ids is not None:
+            state_rows = self._share_state_attributes(connection, state_rows)
+        state_ids = _insert_rows(
+            connection, States.__table__, STATE_COLUMNS, state_rows
+        )
+        if self._state_links:
+            table = States.__table__
+            connection.execute(
+                table.update()
+                .where(table.c.state_id == bindparam("b_state_id"))
+                .values(old_state_id=bindparam("b_old_state_id")),
+                [
+                    {
+                        "b_state_id": state_ids[state_row],
+                        "b_old_state_id": state_ids[old_state_row],
+                    }
+                    for state_row, old_state_row in self._state_links
+                ],
+            )
+        return state_ids
+
+    def _share_state_attributes(
+        self, connection: Connection, state_rows: list[tuple]
+    ) -> list[tuple]:
+        """Move the attributes of the state rows to the shared attributes table."""
+        cache = self._state_attributes_ids
+        assert cache is not None
+        attributes_ids: dict[str, int] = {}
+        missing: set[str] = set()
+        for row in state_rows:
+            shared_attrs = row[STATE_ATTRIBUTES_INDEX]
+            if shared_attrs in attributes_ids:
+                continue
+            if attributes_id := cache.get(shared_attrs):
+                attributes_ids[shared_attrs] = attributes_id
+            else:
+                missing.add(shared_attrs)
+
+        if missing:
+            found = find_shared_attributes_ids(connection, missing)
+            new_attrs = [attrs for attrs in missing if attrs not in found]
+            new_ids = _insert_rows(
+                connection,
+                StateAttributes.__table__,
+                STATE_ATTRIBUTES_COLUMNS,
+                [
+                    (StateAttributes.hash_shared_attrs(attrs), attrs)
+                    for attrs in new_attrs
+                ],
+            )
+            attributes_ids.update(found)
+            attributes_ids.update(zip(new_attrs, new_ids))
+        self._pending_attributes_ids = attributes_ids
+
+        return [
+            (
+                *row[:STATE_ATTRIBUTES_INDEX],
+                None,
+                *row[STATE_ATTRIBUTES_INDEX + 1 : -1],
+                attributes_ids[row[STATE_ATTRIBUTES_INDEX]],
+            )
+            for row in state_rows
+        ]
+
+    def _clear_pending(self) -> None:
+        """Clear the pending rows."""
+        self._events = []
+        self._states = []
+        self._state_links = []
+        self._pending_state_rows = {}
+        self._pending_attributes_ids = {}
+
+
+def _insert_rows(
+    connection: Connection, table: Table, columns: tuple[str, ...], rows: list[tuple]
+) -> list[int]:
+    """Insert rows with multi-row inserts and return their primary keys in order."""
+    if not rows:
+        return []
+
+    dialect_name = connection.dialect.name
+    primary_key = table.primary_key.columns.values()[0]
+    params: list[dict[str, Any]] = [dict(zip(columns, row)) for row in rows]
+
+    if dialect_name not in ("sqlite", "mysql", "postgresql") or (
+        dialect_name == "mysql" and not _mysql_ids_are_consecutive(connection)
+    ):
+        # No known way to get the primary keys of a multi-row insert
+        return [
+            connection.execute(table.insert(), row_params).inserted_primary_key[0]
+            for row_params in params
+        ]
+
+    if dialect_name == "sqlite":
+        chunk_size = min(MAX_ROWS_TO_INSERT, SQLITE_MAX_BIND_VARS // len(columns))
+    else:
+        chunk_size = MAX_ROWS_TO_INSERT
+
+    ids: list[int] = []
+    for offset in range(0, len(params), chunk_size):
+        chunk = params[offset : offset + chunk_size]
+        if dialect_name == "postgresql":
+            result = connection.execute(
+                table.insert().values(chunk).returning(primary_key)
+            )
+            ids.extend(row[0] for row in result)
+            continue
+
+        # sqlite holds the database write lock for the whole statement and
+        # MySQL reserves the ids of a multi-row insert up front in the
+        # checked lock modes, so the rows get consecutive ids. sqlite reports
+        # the id of the last row inserted while MySQL reports the first one.
+        result = connection.execute(table.insert().values(chunk))
+        first_id = result.lastrowid
+        if dialect_name == "sqlite":
+            first_id -= len(chunk) - 1
+        ids.extend(range(first_id, first_id + len(chunk)))
+
+    return ids
+
+
+def _mysql_ids_are_consecutive(connection: Connection) -> bool:
+    """Return if MySQL gives the rows of a multi-row insert consecutive ids.
+
+    The interleaved lock mode (innodb_autoinc_lock_mode=2) lets concurrent
+    inserts take ids in between and replication setups like Galera step the
+    ids by auto_increment_increment. The result is cached per connection.
+    """
+    consecutive: bool | None = connection.info.get(MYSQL_CONSECUTIVE_IDS)
+    if consecutive is None:
+        try:
+            lock_mode, increment = connection.execute(
+                text("SELECT @@innodb_autoinc_lock_mode, @@auto_increment_increment")
+            ).first()
+        except SQLAlchemyError:
+            lock_mode = increment = None
+        consecutive = lock_mode in (0, 1) and increment == 1
+        if not consecutive:
+            _LOGGER.debug(
+                "MySQL ids may not be consecutive (innodb_autoinc_lock_mode=%s, "
+                "auto_increment_increment=%s), inserting rows one by one",
+                lock_mode,
+                increment,
+            )
+        connection.info[MYSQL_CONSECUTIVE_IDS] = consecutive
+    return consecutive
@@ -8,3 +8,9 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
 # The maximum number of rows (events) we purge in one delete statement
 MAX_ROWS_TO_PURGE = 1000
+
+# The maximum number of rows we insert in one statement with bulk_insert
+MAX_ROWS_TO_INSERT = 500
+
+# The maximum number of bind parameters sqlite accepts in one statement
+SQLITE_MAX_BIND_VARS = 998
@@ -0,0 +1,197 @@
+"""Reduce recorded states to a bounded number of points per entity."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import math
+from typing import Any
+
+from sqlalchemy import Float, Integer, cast, extract, func, literal_column
+
+from .models import States, process_timestamp, process_timestamp_to_utc_isoformat
+
+STATE_KEY = "state"
+LAST_CHANGED_KEY = "last_changed"
+MIN_KEY = "min"
+MAX_KEY = "max"
+
+# Matches the numeric states, the same strings float() accepts except for
+# inf and nan
+NUMERIC_STATE_REGEX = r"^ *[-+]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][-+]?[0-9]+)? *$"
+
+
+def numeric_state_filter(dialect_name: str) -> Any | None:
+    """Return a filter matching numeric states or None if not supported."""
+    if dialect_name == "sqlite":
+        return States.state.op("GLOB")("*[0-9]*") & ~States.state.op("GLOB")(
+            "*[^0-9.eE+ -]*"
+        )
+    if dialect_name == "postgresql":
+        return States.state.op("~")(NUMERIC_STATE_REGEX)
+    if dialect_name == "mysql":
+        return States.state.op("REGEXP")(NUMERIC_STATE_REGEX)
+    return None
+
+
+def bucket_expression(
+    dialect_name: str, start_time: datetime, bucket_size: timedelta
+) -> Any:
+    """Return the index of the bucket of a state since start_time.
+
+    The values are inlined, PostgreSQL does not consider two expressions
+    with bound parameters identical when grouping.
+    """
+    start = literal_column(repr(start_time.timestamp()))
+    size = literal_column(repr(bucket_size.total_seconds()))
+    if dialect_name == "sqlite":
+        # Days since the julian epoch, states after start_time are positive
+        # so casting to an integer rounds down
+        seconds = (
+            func.julianday(States.last_updated) - literal_column("2440587.5")
+        ) * literal_column("86400.0")
+        return cast((seconds - start) / size, Integer)
+    if dialect_name == "postgresql":
+        seconds = extract("epoch", States.last_updated)
+        return func.floor((seconds - start) / size)
+    # MySQL, UNIX_TIMESTAMP would convert from the session time zone
+    seconds = (
+        func.timestampdiff(
+            literal_column("MICROSECOND"),
+            literal_column("'1970-01-01 00:00:00'"),
+            States.last_updated,
+        )
+        / literal_column("1000000.0")
+    )
+    return func.floor((seconds - start) / size)
+
+
+def numeric_state_value(dialect_name: str) -> Any:
+    """Return the numeric value of the state column."""
+    if dialect_name == "mysql":
+        # Older MySQL versions can not cast to a float
+        return States.state.op("+")(literal_column("0.0"))
+    return cast(States.state, Float)
+
+
+class _Bucket:
+    """Numeric aggregate and last non numeric state of one bucket."""
+
+    __slots__ = ("min", "max", "sum", "count", "last_numeric", "state", "last_state")
+
+    def __init__(self) -> None:
+        """Initialize an empty bucket."""
+        self.min: float | None = None
+        self.max: float | None = None
+        self.sum = 0.0
+        self.count = 0
+        self.last_numeric: datetime | None = None
+        self.state: str | None = None
+        self.last_state: datetime | None = None
+
+
+class Downsampler:
+    """Reduce the states of entities to at most two points per bucket.
+
+    Numeric states are reduced to their min, max and mean, either while
+    streaming the states with add_state or from aggregates computed in SQL
+    with add_aggregate. Non numeric states, like unavailable, keep the last
+    one of each bucket so gaps still show up.
+    """
+
+    def __init__(self, start_time: datetime, bucket_size: timedelta) -> None:
+        """Initialize the downsampler."""
+        self.start_time = start_time
+        self.bucket_size = bucket_size
+        self._start = start_time.timestamp()
+        self._size = bucket_size.total_seconds()
+        self._buckets: dict[str, dict[int, _Bucket]] = {}
+
+    def _bucket(self, entity_id: str, index: int) -> _Bucket:
+        """Return the bucket of an entity, creating it if needed."""
+        buckets = self._buckets.get(entity_id)
+        if buckets is None:
+            buckets = self._buckets[entity_id] = {}
+        bucket = buckets.get(index)
+        if bucket is None:
+            bucket = buckets[index] = _Bucket()
+        return bucket
+
+    def add_state(
+        self, entity_id: str, state: str | None, last_updated: datetime
+    ) -> None:
+        """Add one state, states of an entity must be added in order."""
+        last_updated = process_timestamp(last_updated)
+        index = int((last_updated.timestamp() - self._start) // self._size)
+        bucket = self._bucket(entity_id, index)
+        state = state or ""
+        try:
+            value = float(state)
+        except (TypeError, ValueError):
+            value = math.nan
+        if not math.isfinite(value):
+            bucket.state = state
+            bucket.last_state = last_updated
+            return
+        if bucket.count == 0:
+            bucket.min = bucket.max = value
+        elif value < bucket.min:  # type: ignore[operator]
+            bucket.min = value
+        elif value > bucket.max:  # type: ignore[operator]
+            bucket.max = value
+        bucket.sum += value
+        bucket.count += 1
+        bucket.last_numeric = last_updated
+
+    def add_aggregate(
+        self,
+        entity_id: str,
+        index: int,
+        min_value: float,
+        max_value: float,
+        sum_value: float,
+        count: int,
+        last_updated: datetime,
+    ) -> None:
+        """Add the aggregate of the numeric states of a bucket."""
+        bucket = self._bucket(entity_id, int(index))
+        bucket.min = min_value
+        bucket.max = max_value
+        bucket.sum = sum_value
+        bucket.count = count
+        bucket.last_numeric = process_timestamp(last_updated)
+
+    def result(self) -> dict[str, list[dict[str, Any]]]:
+        """Return the points of each entity in order."""
+        result = {}
+        for entity_id, buckets in self._buckets.items():
+            points: list[dict[str, Any]] = []
+            prev_state = None
+            for index in sorted(buckets):
+                bucket = buckets[index]
+                if bucket.count:
+                    prev_state = None
+                    points.append(
+                        {
+                            STATE_KEY: bucket.sum / bucket.count,
+                            MIN_KEY: bucket.min,
+                            MAX_KEY: bucket.max,
+                            LAST_CHANGED_KEY: process_timestamp_to_utc_isoformat(
+                                self.start_time + self.bucket_size * index
+                            ),
+                        }
+                    )
+                if bucket.state is None or bucket.state == prev_state:
+                    continue
+                if bucket.count and bucket.last_state < bucket.last_numeric:
+                    # The entity was numeric again at the end of the bucket
+                    continue
+                prev_state = bucket.state
+                points.append(
+                    {
+                        STATE_KEY: bucket.state,
+                        LAST_CHANGED_KEY: process_timestamp_to_utc_isoformat(
+                            bucket.last_state
+                        ),
+                    }
+                )
+            result[entity_id] = points
+        return result
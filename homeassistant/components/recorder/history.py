@@ -6,11 +6,12 @@ from itertools import groupby
 import logging
 import time
 
-from sqlalchemy import and_, bindparam, func
+from sqlalchemy import and_, bindparam, func, literal_column
 from sqlalchemy.ext import baked
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder.models import (
+    StateAttributes,
     States,
     process_timestamp_to_utc_isoformat,
 )
@@ -18,6 +19,12 @@ from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.core import split_entity_id
 import homeassistant.util.dt as dt_util
 
+from .downsample import (
+    Downsampler,
+    bucket_expression,
+    numeric_state_filter,
+    numeric_state_value,
+)
 from .models import LazyState
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -47,19 +54,31 @@ QUERY_STATES = [
     States.domain,
     States.entity_id,
     States.state,
-    States.attributes,
+    # Attributes are either stored in the states table
+    # or in the shared attributes table
+    func.coalesce(States.attributes, StateAttributes.shared_attrs).label("attributes"),
     States.last_changed,
     States.last_updated,
 ]
 
 HISTORY_BAKERY = "recorder_history_bakery"
 
+# The number of rows fetched at once when streaming states
+STREAM_BATCH_SIZE = 1000
+
 
 def async_setup(hass):
     """Set up the history hooks."""
     hass.data[HISTORY_BAKERY] = baked.bakery()
 
 
+def _query_states(session):
+    """Query the states joined with their shared attributes."""
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
+
 def get_significant_states(hass, *args, **kwargs):
     """Wrap _get_significant_states with a sql session."""
     with session_scope(hass=hass) as session:
@@ -86,9 +105,7 @@ def _get_significant_states(
     """
     timer_start = time.perf_counter()
 
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](_query_states)
 
     if significant_changes_only:
         baked_query += lambda q: q.filter(
@@ -137,12 +154,145 @@ def _get_significant_states(
     )
 
 
+def get_significant_states_downsampled(hass, *args, **kwargs):
+    """Wrap _get_significant_states_downsampled with a sql session."""
+    with session_scope(hass=hass) as session:
+        return _get_significant_states_downsampled(hass, session, *args, **kwargs)
+
+
+def _downsample_query(
+    session,
+    columns,
+    start_time,
+    end_time,
+    entity_ids,
+    filters,
+    significant_changes_only,
+):
+    """Query the significant states during start_time - end_time."""
+    query = session.query(*columns).filter(
+        (States.last_updated > start_time) & (States.last_updated < end_time)
+    )
+    if significant_changes_only:
+        query = query.filter(
+            States.domain.in_(SIGNIFICANT_DOMAINS)
+            | (States.last_changed == States.last_updated)
+        )
+    if entity_ids is not None:
+        query = query.filter(States.entity_id.in_(entity_ids))
+    else:
+        query = query.filter(~States.domain.in_(IGNORE_DOMAINS))
+        if filters:
+            query = filters.apply(query)
+    return query
+
+
+def _get_significant_states_downsampled(
+    hass,
+    session,
+    start_time,
+    end_time,
+    bucket_size,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+):
+    """
+    Return states changes during UTC period start_time - end_time in buckets.
+
+    Numeric states are reduced to the mean, min and max of each bucket of
+    bucket_size, in SQL when the dialect supports it. The other states are
+    streamed and reduced to the last state of each bucket. Like with a
+    minimal response, the first state of each entity is a full state.
+    """
+    timer_start = time.perf_counter()
+    downsampler = Downsampler(start_time, bucket_size)
+    dialect_name = session.bind.dialect.name
+    query_args = (
+        start_time,
+        end_time,
+        entity_ids,
+        filters,
+        significant_changes_only,
+    )
+
+    states_query = _downsample_query(
+        session,
+        (States.entity_id, States.state, States.last_updated),
+        *query_args,
+    )
+    numeric = numeric_state_filter(dialect_name)
+    if numeric is not None:
+        value = numeric_state_value(dialect_name)
+        aggregates_query = (
+            _downsample_query(
+                session,
+                (
+                    States.entity_id,
+                    bucket_expression(dialect_name, start_time, bucket_size).label(
+                        "bucket"
+                    ),
+                    func.min(value),
+                    func.max(value),
+                    func.sum(value),
+                    func.count(),
+                    func.max(States.last_updated),
+                ),
+                *query_args,
+            )
+            .filter(numeric)
+            .group_by(States.entity_id, literal_column("bucket"))
+        )
+        for row in execute(aggregates_query):
+            downsampler.add_aggregate(*row)
+        states_query = states_query.filter(~numeric | States.state.is_(None))
+
+    for row in states_query.order_by(States.entity_id, States.last_updated).yield_per(
+        STREAM_BATCH_SIZE
+    ):
+        downsampler.add_state(row.entity_id, row.state, row.last_updated)
+
+    points = downsampler.result()
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states_downsampled took %fs", elapsed)
+
+    first_states = {}
+    if include_start_time_state:
+        run = recorder.run_information_from_instance(hass, start_time)
+        for state in _get_states_with_session(
+            hass, session, start_time, entity_ids, run=run, filters=filters
+        ):
+            state.last_changed = start_time
+            state.last_updated = start_time
+            first_states[state.entity_id] = state
+
+    result = {}
+    for ent_id in entity_ids or dict.fromkeys([*first_states, *points]):
+        ent_points = points.get(ent_id, [])
+        if (first_state := first_states.get(ent_id)) is None:
+            if not ent_points:
+                continue
+            # Use the latest full state for the attributes of the first point
+            first_point = ent_points.pop(0)
+            first_state = _get_single_entity_states_with_session(
+                hass, session, end_time, ent_id
+            )[0]
+            first_state.state = str(first_point[STATE_KEY])
+            first_state.last_changed = (
+                first_state.last_updated
+            ) = dt_util.parse_datetime(first_point[LAST_CHANGED_KEY])
+        result[ent_id] = [first_state, *ent_points]
+
+    return result
+
+
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -155,7 +305,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -176,13 +328,13 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     start_time = dt_util.utcnow()
 
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -243,7 +395,7 @@ def _get_states_with_session(
     # We have more than one entity to look at (most commonly we want
     # all entities,) so we need to do a search on all states since the
     # last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _query_states(session)
 
     most_recent_states_by_date = session.query(
         States.entity_id.label("max_entity_id"),
@@ -291,9 +443,7 @@ def _get_states_with_session(
 def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](_query_states)
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
@@ -452,6 +452,13 @@ def _apply_update(engine, session, new_version, old_version):
         _drop_foreign_key_constraints(
             connection, engine, TABLE_STATES, ["old_state_id"]
         )
+    elif new_version == 17:
+        # The state_attributes table is created by create_all
+        _add_columns(connection, "states", ["attributes_id INTEGER"])
+        _create_index(connection, "states", "ix_states_attributes_id")
+    elif new_version == 18:
+        # The statistics_short_term table is created by create_all
+        pass
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
@@ -1,8 +1,11 @@
 """Models for SQLAlchemy."""
+from datetime import timedelta
 import json
 import logging
+import zlib
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -29,14 +32,14 @@ from homeassistant.const import (
     MAX_LENGTH_STATE_STATE,
 )
 from homeassistant.core import Context, Event, EventOrigin, State, split_entity_id
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import json_dumps_stable
 import homeassistant.util.dt as dt_util
 
 # SQLAlchemy Schema
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 16
+SCHEMA_VERSION = 18
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,16 +47,20 @@ DB_TIMEZONE = "+00:00"
 
 TABLE_EVENTS = "events"
 TABLE_STATES = "states"
+TABLE_STATE_ATTRIBUTES = "state_attributes"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 TABLE_STATISTICS = "statistics"
+TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
 
 ALL_TABLES = [
     TABLE_STATES,
+    TABLE_STATE_ATTRIBUTES,
     TABLE_EVENTS,
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
     TABLE_STATISTICS,
+    TABLE_STATISTICS_SHORT_TERM,
 ]
 
 DATETIME_TYPE = DateTime(timezone=True).with_variant(
@@ -99,7 +106,7 @@ class Events(Base):  # type: ignore
         """Create an event database object from a native event."""
         return Events(
             event_type=event.event_type,
-            event_data=event_data or json.dumps(event.data, cls=JSONEncoder),
+            event_data=event_data or json_dumps_stable(event.data),
             origin=str(event.origin.value),
             time_fired=event.time_fired,
             context_id=event.context.id,
@@ -148,8 +155,12 @@ class States(Base):  # type: ignore
     last_updated = Column(DATETIME_TYPE, default=dt_util.utcnow, index=True)
     created = Column(DATETIME_TYPE, default=dt_util.utcnow)
     old_state_id = Column(Integer, ForeignKey("states.state_id"), index=True)
+    attributes_id = Column(
+        Integer, ForeignKey("state_attributes.attributes_id"), index=True
+    )
     event = relationship("Events", uselist=False)
     old_state = relationship("States", remote_side=[state_id])
+    state_attributes = relationship("StateAttributes")
 
     __table_args__ = (
         # Used for fetching the state of entities at a specific time
@@ -186,7 +197,7 @@ class States(Base):  # type: ignore
         else:
             dbstate.domain = state.domain
             dbstate.state = state.state
-            dbstate.attributes = json.dumps(dict(state.attributes), cls=JSONEncoder)
+            dbstate.attributes = json_dumps_stable(dict(state.attributes))
             dbstate.last_changed = state.last_changed
             dbstate.last_updated = state.last_updated
 
@@ -194,11 +205,14 @@ class States(Base):  # type: ignore
 
     def to_native(self, validate_entity_id=True):
         """Convert to an HA state object."""
+        attributes = self.attributes
+        if attributes is None and self.state_attributes is not None:
+            attributes = self.state_attributes.shared_attrs
         try:
             return State(
                 self.entity_id,
                 self.state,
-                json.loads(self.attributes),
+                json.loads(attributes),
                 process_timestamp(self.last_changed),
                 process_timestamp(self.last_updated),
                 # Join the events table on event_id to get the context instead
@@ -212,14 +226,44 @@ class States(Base):  # type: ignore
             return None
 
 
-class Statistics(Base):  # type: ignore
-    """Statistics."""
+class StateAttributes(Base):  # type: ignore
+    """State attribute change history shared between states."""
 
     __table_args__ = {
         "mysql_default_charset": "utf8mb4",
         "mysql_collate": "utf8mb4_unicode_ci",
     }
-    __tablename__ = TABLE_STATISTICS
+    __tablename__ = TABLE_STATE_ATTRIBUTES
+    attributes_id = Column(Integer, Identity(), primary_key=True)
+    hash = Column(BigInteger, index=True)
+    # Note that this is not named attributes to avoid confusion with the states table
+    shared_attrs = Column(Text().with_variant(mysql.LONGTEXT, "mysql"))
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StateAttributes("
+            f"id={self.attributes_id}, hash='{self.hash}', attributes='{self.shared_attrs}'"
+            f")>"
+        )
+
+    @staticmethod
+    def from_shared_attrs(shared_attrs):
+        """Create object from the serialized attributes of a state."""
+        return StateAttributes(
+            hash=StateAttributes.hash_shared_attrs(shared_attrs),
+            shared_attrs=shared_attrs,
+        )
+
+    @staticmethod
+    def hash_shared_attrs(shared_attrs):
+        """Return the hash of the serialized attributes of a state."""
+        return zlib.crc32(shared_attrs.encode("utf-8"))
+
+
+class StatisticsBase:
+    """Statistics base class."""
+
     id = Column(Integer, primary_key=True)
     created = Column(DATETIME_TYPE, default=dt_util.utcnow)
     source = Column(String(32))
@@ -232,15 +276,13 @@ class Statistics(Base):  # type: ignore
     state = Column(Float())
     sum = Column(Float())
 
-    __table_args__ = (
-        # Used for fetching statistics for a certain entity at a specific time
-        Index("ix_statistics_statistic_id_start", "statistic_id", "start"),
-    )
+    # The period covered by a row
+    duration: timedelta
 
-    @staticmethod
-    def from_stats(source, statistic_id, start, stats):
+    @classmethod
+    def from_stats(cls, source, statistic_id, start, stats):
         """Create object from a statistics."""
-        return Statistics(
+        return cls(
             source=source,
             statistic_id=statistic_id,
             start=start,
@@ -248,6 +290,30 @@ class Statistics(Base):  # type: ignore
         )
 
 
+class Statistics(Base, StatisticsBase):  # type: ignore
+    """Long term statistics, one row per hour."""
+
+    duration = timedelta(hours=1)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index("ix_statistics_statistic_id_start", "statistic_id", "start"),
+    )
+    __tablename__ = TABLE_STATISTICS
+
+
+class StatisticsShortTerm(Base, StatisticsBase):  # type: ignore
+    """Short term statistics, one row per 5 minutes."""
+
+    duration = timedelta(minutes=5)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index("ix_statistics_short_term_statistic_id_start", "statistic_id", "start"),
+    )
+    __tablename__ = TABLE_STATISTICS_SHORT_TERM
+
+
 class RecorderRuns(Base):  # type: ignore
     """Representation of recorder run."""
 
@@ -11,7 +11,7 @@ from sqlalchemy.sql.expression import distinct
 import homeassistant.util.dt as dt_util
 
 from .const import MAX_ROWS_TO_PURGE
-from .models import Events, RecorderRuns, States
+from .models import Events, RecorderRuns, StateAttributes, States, StatisticsShortTerm
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
 
@@ -40,7 +40,7 @@ def purge_old_data(
         event_ids = _select_event_ids_to_purge(session, purge_before)
         state_ids = _select_state_ids_to_purge(session, purge_before, event_ids)
         if state_ids:
-            _purge_state_ids(session, state_ids)
+            _purge_state_ids(instance, session, state_ids)
         if event_ids:
             _purge_event_ids(session, event_ids)
             # If states or events purging isn't processing the purge_before yet,
@@ -51,6 +51,7 @@ def purge_old_data(
             _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
             return False
         _purge_old_recorder_runs(instance, session, purge_before)
+        _purge_old_short_term_statistics(instance, session)
     if repack:
         repack_database(instance)
     return True
@@ -84,8 +85,16 @@ def _select_state_ids_to_purge(
     return [state.state_id for state in states]
 
 
-def _purge_state_ids(session: Session, state_ids: list[int]) -> None:
+def _purge_state_ids(
+    instance: Recorder, session: Session, state_ids: list[int]
+) -> None:
     """Disconnect states and delete by state id."""
+    attributes_ids = [
+        attributes_id
+        for (attributes_id,) in session.query(distinct(States.attributes_id))
+        .filter(States.state_id.in_(state_ids))
+        .filter(States.attributes_id.isnot(None))
+    ]
 
     # Update old_state_id to NULL before deleting to ensure
     # the delete does not fail due to a foreign key constraint
@@ -105,6 +114,37 @@ def _purge_state_ids(session: Session, state_ids: list[int]) -> None:
     )
     _LOGGER.debug("Deleted %s states", deleted_rows)
 
+    if attributes_ids:
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+
+
+def _purge_unused_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: list[int]
+) -> None:
+    """Delete shared attributes that are no longer used by any state."""
+    # The attributes ids in the cache may be used by states
+    # that have not been committed yet
+    cached_ids = set(instance.state_attributes_ids.values())
+    used_ids = {
+        attributes_id
+        for (attributes_id,) in session.query(distinct(States.attributes_id)).filter(
+            States.attributes_id.in_(attributes_ids)
+        )
+    }
+    unused_ids = [
+        attributes_id
+        for attributes_id in attributes_ids
+        if attributes_id not in used_ids and attributes_id not in cached_ids
+    ]
+    if not unused_ids:
+        return
+    deleted_rows = (
+        session.query(StateAttributes)
+        .filter(StateAttributes.attributes_id.in_(unused_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s attributes", deleted_rows)
+
 
 def _purge_event_ids(session: Session, event_ids: list[int]) -> None:
     """Delete by event id."""
@@ -130,6 +170,19 @@ def _purge_old_recorder_runs(
     _LOGGER.debug("Deleted %s recorder_runs", deleted_rows)
 
 
+def _purge_old_short_term_statistics(instance: Recorder, session: Session) -> None:
+    """Purge short term statistics older than their own retention period."""
+    purge_before = dt_util.utcnow() - timedelta(
+        days=instance.short_term_statistics_keep_days
+    )
+    deleted_rows = (
+        session.query(StatisticsShortTerm)
+        .filter(StatisticsShortTerm.start < purge_before)
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
+
+
 def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     """Remove filtered states and events that shouldn't be in the database."""
     _LOGGER.debug("Cleanup filtered data")
@@ -141,7 +194,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
         if not instance.entity_filter(entity_id)
     ]
     if len(excluded_entity_ids) > 0:
-        _purge_filtered_states(session, excluded_entity_ids)
+        _purge_filtered_states(instance, session, excluded_entity_ids)
         return False
 
     # Check if excluded event_types are in database
@@ -151,13 +204,15 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
         if event_type in instance.exclude_t
     ]
     if len(excluded_event_types) > 0:
-        _purge_filtered_events(session, excluded_event_types)
+        _purge_filtered_events(instance, session, excluded_event_types)
         return False
 
     return True
 
 
-def _purge_filtered_states(session: Session, excluded_entity_ids: list[str]) -> None:
+def _purge_filtered_states(
+    instance: Recorder, session: Session, excluded_entity_ids: list[str]
+) -> None:
     """Remove filtered states and linked events."""
     state_ids: list[int]
     event_ids: list[int | None]
@@ -173,11 +228,13 @@ def _purge_filtered_states(session: Session, excluded_entity_ids: list[str]) ->
     _LOGGER.debug(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
     )
-    _purge_state_ids(session, state_ids)
+    _purge_state_ids(instance, session, state_ids)
     _purge_event_ids(session, event_ids)  # type: ignore  # type of event_ids already narrowed to 'list[int]'
 
 
-def _purge_filtered_events(session: Session, excluded_event_types: list[str]) -> None:
+def _purge_filtered_events(
+    instance: Recorder, session: Session, excluded_event_types: list[str]
+) -> None:
     """Remove filtered events and linked states."""
     events: list[Events] = (
         session.query(Events.event_id)
@@ -193,7 +250,7 @@ def _purge_filtered_events(session: Session, excluded_event_types: list[str]) ->
         session.query(States.state_id).filter(States.event_id.in_(event_ids)).all()
     )
     state_ids: list[int] = [state.state_id for state in states]
-    _purge_state_ids(session, state_ids)
+    _purge_state_ids(instance, session, state_ids)
     _purge_event_ids(session, event_ids)
 
 
@@ -209,7 +266,7 @@ def purge_entity_data(instance: Recorder, entity_filter: Callable[[str], bool])
         _LOGGER.debug("Purging entity data for %s", selected_entity_ids)
         if len(selected_entity_ids) > 0:
             # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-            _purge_filtered_states(session, selected_entity_ids)
+            _purge_filtered_states(instance, session, selected_entity_ids)
             _LOGGER.debug("Purging entity data hasn't fully completed yet")
             return False
 
@@ -7,28 +7,45 @@ from itertools import groupby
 import logging
 from typing import TYPE_CHECKING
 
-from sqlalchemy import bindparam
+from sqlalchemy import and_, bindparam, func
 from sqlalchemy.ext import baked
 
 import homeassistant.util.dt as dt_util
 
-from .const import DOMAIN
-from .models import Statistics, process_timestamp_to_utc_isoformat
+from .const import DATA_INSTANCE, DOMAIN, SQLITE_MAX_BIND_VARS
+from .models import Statistics, StatisticsShortTerm, process_timestamp_to_utc_isoformat
 from .util import execute, retryable_database_job, session_scope
 
 if TYPE_CHECKING:
     from . import Recorder
 
-QUERY_STATISTICS = [
-    Statistics.statistic_id,
-    Statistics.start,
-    Statistics.mean,
-    Statistics.min,
-    Statistics.max,
-    Statistics.last_reset,
-    Statistics.state,
-    Statistics.sum,
-]
+
+def _query_statistics(table):
+    """Return the columns to query from a statistics table."""
+    return [
+        table.statistic_id,
+        table.start,
+        table.mean,
+        table.min,
+        table.max,
+        table.last_reset,
+        table.state,
+        table.sum,
+    ]
+
+
+QUERY_STATISTICS = _query_statistics(Statistics)
+QUERY_STATISTICS_SHORT_TERM = _query_statistics(StatisticsShortTerm)
+
+PERIOD_5MINUTE = "5minute"
+PERIOD_HOUR = "hour"
+
+STATISTICS_TABLES = {
+    PERIOD_5MINUTE: StatisticsShortTerm,
+    PERIOD_HOUR: Statistics,
+}
+
+SHORT_TERM_PERIODS_PER_HOUR = Statistics.duration // StatisticsShortTerm.duration
 
 STATISTICS_BAKERY = "recorder_statistics_bakery"
 
@@ -47,16 +64,17 @@ def get_start_time() -> datetime.datetime:
     return start
 
 
-@retryable_database_job("statistics")
-def compile_statistics(instance: Recorder, start: datetime.datetime) -> bool:
-    """Compile statistics."""
-    start = dt_util.as_utc(start)
-    end = start + timedelta(hours=1)
-    _LOGGER.debug(
-        "Compiling statistics for %s-%s",
-        start,
-        end,
+def get_start_time_short_term() -> datetime.datetime:
+    """Return start time of the last complete 5 minute period."""
+    now = dt_util.utcnow()
+    current_period = now.replace(
+        minute=now.minute - now.minute % 5, second=0, microsecond=0
     )
+    return current_period - StatisticsShortTerm.duration
+
+
+def _compile_platform_statistics(instance: Recorder, start, end) -> list[dict]:
+    """Compile statistics of all recorder platforms for start-end."""
     platform_stats = []
     for domain, platform in instance.hass.data[DOMAIN].items():
         if not hasattr(platform, "compile_statistics"):
@@ -65,38 +83,182 @@ def compile_statistics(instance: Recorder, start: datetime.datetime) -> bool:
         _LOGGER.debug(
             "Statistics for %s during %s-%s: %s", domain, start, end, platform_stats[-1]
         )
+    return platform_stats
+
+
+@retryable_database_job("statistics")
+def compile_short_term_statistics(instance: Recorder, start: datetime.datetime) -> bool:
+    """Compile 5 minute statistics."""
+    start = dt_util.as_utc(start)
+    end = start + StatisticsShortTerm.duration
+    _LOGGER.debug("Compiling short term statistics for %s-%s", start, end)
+    platform_stats = _compile_platform_statistics(instance, start, end)
 
     with session_scope(session=instance.get_session()) as session:  # type: ignore
         for stats in platform_stats:
             for entity_id, stat in stats.items():
-                session.add(Statistics.from_stats(DOMAIN, entity_id, start, stat))
+                session.add(
+                    StatisticsShortTerm.from_stats(DOMAIN, entity_id, start, stat)
+                )
 
     return True
 
 
-def statistics_during_period(hass, start_time, end_time=None, statistic_id=None):
-    """Return states changes during UTC period start_time - end_time."""
-    with session_scope(hass=hass) as session:
-        baked_query = hass.data[STATISTICS_BAKERY](
-            lambda session: session.query(*QUERY_STATISTICS)
-        )
+def _rollup_short_term_statistics(
+    session, start: datetime.datetime
+) -> tuple[list[Statistics], bool]:
+    """Compile the hourly statistics from the short term statistics of the hour.
+
+    Only statistics with a short term statistic for every period of the hour
+    are rolled up. Returns the rolled up statistics and if all statistics
+    with short term statistics in the hour were rolled up.
+    """
+    end = start + Statistics.duration
+    rows = execute(
+        session.query(StatisticsShortTerm.source, *QUERY_STATISTICS_SHORT_TERM)
+        .filter(StatisticsShortTerm.start >= start)
+        .filter(StatisticsShortTerm.start < end)
+        .order_by(StatisticsShortTerm.statistic_id, StatisticsShortTerm.start)
+    )
+
+    rolled_up = []
+    complete = bool(rows)
+    for statistic_id, group in groupby(rows, lambda row: row.statistic_id):
+        periods = list(group)
+        if len(periods) != SHORT_TERM_PERIODS_PER_HOUR:
+            # Periods were missed, e.g. while Home Assistant was not running
+            complete = False
+            continue
+        stat = {}
+        # All periods of the hour have the same length, so the mean of the
+        # means is the time weighted average of the hour
+        if means := [period.mean for period in periods if period.mean is not None]:
+            stat["mean"] = sum(means) / len(means)
+        if mins := [period.min for period in periods if period.min is not None]:
+            stat["min"] = min(mins)
+        if maxes := [period.max for period in periods if period.max is not None]:
+            stat["max"] = max(maxes)
+        last = periods[-1]
+        if last.sum is not None:
+            stat["last_reset"] = last.last_reset
+            stat["state"] = last.state
+            stat["sum"] = last.sum
+        rolled_up.append(Statistics.from_stats(last.source, statistic_id, start, stat))
+
+    return rolled_up, complete
+
+
+@retryable_database_job("statistics")
+def compile_statistics(instance: Recorder, start: datetime.datetime) -> bool:
+    """Compile hourly statistics.
+
+    Statistics with short term statistics for the whole hour are rolled up
+    from those. When any statistic misses periods or there are no short
+    term statistics, the other statistics are compiled from the recorded
+    states.
+    """
+    start = dt_util.as_utc(start)
+    end = start + Statistics.duration
+    _LOGGER.debug(
+        "Compiling statistics for %s-%s",
+        start,
+        end,
+    )
+    with session_scope(session=instance.get_session()) as session:  # type: ignore
+        rolled_up, complete = _rollup_short_term_statistics(session, start)
+
+    compiled = []
+    if not complete:
+        rolled_up_ids = {stat.statistic_id for stat in rolled_up}
+        compiled = [
+            Statistics.from_stats(DOMAIN, entity_id, start, stat)
+            for stats in _compile_platform_statistics(instance, start, end)
+            for entity_id, stat in stats.items()
+            if entity_id not in rolled_up_ids
+        ]
 
-        baked_query += lambda q: q.filter(Statistics.start >= bindparam("start_time"))
+    with session_scope(session=instance.get_session()) as session:  # type: ignore
+        session.add_all(rolled_up)
+        session.add_all(compiled)
 
+    return True
+
+
+def _statistics_tiers(hass, start_time, end_time, period):
+    """Return the tables and time ranges to read statistics of a period from.
+
+    Hourly statistics are read from the hourly table, which has the fewest
+    rows. 5 minute statistics are read from the short term table, except
+    for the hours before short_term_statistics_keep_days ago. Short term
+    statistics of those may be purged, so they are read from the hourly
+    table instead.
+    """
+    if period == PERIOD_HOUR:
+        return [(PERIOD_HOUR, start_time, end_time)]
+
+    keep_days = hass.data[DATA_INSTANCE].short_term_statistics_keep_days
+    short_term_start = (dt_util.utcnow() - timedelta(days=keep_days)).replace(
+        minute=0, second=0, microsecond=0
+    ) + Statistics.duration
+    tiers = []
+    if start_time < short_term_start:
+        hourly_end = short_term_start
         if end_time is not None:
-            baked_query += lambda q: q.filter(Statistics.start < bindparam("end_time"))
+            hourly_end = min(end_time, short_term_start)
+        tiers.append((PERIOD_HOUR, start_time, hourly_end))
+    if end_time is None or end_time > short_term_start:
+        tiers.append((PERIOD_5MINUTE, max(start_time, short_term_start), end_time))
+    return tiers
 
-        if statistic_id is not None:
-            baked_query += lambda q: q.filter_by(statistic_id=bindparam("statistic_id"))
-            statistic_id = statistic_id.lower()
 
-        baked_query += lambda q: q.order_by(Statistics.statistic_id, Statistics.start)
+def statistics_during_period(
+    hass, start_time, end_time=None, statistic_id=None, period=PERIOD_HOUR
+):
+    """Return statistics during UTC period start_time - end_time.
 
-        stats = execute(
-            baked_query(session).params(
-                start_time=start_time, end_time=end_time, statistic_id=statistic_id
+    period is the resolution of the statistics, see _statistics_tiers for
+    the tables they are read from. 5 minute statistics older than the short
+    term statistics retention are hourly statistics.
+    """
+    if statistic_id is not None:
+        statistic_id = statistic_id.lower()
+
+    stats = []
+    with session_scope(hass=hass) as session:
+        for tier, tier_start, tier_end in _statistics_tiers(
+            hass, start_time, end_time, period
+        ):
+            table = STATISTICS_TABLES[tier]
+            baked_query = hass.data[STATISTICS_BAKERY](
+                lambda session: session.query(*_query_statistics(table)), tier
             )
-        )
+
+            baked_query += lambda q: q.filter(table.start >= bindparam("start_time"))
+
+            if tier_end is not None:
+                baked_query += lambda q: q.filter(table.start < bindparam("end_time"))
+
+            if statistic_id is not None:
+                baked_query += lambda q: q.filter_by(
+                    statistic_id=bindparam("statistic_id")
+                )
+
+            baked_query += lambda q: q.order_by(table.statistic_id, table.start)
+
+            stats.extend(
+                execute(
+                    baked_query(session).params(
+                        start_time=tier_start,
+                        end_time=tier_end,
+                        statistic_id=statistic_id,
+                    )
+                )
+            )
+
+        if len(stats) > 1:
+            # The tiers are in time order, the sort keeps that order
+            # for each statistic
+            stats.sort(key=lambda stat: stat.statistic_id)
 
         statistic_ids = [statistic_id] if statistic_id is not None else None
 
@@ -130,6 +292,79 @@ def get_last_statistics(hass, number_of_stats, statistic_id=None):
         return _sorted_statistics_to_dict(stats, statistic_ids)
 
 
+def _latest_statistics_query(session, table, bounded):
+    """Return a query for the most recent statistics of some statistic_ids.
+
+    When bounded, only statistics starting at or before max_start are
+    considered.
+    """
+    most_recent_statistics = session.query(
+        table.statistic_id, func.max(table.start).label("max_start")
+    ).filter(table.statistic_id.in_(bindparam("statistic_ids", expanding=True)))
+    if bounded:
+        most_recent_statistics = most_recent_statistics.filter(
+            table.start <= bindparam("max_start")
+        )
+    most_recent_statistics = most_recent_statistics.group_by(
+        table.statistic_id
+    ).subquery()
+    return session.query(*_query_statistics(table)).join(
+        most_recent_statistics,
+        and_(
+            table.statistic_id == most_recent_statistics.c.statistic_id,
+            table.start == most_recent_statistics.c.max_start,
+        ),
+    )
+
+
+def get_latest_statistics(hass, statistic_ids, end_time=None):
+    """Return the most recent statistics of each of the statistic_ids.
+
+    The result has the same format as get_last_statistics with one
+    statistic per statistic_id. Both the short term and the hourly table are
+    checked and the statistic covering the most recent period is returned.
+    When end_time is passed, only statistics of periods that ended at or
+    before end_time are considered.
+    """
+    statistic_ids = [statistic_id.lower() for statistic_id in statistic_ids]
+    bounded = end_time is not None
+    latest = {}
+    with session_scope(hass=hass) as session:
+        # The short term table goes first to win ties with its hourly rollup
+        for period in (PERIOD_5MINUTE, PERIOD_HOUR):
+            table = STATISTICS_TABLES[period]
+            baked_query = hass.data[STATISTICS_BAKERY](
+                lambda session: _latest_statistics_query(session, table, bounded),
+                period,
+                bounded,
+            )
+            baked_query += lambda q: q.order_by(table.statistic_id, table.id.desc())
+            max_start = end_time - table.duration if bounded else None
+
+            for offset in range(0, len(statistic_ids), SQLITE_MAX_BIND_VARS):
+                for stat in execute(
+                    baked_query(session).params(
+                        statistic_ids=statistic_ids[
+                            offset : offset + SQLITE_MAX_BIND_VARS
+                        ],
+                        max_start=max_start,
+                    )
+                ):
+                    end = stat.start + table.duration
+                    if (
+                        stat.statistic_id not in latest
+                        or end > latest[stat.statistic_id][0]
+                    ):
+                        latest[stat.statistic_id] = (end, stat)
+
+        stats = [
+            latest[statistic_id][1]
+            for statistic_id in statistic_ids
+            if statistic_id in latest
+        ]
+        return _sorted_statistics_to_dict(stats, statistic_ids)
+
+
 def _sorted_statistics_to_dict(
     stats,
     statistic_ids,
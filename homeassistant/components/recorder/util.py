@@ -10,19 +10,21 @@ import os
 import time
 from typing import TYPE_CHECKING
 
+from sqlalchemy import select
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import HomeAssistant
 import homeassistant.util.dt as dt_util
 
-from .const import DATA_INSTANCE, SQLITE_URL_PREFIX
+from .const import DATA_INSTANCE, SQLITE_MAX_BIND_VARS, SQLITE_URL_PREFIX
 from .models import (
     ALL_TABLES,
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
     TABLE_STATISTICS,
     RecorderRuns,
+    StateAttributes,
     process_timestamp,
 )
 
@@ -287,6 +289,30 @@ def end_incomplete_runs(session, start_time):
         session.add(run)
 
 
+def find_shared_attributes_ids(connection, shared_attrs_list):
+    """Find the attributes_id of already stored shared attributes.
+
+    Works with both a session and a connection.
+    """
+    hashes = list(
+        {StateAttributes.hash_shared_attrs(attrs) for attrs in shared_attrs_list}
+    )
+    wanted = set(shared_attrs_list)
+    found = {}
+    for offset in range(0, len(hashes), SQLITE_MAX_BIND_VARS):
+        query = select(
+            StateAttributes.attributes_id, StateAttributes.shared_attrs
+        ).where(
+            StateAttributes.hash.in_(hashes[offset : offset + SQLITE_MAX_BIND_VARS])
+        )
+        # Compare the attributes as well since different
+        # attributes can have the same hash
+        for attributes_id, shared_attrs in connection.execute(query):
+            if shared_attrs in wanted:
+                found[shared_attrs] = attributes_id
+    return found
+
+
 def retryable_database_job(description: str):
     """Try to execute a database job.
 
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import datetime
-import itertools
+import operator
 
 from homeassistant.components.recorder import history, statistics
 from homeassistant.components.sensor import (
@@ -61,33 +61,19 @@ def _time_weighted_average(
     state changes.
     Note: there's no interpolation of values between state changes.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
-    accumulated = 0.0
-
-    for fstate, state in fstates:
-        # The recorder will give us the last known state, which may be well
-        # before the requested start time for the statistics
-        start_time = start if state.last_updated < start else state.last_updated
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
-        else:
-            duration = start_time - old_start_time
-            # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
-
-        old_fstate = fstate
-        old_start_time = start_time
-
-    if old_fstate is not None:
-        # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
-
-    return accumulated / (end - start).total_seconds()
+    start_ts = start.timestamp()
+    # The recorder will give us the last known state, which may be well
+    # before the requested start time for the statistics
+    start_times = [
+        max(state.last_updated.timestamp(), start_ts) for _, state in fstates
+    ]
+    # Each value is weighted by the duration until the next state change
+    # and the last one by the duration until the end of the period
+    durations = map(operator.sub, start_times[1:] + [end.timestamp()], start_times)
+    accumulated = sum(map(operator.mul, (fstate for fstate, _ in fstates), durations))
+
+    # Adjust start time, if there was no last known state
+    return accumulated / (end.timestamp() - start_times[0])
 
 
 def compile_statistics(
@@ -106,6 +92,18 @@ def compile_statistics(
         hass, start - datetime.timedelta.resolution, end, [i[0] for i in entities]
     )
 
+    # Get the last statistics of all sensors with a sum in one go
+    last_stats = statistics.get_latest_statistics(  # type: ignore
+        hass,
+        [
+            entity_id
+            for entity_id, device_class in entities
+            if "sum" in DEVICE_CLASS_STATISTICS[device_class]
+            and entity_id in history_list
+        ],
+        end_time=start,
+    )
+
     for entity_id, device_class in entities:
         wanted_statistics = DEVICE_CLASS_STATISTICS[device_class]
 
@@ -124,9 +122,9 @@ def compile_statistics(
 
         # Make calculations
         if "max" in wanted_statistics:
-            result[entity_id]["max"] = max(*itertools.islice(zip(*fstates), 1))
+            result[entity_id]["max"] = max(fstate for fstate, _ in fstates)
         if "min" in wanted_statistics:
-            result[entity_id]["min"] = min(*itertools.islice(zip(*fstates), 1))
+            result[entity_id]["min"] = min(fstate for fstate, _ in fstates)
 
         if "mean" in wanted_statistics:
             result[entity_id]["mean"] = _time_weighted_average(fstates, start, end)
@@ -135,7 +133,6 @@ def compile_statistics(
             last_reset = old_last_reset = None
             new_state = old_state = None
             _sum = 0
-            last_stats = statistics.get_last_statistics(hass, 1, entity_id)  # type: ignore
             if entity_id in last_stats:
                 # We have compiled history for this sensor before, use that as a starting point
                 last_reset = old_last_reset = last_stats[entity_id][0]["last_reset"]
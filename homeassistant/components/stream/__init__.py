@@ -41,7 +41,7 @@ from .const import (
     STREAM_RESTART_INCREMENT,
     STREAM_RESTART_RESET_TIME,
 )
-from .core import PROVIDERS, IdleTimer, StreamOutput
+from .core import PROVIDERS, IdleTimer, KeyFrameConverter, StreamOutput
 from .hls import async_setup_hls
 from .recorder import RecorderOutput
 
@@ -129,6 +129,7 @@ class Stream:
         self._thread_quit = threading.Event()
         self._outputs: dict[str, StreamOutput] = {}
         self._fast_restart_once = False
+        self._keyframe_converter = KeyFrameConverter(hass)
 
     def endpoint_url(self, fmt: str) -> str:
         """Start the stream and returns a url for the output format."""
@@ -145,6 +146,17 @@ class Stream:
         # without concern about self._outputs being modified from another thread.
         return MappingProxyType(self._outputs.copy())
 
+    @property
+    def memory_usage(self) -> int:
+        """Return the number of bytes held by the segments of all outputs."""
+        # Outputs share the segments, count each of them once
+        segments = {
+            id(segment): segment
+            for output in self.outputs().values()
+            for segment in output.get_segments()
+        }
+        return sum(segment.size for segment in segments.values())
+
     def add_provider(
         self, fmt: str, timeout: int = OUTPUT_IDLE_TIMEOUT
     ) -> StreamOutput:
@@ -207,7 +219,7 @@ class Stream:
         # pylint: disable=import-outside-toplevel
         from .worker import SegmentBuffer, stream_worker
 
-        segment_buffer = SegmentBuffer(self.outputs)
+        segment_buffer = SegmentBuffer(self.outputs, self._keyframe_converter)
         wait_timeout = 0
         while not self._thread_quit.wait(timeout=wait_timeout):
             start_time = time.time()
@@ -260,6 +272,12 @@ class Stream:
             self._thread = None
             _LOGGER.info("Stopped stream: %s", redact_credentials(str(self.source)))
 
+    async def async_get_image(self) -> bytes | None:
+        """Return a JPEG image of the latest keyframe of the running stream."""
+        if self._thread is None or not self._thread.is_alive():
+            return None
+        return await self._keyframe_converter.async_get_image()
+
     async def async_record(
         self, video_path: str, duration: int = 30, lookback: int = 5
     ) -> None:
@@ -34,6 +34,8 @@ PACKETS_TO_WAIT_FOR_AUDIO = 20  # Some streams have an audio stream with no audi
 MAX_TIMESTAMP_GAP = 10000  # seconds - anything from 10 to 50000 is probably reasonable
 
 MAX_MISSING_DTS = 6  # Number of packets missing DTS to allow
+KEYFRAME_IMAGE_MIN_INTERVAL = 5  # Minimum seconds between keyframe images
+KEYFRAME_IMAGE_MAX_AGE_SEGMENTS = 3  # Segment durations a keyframe stays fresh
 SOURCE_TIMEOUT = 30  # Timeout for reading stream source
 
 STREAM_RESTART_INCREMENT = 10  # Increase wait_timeout by this amount each retry
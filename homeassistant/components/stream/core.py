@@ -4,6 +4,10 @@ from __future__ import annotations
 import asyncio
 from collections import deque
 import datetime
+from fractions import Fraction
+from io import BytesIO
+import logging
+from time import monotonic
 from typing import TYPE_CHECKING
 
 from aiohttp import web
@@ -14,11 +18,20 @@ from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.decorator import Registry
 
-from .const import ATTR_STREAMS, DOMAIN
+from .const import (
+    ATTR_STREAMS,
+    DOMAIN,
+    KEYFRAME_IMAGE_MAX_AGE_SEGMENTS,
+    KEYFRAME_IMAGE_MIN_INTERVAL,
+    SEGMENT_CONTAINER_FORMAT,
+    TARGET_SEGMENT_DURATION,
+)
 
 if TYPE_CHECKING:
     from . import Stream
 
+_LOGGER = logging.getLogger(__name__)
+
 PROVIDERS = Registry()
 
 
@@ -28,7 +41,8 @@ class Part:
 
     duration: float = attr.ib()
     has_keyframe: bool = attr.ib()
-    data: bytes = attr.ib()
+    # A view of the segment data once the segment is complete
+    data: bytes | memoryview = attr.ib()
 
 
 @attr.s(slots=True)
@@ -43,17 +57,136 @@ class Segment:
     stream_id: int = attr.ib(default=0)
     parts: list[Part] = attr.ib(factory=list)
     start_time: datetime.datetime = attr.ib(factory=datetime.datetime.utcnow)
+    # The init followed by the data of all parts, set when the segment is complete
+    data: bytes | None = attr.ib(default=None)
 
     @property
     def complete(self) -> bool:
         """Return whether the Segment is complete."""
         return self.duration > 0
 
-    def get_bytes_without_init(self) -> bytes:
-        """Return reconstructed data for entire segment as bytes."""
+    @property
+    def size(self) -> int:
+        """Return the number of bytes held by the segment."""
+        if self.data is not None:
+            return len(self.init) + len(self.data)
+        return len(self.init) + sum(len(part.data) for part in self.parts)
+
+    def set_data(self, data: bytes) -> None:
+        """Store the init and the data of all parts in one buffer.
+
+        The parts become views of the buffer so their data is only kept once.
+        """
+        view = memoryview(data)
+        position = len(self.init)
+        for part in self.parts:
+            end = position + len(part.data)
+            part.data = view[position:end]
+            position = end
+        self.data = data
+
+    def get_bytes(self) -> bytes:
+        """Return the data of the entire segment including the init."""
+        if self.data is not None:
+            return self.data
+        return b"".join([self.init, *(part.data for part in self.parts)])
+
+    def get_bytes_without_init(self) -> bytes | memoryview:
+        """Return reconstructed data for entire segment as bytes.
+
+        A complete segment returns a view of its data without copying.
+        """
+        if self.data is not None:
+            return memoryview(self.data)[len(self.init) :]
         return b"".join([part.data for part in self.parts])
 
 
+class KeyFrameConverter:
+    """Convert the latest keyframe of a stream to a JPEG image on demand.
+
+    The worker sets the latest segment once its first part, which starts
+    with a keyframe, is written. That keyframe is only decoded and encoded
+    when an image is requested, at most once every min_interval seconds
+    and only if there is a newer segment than the one of the last image.
+    No image is returned once the worker has not set a segment for a few
+    segment durations, e.g. while it is retrying a source that went away.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, min_interval: float = KEYFRAME_IMAGE_MIN_INTERVAL
+    ) -> None:
+        """Initialize KeyFrameConverter."""
+        self._hass = hass
+        self._min_interval = min_interval
+        self._lock = asyncio.Lock()
+        # Latest segment, the time it was set and how long it stays fresh
+        self._latest: tuple[Segment, float, float] | None = None
+        self._image_segment: Segment | None = None
+        self._image: bytes | None = None
+        self._image_time = 0.0
+
+    def set_segment(self, segment: Segment) -> None:
+        """Set the latest segment, called from the worker thread."""
+        duration = TARGET_SEGMENT_DURATION
+        if self._latest is not None:
+            # The previous segment is complete once the next one starts
+            duration = max(self._latest[0].duration, duration)
+        self._latest = (
+            segment,
+            monotonic(),
+            duration * KEYFRAME_IMAGE_MAX_AGE_SEGMENTS,
+        )
+
+    async def async_get_image(self) -> bytes | None:
+        """Return a JPEG image of the latest keyframe."""
+        async with self._lock:
+            if (latest := self._latest) is None:
+                return None
+            segment, segment_time, max_age = latest
+            if monotonic() - segment_time > max_age:
+                return None
+            if segment is self._image_segment or (
+                self._image is not None
+                and monotonic() - self._image_time < self._min_interval
+            ):
+                return self._image
+            self._image_segment = segment
+            image = await self._hass.async_add_executor_job(
+                self._generate_image, segment.init, segment.parts[0].data
+            )
+            if image is not None:
+                self._image = image
+                self._image_time = monotonic()
+            return self._image
+
+    @staticmethod
+    def _generate_image(init: bytes, data: bytes | memoryview) -> bytes | None:
+        """Decode the first frame of a segment part and encode it as a JPEG."""
+        # Keep import here so that we can import stream integration without installing reqs
+        # pylint: disable=import-outside-toplevel
+        import av
+
+        try:
+            container = av.open(
+                BytesIO(init + data), "r", format=SEGMENT_CONTAINER_FORMAT
+            )
+            try:
+                frame = next(container.decode(video=0))
+            finally:
+                container.close()
+            encoder = av.CodecContext.create("mjpeg", "w")
+            encoder.width = frame.width
+            encoder.height = frame.height
+            encoder.pix_fmt = "yuvj420p"
+            encoder.time_base = Fraction(1, 1)
+            packets = encoder.encode(frame.reformat(format="yuvj420p"))
+            packets.extend(encoder.encode(None))
+        except (av.AVError, StopIteration) as err:
+            _LOGGER.debug("Unable to convert keyframe to an image: %s", err)
+            return None
+        return b"".join(bytes(packet) for packet in packets)
+
+
 class IdleTimer:
     """Invoke a callback after an inactivity timeout.
 
@@ -160,6 +293,11 @@ class StreamOutput:
         """Retrieve all segments."""
         return self._segments
 
+    @property
+    def memory_usage(self) -> int:
+        """Return the number of bytes held by the segments of the output."""
+        return sum(segment.size for segment in self._segments)
+
     async def recv(self) -> bool:
         """Wait for and retrieve the latest segment."""
         await self._event.wait()
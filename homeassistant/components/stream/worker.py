@@ -22,7 +22,7 @@ from .const import (
     SOURCE_TIMEOUT,
     TARGET_PART_DURATION,
 )
-from .core import Part, Segment, StreamOutput
+from .core import KeyFrameConverter, Part, Segment, StreamOutput
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,13 +31,16 @@ class SegmentBuffer:
     """Buffer for writing a sequence of packets to the output as a segment."""
 
     def __init__(
-        self, outputs_callback: Callable[[], Mapping[str, StreamOutput]]
+        self,
+        outputs_callback: Callable[[], Mapping[str, StreamOutput]],
+        keyframe_converter: KeyFrameConverter | None = None,
     ) -> None:
         """Initialize SegmentBuffer."""
         self._stream_id: int = 0
         self._outputs_callback: Callable[
             [], Mapping[str, StreamOutput]
         ] = outputs_callback
+        self._keyframe_converter = keyframe_converter
         # sequence gets incremented before the first segment so the first segment
         # has a sequence number of 0.
         self._sequence = -1
@@ -160,7 +163,7 @@ class SegmentBuffer:
             for stream_output in self._outputs_callback().values():
                 stream_output.put(self._segment)
         else:  # These are the ends of the part segments
-            self._segment.parts.append(
+            self._append_part(
                 Part(
                     duration=float(
                         (packet.dts - self._part_start_dts) * packet.time_base
@@ -175,21 +178,30 @@ class SegmentBuffer:
             self._part_start_dts = packet.dts
             self._part_has_keyframe = False
 
+    def _append_part(self, part: Part) -> None:
+        """Append a part to the current segment."""
+        assert self._segment
+        self._segment.parts.append(part)
+        # The first part of a segment starts with a keyframe
+        if self._keyframe_converter and len(self._segment.parts) == 1:
+            self._keyframe_converter.set_segment(self._segment)
+
     def flush(self, duration: Fraction, packet: av.Packet) -> None:
         """Create a segment from the buffered packets and write to output."""
         self._av_output.close()
         assert self._segment
-        self._segment.duration = float(duration)
+        # Copy the segment once, the parts become views of the copy
+        data = self._memory_file.getvalue()
         # Also flush the part segment (need to close the output above before this)
-        self._segment.parts.append(
+        self._append_part(
             Part(
                 duration=float((packet.dts - self._part_start_dts) * packet.time_base),
                 has_keyframe=self._part_has_keyframe,
-                data=self._memory_file.getbuffer()[
-                    self._segment_last_write_pos :
-                ].tobytes(),
+                data=memoryview(data)[self._segment_last_write_pos :],
             )
         )
+        self._segment.set_data(data)
+        self._segment.duration = float(duration)
         self._memory_file.close()  # We don't need the BytesIO object anymore
 
     def discontinuity(self) -> None:
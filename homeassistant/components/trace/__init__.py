@@ -4,12 +4,15 @@ from __future__ import annotations
 from collections import deque
 import datetime as dt
 from itertools import count
-from typing import Any
+import json
+from typing import Any, Callable
+import zlib
 
 import voluptuous as vol
 
 from homeassistant.core import Context
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_get,
@@ -20,8 +23,15 @@ from homeassistant.helpers.trace import (
 import homeassistant.util.dt as dt_util
 
 from . import websocket_api
-from .const import CONF_STORED_TRACES, DATA_TRACE, DEFAULT_STORED_TRACES
-from .utils import LimitedSizeDict
+from .const import (
+    CONF_MEMORY_BUDGET,
+    CONF_STORED_TRACES,
+    DATA_TRACE,
+    DATA_TRACE_BUDGET,
+    DEFAULT_STORED_TRACES,
+    MAX_VARIABLE_SIZE,
+)
+from .utils import LimitedSizeDict, TraceBudget, truncate_variables
 
 DOMAIN = "trace"
 
@@ -29,10 +39,27 @@ TRACE_CONFIG_SCHEMA = {
     vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
 }
 
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN): vol.Schema(
+            {
+                # Kilobytes of finished traces kept for all scripts and automations
+                vol.Optional(CONF_MEMORY_BUDGET): cv.positive_int,
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
 
 async def async_setup(hass, config):
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    conf = config.get(DOMAIN, {})
+    if CONF_MEMORY_BUDGET in conf:
+        hass.data[DATA_TRACE_BUDGET] = TraceBudget(
+            hass, hass.data[DATA_TRACE], conf[CONF_MEMORY_BUDGET] * 1024
+        )
     websocket_api.async_setup(hass)
     return True
 
@@ -42,11 +69,17 @@ def async_store_trace(hass, trace, stored_traces):
     key = trace.key
     if key[1]:
         traces = hass.data[DATA_TRACE]
+        budget = hass.data.get(DATA_TRACE_BUDGET)
+        if budget is not None:
+            # The number of traces is only limited by the memory budget
+            stored_traces = None
         if key not in traces:
             traces[key] = LimitedSizeDict(size_limit=stored_traces)
         else:
             traces[key].size_limit = stored_traces
         traces[key][trace.run_id] = trace
+        if budget is not None:
+            budget.async_add(trace)
 
 
 class ActionTrace:
@@ -63,6 +96,10 @@ class ActionTrace:
     ) -> None:
         """Container for script trace."""
         self._trace: dict[str, deque[TraceElement]] | None = None
+        # zlib compressed JSON of the trace once it was compacted
+        self._compact_trace: bytes | None = None
+        self._finished_listener: Callable[[ActionTrace], None] | None = None
+        self._last_step: str | None = None
         self._config: dict[str, Any] = config
         self._blueprint_inputs: dict[str, Any] = blueprint_inputs
         self.context: Context = context
@@ -85,25 +122,64 @@ class ActionTrace:
         """Set error."""
         self._error = ex
 
+    def set_finished_listener(self, listener: Callable[[ActionTrace], None]) -> None:
+        """Set a listener called when the trace has finished."""
+        self._finished_listener = listener
+
     def finished(self) -> None:
         """Set finish time."""
         self._timestamp_finish = dt_util.utcnow()
         self._state = "stopped"
         self._script_execution = script_execution_get()
+        if self._finished_listener is not None:
+            self._finished_listener(self)
+
+    def compact(self) -> int:
+        """Serialize the steps of a finished trace and return their size.
+
+        The steps are only kept as compressed JSON with large variables
+        truncated, which drops the references to the variables of the run.
+        The config is shared by all runs and is kept as is. Runs in the
+        executor, the trace can be read while it is compacted.
+        """
+        if self._compact_trace is None:
+            self._last_step = self._get_last_step()
+            traces = self._steps_as_dict()
+            truncate_variables(traces, MAX_VARIABLE_SIZE)
+            self._compact_trace = zlib.compress(
+                json.dumps(traces, cls=ExtendedJSONEncoder).encode(), 1
+            )
+            self._trace = None
+        return len(self._compact_trace)
+
+    def _get_last_step(self) -> str | None:
+        """Return the path of the last step."""
+        # The steps are dropped after the compact trace is set
+        if (trace := self._trace) is None and self._compact_trace is not None:
+            return self._last_step
+        if trace:
+            return list(trace)[-1]
+        return None
+
+    def _steps_as_dict(self) -> dict[str, list[dict[str, Any]]]:
+        """Return dictionary version of the steps."""
+        # The steps are dropped after the compact trace is set
+        if (trace := self._trace) is None and self._compact_trace is not None:
+            return json.loads(zlib.decompress(self._compact_trace))  # type: ignore[no-any-return]
+        traces = {}
+        if trace:
+            for key, trace_list in trace.items():
+                traces[key] = [item.as_dict() for item in trace_list]
+        return traces
 
     def as_dict(self) -> dict[str, Any]:
         """Return dictionary version of this ActionTrace."""
 
         result = self.as_short_dict()
 
-        traces = {}
-        if self._trace:
-            for key, trace_list in self._trace.items():
-                traces[key] = [item.as_dict() for item in trace_list]
-
         result.update(
             {
-                "trace": traces,
+                "trace": self._steps_as_dict(),
                 "config": self._config,
                 "blueprint_inputs": self._blueprint_inputs,
                 "context": self.context,
@@ -116,10 +192,7 @@ class ActionTrace:
     def as_short_dict(self) -> dict[str, Any]:
         """Return a brief dictionary version of this ActionTrace."""
 
-        last_step = None
-
-        if self._trace:
-            last_step = list(self._trace)[-1]
+        last_step = self._get_last_step()
 
         result = {
             "last_step": last_step,
@@ -1,5 +1,12 @@
 """Shared constants for script and automation tracing and debugging."""
 
+CONF_MEMORY_BUDGET = "memory_budget"
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE = "trace"
+DATA_TRACE_BUDGET = "trace_budget"
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+# Variables with a larger JSON size are truncated in compact traces
+MAX_VARIABLE_SIZE = 4096
+# Bytes a running trace counts against the memory budget until a trace of
+# the same script or automation has finished
+DEFAULT_RUNNING_TRACE_SIZE = 1024
@@ -1,5 +1,11 @@
 """Helpers for script and automation tracing and debugging."""
 from collections import OrderedDict
+import json
+
+from homeassistant.core import callback
+from homeassistant.helpers.json import ExtendedJSONEncoder
+
+from .const import DEFAULT_RUNNING_TRACE_SIZE
 
 
 class LimitedSizeDict(OrderedDict):
@@ -21,3 +27,81 @@ class LimitedSizeDict(OrderedDict):
         if self.size_limit is not None:
             while len(self) > self.size_limit:
                 self.popitem(last=False)
+
+
+class TraceBudget:
+    """Keep the size of the stored traces within a memory budget.
+
+    A running trace is counted with the size of the last finished trace of
+    the same script or automation. Finished traces are compacted in the
+    executor and then counted with their compacted size. Traces are evicted
+    in least recently used order across all scripts and automations.
+    """
+
+    def __init__(self, hass, traces, max_size):
+        """Initialize the budget for the traces stored in hass.data."""
+        self.hass = hass
+        self.max_size = max_size
+        self.size = 0
+        self._traces = traces
+        self._sizes = OrderedDict()
+        # Compacted size of the last finished trace of each key
+        self._last_sizes = {}
+
+    @callback
+    def async_add(self, trace):
+        """Count a running trace and evict traces over the budget."""
+        self._async_set_size(
+            (trace.key, trace.run_id),
+            self._last_sizes.get(trace.key, DEFAULT_RUNNING_TRACE_SIZE),
+        )
+        trace.set_finished_listener(self._async_finished)
+
+    @callback
+    def _async_finished(self, trace):
+        """Compact a finished trace that was not evicted."""
+        if (trace.key, trace.run_id) in self._sizes:
+            self.hass.async_create_task(self._async_compact(trace))
+
+    async def _async_compact(self, trace):
+        """Compact a trace in the executor and count its compacted size."""
+        size = await self.hass.async_add_executor_job(trace.compact)
+        self._last_sizes[trace.key] = size
+        if (trace.key, trace.run_id) in self._sizes:
+            self._async_set_size((trace.key, trace.run_id), size)
+
+    @callback
+    def _async_set_size(self, entry, size):
+        """Set the size of a trace and evict traces over the budget."""
+        self.size += size - self._sizes.pop(entry, 0)
+        self._sizes[entry] = size
+
+        # Keep the newest trace even if it is larger than the budget
+        while self.size > self.max_size and len(self._sizes) > 1:
+            (key, run_id), size = self._sizes.popitem(last=False)
+            self.size -= size
+            traces = self._traces.get(key)
+            if traces is not None:
+                traces.pop(run_id, None)
+
+    @callback
+    def async_touch(self, key, run_id):
+        """Mark a trace as recently used."""
+        if (key, run_id) in self._sizes:
+            self._sizes.move_to_end((key, run_id))
+
+
+def truncate_variables(traces, max_size):
+    """Truncate the changed variables with a JSON size above max_size."""
+    for steps in traces.values():
+        for step in steps:
+            variables = step.get("changed_variables")
+            if not variables:
+                continue
+            truncated = {}
+            for name, value in variables.items():
+                dumped = json.dumps(value, cls=ExtendedJSONEncoder)
+                if len(dumped) > max_size:
+                    value = f"{dumped[:max_size]}... (truncated)"
+                truncated[name] = value
+            step["changed_variables"] = truncated
@@ -24,7 +24,7 @@ from homeassistant.helpers.script import (
     debug_stop,
 )
 
-from .const import DATA_TRACE
+from .const import DATA_TRACE, DATA_TRACE_BUDGET
 
 # mypy: allow-untyped-calls, allow-untyped-defs
 
@@ -69,6 +69,10 @@ def websocket_trace_get(hass, connection, msg):
         )
         return
 
+    budget = hass.data.get(DATA_TRACE_BUDGET)
+    if budget is not None:
+        budget.async_touch(key, run_id)
+
     message = websocket_api.messages.result_message(msg["id"], trace)
 
     connection.send_message(
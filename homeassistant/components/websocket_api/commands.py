@@ -12,7 +12,7 @@ from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_READ
 from homeassistant.bootstrap import SIGNAL_BOOTSTRAP_INTEGRATONS
 from homeassistant.components.websocket_api.const import ERR_NOT_FOUND
 from homeassistant.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL
-from homeassistant.core import Context, Event, HomeAssistant, callback
+from homeassistant.core import Context, Event, HomeAssistant, State, callback
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
@@ -21,6 +21,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.helpers import config_validation as cv, entity, template
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import async_get_poll_stats
 from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
@@ -30,6 +31,7 @@ from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import IntegrationNotFound, async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+from homeassistant.util.startup_profile import DATA_STARTUP_PROFILE
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
@@ -42,6 +44,7 @@ def async_register_commands(
 ) -> None:
     """Register commands."""
     async_reg(hass, handle_call_service)
+    async_reg(hass, handle_entity_poll_stats)
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_execute_script)
     async_reg(hass, handle_get_config)
@@ -49,12 +52,15 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_startup_profile)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
+    async_reg(hass, handle_supported_features)
     async_reg(hass, handle_test_condition)
     async_reg(hass, handle_unsubscribe_events)
 
@@ -222,25 +228,79 @@ async def handle_call_service(
         )
 
 
+def _async_get_allowed_states(
+    hass: HomeAssistant, connection: ActiveConnection
+) -> list[State]:
+    """Return the states the user of the connection is allowed to read."""
+    if connection.user.permissions.access_all_entities("read"):
+        return hass.states.async_all()
+    entity_perm = connection.user.permissions.check_entity
+    return [
+        state
+        for state in hass.states.async_all()
+        if entity_perm(state.entity_id, "read")
+    ]
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "get_states"})
 def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
-    if connection.user.permissions.access_all_entities("read"):
-        states = hass.states.async_all()
-    else:
-        entity_perm = connection.user.permissions.check_entity
-        states = [
-            state
-            for state in hass.states.async_all()
-            if entity_perm(state.entity_id, "read")
-        ]
-
+    states = _async_get_allowed_states(hass, connection)
     connection.send_message(messages.result_message(msg["id"], states))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+def handle_subscribe_entities(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe entities command.
+
+    Sends the compressed states of the entities followed by
+    the differences of every state change.
+    """
+    entity_ids = set(msg.get("entity_ids", []))
+
+    @callback
+    def forward_entity_changes(event: Event) -> None:
+        """Forward the state differences of entities to websocket."""
+        entity_id = event.data["entity_id"]
+        if entity_ids and entity_id not in entity_ids:
+            return
+        if not connection.user.permissions.check_entity(entity_id, POLICY_READ):
+            return
+
+        connection.send_message(messages.cached_state_diff_message(msg["id"], event))
+
+    # Do not await between getting the states and listening
+    # for changes or state changes could be missed.
+    states = _async_get_allowed_states(hass, connection)
+    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+        EVENT_STATE_CHANGED, forward_entity_changes
+    )
+    connection.send_message(messages.result_message(msg["id"]))
+    connection.send_message(
+        messages.event_message(
+            msg["id"],
+            {
+                messages.ENTITY_EVENT_ADD: {
+                    state.entity_id: state.as_compressed_state()
+                    for state in states
+                    if not entity_ids or state.entity_id in entity_ids
+                }
+            },
+        )
+    )
+
+
 @decorators.websocket_command({vol.Required("type"): "get_services"})
 @decorators.async_response
 async def handle_get_services(
@@ -305,6 +365,22 @@ async def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/startup_profile"})
+@decorators.require_admin
+def handle_integration_startup_profile(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle startup profile command."""
+    profile = hass.data.get(DATA_STARTUP_PROFILE)
+    if profile is None:
+        connection.send_error(
+            msg["id"], ERR_NOT_FOUND, "Startup profiling is not enabled"
+        )
+        return
+    connection.send_result(msg["id"], profile.as_dict())
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -314,6 +390,21 @@ def handle_ping(
     connection.send_message(pong_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "supported_features",
+        vol.Required("features"): {str: int},
+    }
+)
+def handle_supported_features(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle setting supported features."""
+    connection.supported_features = msg["features"]
+    connection.send_result(msg["id"])
+
+
 @decorators.websocket_command(
     {
         vol.Required("type"): "render_template",
@@ -431,6 +522,16 @@ def handle_entity_source(
     connection.send_result(msg["id"], sources)
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "entity/poll_stats"})
+@decorators.require_admin
+def handle_entity_poll_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle entity poll statistics command."""
+    connection.send_result(msg["id"], async_get_poll_stats(hass))
+
+
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_trigger",
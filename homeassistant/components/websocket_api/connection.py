@@ -36,6 +36,12 @@ class ActiveConnection:
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
+        self.supported_features: dict[str, float] = {}
+
+    @property
+    def can_coalesce(self) -> bool:
+        """Return if the client accepts coalesced messages."""
+        return bool(self.supported_features.get(const.FEATURE_COALESCE_MESSAGES))
 
     def context(self, msg: dict[str, Any]) -> Context:
         """Return a context."""
@@ -17,6 +17,7 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 
 from .auth import AuthPhase, auth_required_message
+from .connection import ActiveConnection
 from .const import (
     CANCELLATION_ERRORS,
     DATA_CONNECTIONS,
@@ -64,6 +65,7 @@ class WebSocketHandler:
         self._to_write: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDING_MSG)
         self._handle_task: asyncio.Task | None = None
         self._writer_task: asyncio.Task | None = None
+        self._connection: ActiveConnection | None = None
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub: Callable[[], None] | None = None
 
@@ -71,14 +73,37 @@ class WebSocketHandler:
         """Write outgoing messages."""
         # Exceptions if Socket disconnected or cancelled by connection handler
         assert self.wsock is not None
+        to_write = self._to_write
         with suppress(RuntimeError, ConnectionResetError, *CANCELLATION_ERRORS):
             while not self.wsock.closed:
-                message = await self._to_write.get()
+                message = await to_write.get()
                 if message is None:
                     break
 
-                self._logger.debug("Sending %s", message)
-                await self.wsock.send_str(message)
+                connection = self._connection
+                if (
+                    to_write.empty()
+                    or connection is None
+                    or not connection.can_coalesce
+                ):
+                    self._logger.debug("Sending %s", message)
+                    await self.wsock.send_str(message)
+                    continue
+
+                # Drain everything pending into a single frame
+                messages = [message]
+                closing = False
+                while not to_write.empty():
+                    if (message := to_write.get_nowait()) is None:
+                        closing = True
+                        break
+                    messages.append(message)
+
+                coalesced_messages = "[" + ",".join(messages) + "]"
+                self._logger.debug("Sending %s", coalesced_messages)
+                await self.wsock.send_str(coalesced_messages)
+                if closing:
+                    break
 
         # Clean up the peaker checker when we shut down the writer
         if self._peak_checker_unsub is not None:
@@ -189,7 +214,7 @@ class WebSocketHandler:
                 raise Disconnect from err
 
             self._logger.debug("Received %s", msg_data)
-            connection = await auth.async_handle(msg_data)
+            connection = self._connection = await auth.async_handle(msg_data)
             self.hass.data[DATA_CONNECTIONS] = (
                 self.hass.data.get(DATA_CONNECTIONS, 0) + 1
             )
@@ -7,7 +7,14 @@ from typing import Any, Final
 
 import voluptuous as vol
 
-from homeassistant.core import Event
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_CONTEXT,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
+from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.util.json import (
     find_paths_unserializable_data,
@@ -31,6 +38,13 @@ BASE_COMMAND_MESSAGE_SCHEMA: Final = vol.Schema({vol.Required("id"): cv.positive
 IDEN_TEMPLATE: Final = "__IDEN__"
 IDEN_JSON_TEMPLATE: Final = '"__IDEN__"'
 
+# Keys of the subscribe_entities events
+ENTITY_EVENT_ADD: Final = "a"
+ENTITY_EVENT_REMOVE: Final = "r"
+ENTITY_EVENT_CHANGE: Final = "c"
+STATE_DIFF_ADDITIONS: Final = "+"
+STATE_DIFF_REMOVALS: Final = "-"
+
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     """Return a success result message."""
@@ -74,6 +88,74 @@ def _cached_event_message(event: Event) -> str:
     return message_to_json(event_message(IDEN_TEMPLATE, event))
 
 
+def cached_state_diff_message(iden: int, event: Event) -> str:
+    """Return an entity event message with the state diff of a state changed event.
+
+    Serialize to json once per message, see cached_event_message.
+    """
+    return _cached_state_diff_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+
+
+@lru_cache(maxsize=128)
+def _cached_state_diff_message(event: Event) -> str:
+    """Cache and serialize the state diff of the event to json.
+
+    The IDEN_TEMPLATE is used which will be replaced
+    with the actual iden in cached_state_diff_message
+    """
+    return message_to_json(event_message(IDEN_TEMPLATE, _state_diff_event(event)))
+
+
+def _state_diff_event(event: Event) -> dict[str, Any]:
+    """Convert a state changed event to a compact entity event."""
+    new_state: State | None = event.data["new_state"]
+    if new_state is None:
+        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
+    old_state: State | None = event.data["old_state"]
+    if old_state is None:
+        return {
+            ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state()}
+        }
+    return {
+        ENTITY_EVENT_CHANGE: {new_state.entity_id: _state_diff(old_state, new_state)}
+    }
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, Any]:
+    """Return the difference between two states of an entity."""
+    additions: dict[str, Any] = {}
+    diff: dict[str, Any] = {STATE_DIFF_ADDITIONS: additions}
+
+    if old_state.state != new_state.state:
+        additions[COMPRESSED_STATE_STATE] = new_state.state
+    if old_state.last_changed != new_state.last_changed:
+        additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed.timestamp()
+    elif old_state.last_updated != new_state.last_updated:
+        additions[COMPRESSED_STATE_LAST_UPDATED] = new_state.last_updated.timestamp()
+
+    new_context = new_state.context
+    if old_state.context != new_context:
+        if new_context.parent_id is None and new_context.user_id is None:
+            additions[COMPRESSED_STATE_CONTEXT] = new_context.id
+        else:
+            additions[COMPRESSED_STATE_CONTEXT] = new_context.as_dict()
+
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    changed_attributes = {
+        key: value
+        for key, value in new_attributes.items()
+        if key not in old_attributes or old_attributes[key] != value
+    }
+    if changed_attributes:
+        additions[COMPRESSED_STATE_ATTRIBUTES] = changed_attributes
+    removed_attributes = [key for key in old_attributes if key not in new_attributes]
+    if removed_attributes:
+        diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: removed_attributes}
+
+    return diff
+
+
 def message_to_json(message: dict[str, Any]) -> str:
     """Serialize a websocket message to json."""
     try:
@@ -32,6 +32,11 @@ from homeassistant.const import (
     ATTR_SECONDS,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_CONTEXT,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
     CONF_UNIT_SYSTEM_IMPERIAL,
     EVENT_CALL_SERVICE,
     EVENT_CORE_CONFIG_UPDATE,
@@ -881,6 +886,8 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_compressed_state",
+        "_has_non_finite_float",
     ]
 
     def __init__(
@@ -916,6 +923,9 @@ class State:
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: dict[str, Collection[Any]] | None = None
+        self._as_compressed_state: dict[str, Any] | None = None
+        # Cached by homeassistant.helpers.json
+        self._has_non_finite_float: bool | None = None
 
     @property
     def name(self) -> str:
@@ -948,6 +958,34 @@ class State:
             }
         return self._as_dict
 
+    def as_compressed_state(self) -> dict[str, Any]:
+        """Return a compact dict representation of the State.
+
+        Async friendly.
+
+        Timestamps are epoch floats, last_updated is omitted when it equals
+        last_changed and the context is only the context id when it has no
+        user or parent.
+        """
+        if self._as_compressed_state is None:
+            context = self.context
+            compressed_state: dict[str, Any] = {
+                COMPRESSED_STATE_STATE: self.state,
+                COMPRESSED_STATE_ATTRIBUTES: dict(self.attributes),
+                COMPRESSED_STATE_CONTEXT: (
+                    context.id
+                    if context.parent_id is None and context.user_id is None
+                    else context.as_dict()
+                ),
+                COMPRESSED_STATE_LAST_CHANGED: self.last_changed.timestamp(),
+            }
+            if self.last_changed != self.last_updated:
+                compressed_state[
+                    COMPRESSED_STATE_LAST_UPDATED
+                ] = self.last_updated.timestamp()
+            self._as_compressed_state = compressed_state
+        return self._as_compressed_state
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Any:
         """Initialize a state from a dict.
@@ -1008,6 +1046,7 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: dict[str, State] = {}
+        self._domain_index: dict[str, dict[str, State]] = {}
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -1031,13 +1070,13 @@ class StateMachine:
             return list(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), ()))
 
-        return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain in domain_filter
-        ]
+        states: list[str] = []
+        for domain in domain_filter:
+            if domain_index := self._domain_index.get(domain):
+                states.extend(domain_index)
+        return states
 
     @callback
     def async_entity_ids_count(
@@ -1051,11 +1090,9 @@ class StateMachine:
             return len(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return len(self._domain_index.get(domain_filter.lower(), ()))
 
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
-        )
+        return sum(len(self._domain_index.get(domain, ())) for domain in domain_filter)
 
     def all(self, domain_filter: str | Iterable | None = None) -> list[State]:
         """Create a list of all states."""
@@ -1073,11 +1110,13 @@ class StateMachine:
             return list(self._states.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), {}).values())
 
-        return [
-            state for state in self._states.values() if state.domain in domain_filter
-        ]
+        states: list[State] = []
+        for domain in domain_filter:
+            if domain_index := self._domain_index.get(domain):
+                states.extend(domain_index.values())
+        return states
 
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
@@ -1120,6 +1159,11 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_index = self._domain_index[old_state.domain]
+        del domain_index[entity_id]
+        if not domain_index:
+            del self._domain_index[old_state.domain]
+
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
@@ -1225,6 +1269,7 @@ class StateMachine:
             old_state is None,
         )
         self._states[entity_id] = state
+        self._domain_index.setdefault(state.domain, {})[entity_id] = state
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -5,8 +5,11 @@ import asyncio
 from collections.abc import Coroutine, Iterable
 from contextvars import ContextVar
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 from logging import Logger
+import random
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable
 
@@ -59,6 +62,10 @@ SLOW_ADD_MIN_TIMEOUT = 500
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
+# The part of the scan interval the polls of the entities are spread over
+POLLING_SPREAD = 0.5
+# Entities that keep overrunning are polled at most this many intervals apart
+MAX_POLL_BACKOFF = 8
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -72,6 +79,54 @@ class AddEntitiesCallback(Protocol):
         """Define add_entities type."""
 
 
+class PollStats:
+    """Latency statistics of the polls of a platform."""
+
+    __slots__ = ("polls", "overruns", "total", "max", "last")
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.polls = 0
+        self.overruns = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last: float | None = None
+
+    def add(self, duration: float) -> None:
+        """Add the duration of a poll."""
+        self.polls += 1
+        self.total += duration
+        self.last = duration
+        if duration > self.max:
+            self.max = duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict, durations are in seconds."""
+        return {
+            "polls": self.polls,
+            "overruns": self.overruns,
+            "last": self.last,
+            "mean": self.total / self.polls if self.polls else None,
+            "max": self.max,
+        }
+
+
+class _EntityPoll:
+    """Polling state of one entity."""
+
+    __slots__ = ("offset", "running", "backoff", "skip", "unsub")
+
+    def __init__(self, offset: float) -> None:
+        """Initialize the polling state."""
+        # Seconds after the start of the scan interval the entity is polled
+        self.offset = offset
+        self.running = False
+        # Poll every backoff scan intervals
+        self.backoff = 1
+        self.skip = 0
+        self.unsub: CALLBACK_TYPE | None = None
+
+
 class EntityPlatform:
     """Manage the entities for a single platform."""
 
@@ -103,7 +158,8 @@ class EntityPlatform:
         self._async_unsub_polling: CALLBACK_TYPE | None = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
-        self._process_updates: asyncio.Lock | None = None
+        self._polls: dict[str, _EntityPoll] = {}
+        self.poll_stats = PollStats()
 
         self.parallel_updates: asyncio.Semaphore | None = None
 
@@ -582,6 +638,9 @@ class EntityPlatform:
         def remove_entity_cb() -> None:
             """Remove entity from entities list."""
             self.entities.pop(entity_id)
+            poll = self._polls.pop(entity_id, None)
+            if poll is not None and poll.unsub is not None:
+                poll.unsub()
 
         entity.async_on_remove(remove_entity_cb)
 
@@ -610,6 +669,10 @@ class EntityPlatform:
         if self._async_unsub_polling is not None:
             self._async_unsub_polling()
             self._async_unsub_polling = None
+        for poll in self._polls.values():
+            if poll.unsub is not None:
+                poll.unsub()
+                poll.unsub = None
 
     async def async_destroy(self) -> None:
         """Destroy an entity platform.
@@ -627,8 +690,7 @@ class EntityPlatform:
         if self._async_unsub_polling is not None and not any(
             entity.should_poll for entity in self.entities.values()
         ):
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+            self.async_unsub_polling()
 
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
@@ -682,31 +744,85 @@ class EntityPlatform:
     async def _update_entity_states(self, now: datetime) -> None:
         """Update the states of all the polling entities.
 
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+        Each entity is polled at its own random offset within the scan
+        interval, so the updates of a platform and of platforms sharing a
+        scan interval do not all start at once. The parallel updates
+        semaphore of the platform still limits how many run at the same time.
 
         This method must be run in the event loop.
         """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
-            self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
-                self.scan_interval,
-            )
-            return
+        tasks = []
+        for entity in self.entities.values():
+            if not entity.should_poll or entity.entity_id is None:
+                continue
+
+            poll = self._polls.get(entity.entity_id)
+            if poll is None:
+                poll = self._polls[entity.entity_id] = _EntityPoll(
+                    self.scan_interval.total_seconds()
+                    * POLLING_SPREAD
+                    * random.random()
+                )
+
+            if not poll.offset:
+                if (task := self._async_start_poll(entity, poll)) is not None:
+                    tasks.append(task)
+            elif poll.unsub is None:
+                poll.unsub = async_call_later(
+                    self.hass,
+                    poll.offset,
+                    partial(self._async_poll_later, entity, poll),
+                )
 
-        async with self._process_updates:
-            tasks = []
-            for entity in self.entities.values():
-                if not entity.should_poll:
-                    continue
-                tasks.append(entity.async_update_ha_state(True))
+        if tasks:
+            await asyncio.gather(*tasks)
 
-            if tasks:
-                await asyncio.gather(*tasks)
+    @callback
+    def _async_poll_later(self, entity: Entity, poll: _EntityPoll, _now: Any) -> None:
+        """Poll an entity at its offset within the scan interval."""
+        poll.unsub = None
+        if (task := self._async_start_poll(entity, poll)) is not None:
+            self.hass.async_create_task(task)
+
+    @callback
+    def _async_start_poll(
+        self, entity: Entity, poll: _EntityPoll
+    ) -> Coroutine[Any, Any, None] | None:
+        """Return the poll of an entity or None if it is skipped.
+
+        Entities that are still updating when they are polled again are
+        polled less often, until an update finishes within the scan interval.
+        """
+        if poll.skip:
+            poll.skip -= 1
+            return None
+
+        if poll.running:
+            self.poll_stats.overruns += 1
+            if poll.backoff == 1:
+                self.logger.warning(
+                    "Updating %s took longer than the scheduled update interval %s",
+                    entity.entity_id,
+                    self.scan_interval,
+                )
+            poll.backoff = min(poll.backoff * 2, MAX_POLL_BACKOFF)
+            poll.skip = poll.backoff - 1
+            return None
+
+        poll.running = True
+        return self._async_poll(entity, poll)
+
+    async def _async_poll(self, entity: Entity, poll: _EntityPoll) -> None:
+        """Poll an entity and record how long it took."""
+        start = timer()
+        try:
+            await entity.async_update_ha_state(True)
+        finally:
+            duration = timer() - start
+            poll.running = False
+            self.poll_stats.add(duration)
+            if duration < self.scan_interval.total_seconds():
+                poll.backoff = 1
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
@@ -737,3 +853,14 @@ def async_get_platforms(
     platforms: list[EntityPlatform] = hass.data[DATA_ENTITY_PLATFORM][integration_name]
 
     return platforms
+
+
+@callback
+def async_get_poll_stats(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
+    """Return the poll statistics of the platforms that polled entities."""
+    return {
+        f"{platform.domain}.{platform.platform_name}": platform.poll_stats.as_dict()
+        for platforms in hass.data.get(DATA_ENTITY_PLATFORM, {}).values()
+        for platform in platforms
+        if platform.poll_stats.polls
+    }
@@ -1,8 +1,37 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
+from __future__ import annotations
+
 from datetime import datetime, timedelta
 import json
+import math
 from typing import Any
 
+from homeassistant.core import Context, Event, State
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects.
+
+    Raise TypeError for other objects.
+    """
+    # States and events are by far the most common objects, check their
+    # exact type before falling back to the slower checks
+    obj_type = type(obj)
+    if obj_type is State or obj_type is Event:
+        return obj.as_dict()
+    if obj_type is datetime or isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, set):
+        return list(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    raise TypeError(f"Object of type {obj_type.__name__} is not JSON serializable")
+
 
 class JSONEncoder(json.JSONEncoder):
     """JSONEncoder that supports Home Assistant objects."""
@@ -12,14 +41,7 @@ class JSONEncoder(json.JSONEncoder):
 
         Hand other objects to the original method.
         """
-        if isinstance(o, datetime):
-            return o.isoformat()
-        if isinstance(o, set):
-            return list(o)
-        if hasattr(o, "as_dict"):
-            return o.as_dict()
-
-        return json.JSONEncoder.default(self, o)
+        return json_encoder_default(o)
 
 
 class ExtendedJSONEncoder(JSONEncoder):
@@ -36,3 +58,92 @@ class ExtendedJSONEncoder(JSONEncoder):
             return super().default(o)
         except TypeError:
             return {"__type": str(type(o)), "repr": repr(o)}
+
+
+_COMPACT_ENCODER = JSONEncoder(allow_nan=False, separators=(",", ":"))
+_STABLE_ENCODER = JSONEncoder()
+
+
+def _has_non_finite_float(data: Any) -> bool:
+    """Return if data contains a float that is NaN or infinite."""
+    to_process = [data]
+    while to_process:
+        obj = to_process.pop()
+        obj_type = type(obj)
+        if obj_type is State:
+            if _state_has_non_finite_float(obj):
+                return True
+        elif obj_type is Event:
+            to_process.append(obj.data)
+        elif obj_type is Context:
+            continue
+        elif isinstance(obj, float):
+            if not math.isfinite(obj):
+                return True
+        elif isinstance(obj, dict):
+            to_process.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            to_process.extend(obj)
+        elif obj is not None and not isinstance(obj, (str, int)):
+            try:
+                to_process.append(json_encoder_default(obj))
+            except TypeError:
+                pass
+    return False
+
+
+def _state_has_non_finite_float(state: State) -> bool:
+    """Return if the attributes of a state contain a NaN or infinite float."""
+    # pylint: disable=protected-access
+    # States are immutable, each state is only checked once
+    if state._has_non_finite_float is None:
+        state._has_non_finite_float = _has_non_finite_float(
+            list(state.attributes.values())
+        )
+    return state._has_non_finite_float
+
+
+def json_bytes(data: Any) -> bytes:
+    """Serialize data to compact JSON bytes.
+
+    Uses orjson when it is installed and falls back to the json module
+    otherwise. NaN and infinite floats raise ValueError with both.
+    """
+    if orjson is not None:
+        try:
+            result: bytes = orjson.dumps(
+                data, default=json_encoder_default, option=orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            # Integers larger than 64 bit or unsupported objects, let the
+            # json module either handle them or raise its own error
+            pass
+        else:
+            # orjson writes NaN and infinite floats as null
+            if b"null" not in result or not _has_non_finite_float(data):
+                return result
+    return _COMPACT_ENCODER.encode(data).encode("utf-8")
+
+
+def json_dumps(data: Any) -> str:
+    """Serialize data to a compact JSON string.
+
+    See json_bytes.
+    """
+    return json_bytes(data).decode("utf-8")
+
+
+def json_dumps_stable(
+    data: Any,
+    *,
+    indent: int | None = None,
+    encoder: type[json.JSONEncoder] | None = JSONEncoder,
+) -> str:
+    """Serialize data exactly like json.dumps with the encoder does.
+
+    Use for JSON that is stored and matched as text, like the event data and
+    state attributes in the recorder database.
+    """
+    if indent is None and encoder is JSONEncoder:
+        return _STABLE_ENCODER.encode(data)
+    return json.dumps(data, indent=indent, cls=encoder)
@@ -28,7 +28,7 @@ DATA_RESTORE_STATE_TASK = "restore_state_task"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
@@ -60,6 +60,30 @@ class StoredState:
         return cls(State.from_dict(json_dict["state"]), last_seen)
 
 
+class RestoreStateStore(Store):
+    """Store of the restore states.
+
+    Version 1 stored a list of stored states, version 2 stores the states by
+    entity id and leaves out the last seen time of the entities that were
+    present when the states were dumped. Both are loaded.
+    """
+
+    async def _async_migrate_func(self, old_version: int, old_data: Any) -> Any:
+        """Migrate to the new version."""
+        return old_data
+
+
+def _stored_state_dicts(stored_states: dict | list) -> list[dict]:
+    """Return the stored state dicts of both storage versions."""
+    if isinstance(stored_states, list):
+        return stored_states
+    dumped_at = stored_states["dumped_at"]
+    return [
+        {"state": item["state"], "last_seen": item.get("last_seen", dumped_at)}
+        for item in stored_states["states"].values()
+    ]
+
+
 class RestoreStateData:
     """Helper class for managing the helper saved data."""
 
@@ -84,7 +108,7 @@ class RestoreStateData:
             else:
                 data.last_states = {
                     item["state"]["entity_id"]: StoredState.from_dict(item)
-                    for item in stored_states
+                    for item in _stored_state_dicts(stored_states)
                     if valid_entity_id(item["state"]["entity_id"])
                 }
                 _LOGGER.debug("Created cache with %s", list(data.last_states))
@@ -103,21 +127,24 @@ class RestoreStateData:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
-        self.store: Store = Store(
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+        self.store: Store = RestoreStateStore(
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, journal=True
         )
         self.last_states: dict[str, StoredState] = {}
         self.entity_ids: set[str] = set()
+        # The state and its JSON compatible dict written by the last dump
+        self._encoded_states: dict[str, tuple[State, dict[str, Any]]] = {}
 
     @callback
-    def async_get_stored_states(self) -> list[StoredState]:
+    def async_get_stored_states(self, now: datetime | None = None) -> list[StoredState]:
         """Get the set of states which should be stored.
 
         This includes the states of all registered entities, as well as the
         stored states from the previous run, which have not been created as
         entities on this run, and have not expired.
         """
-        now = dt_util.utcnow()
+        if now is None:
+            now = dt_util.utcnow()
         all_states = self.hass.states.async_all()
         # Entities currently backed by an entity object
         current_entity_ids = {
@@ -151,16 +178,35 @@ class RestoreStateData:
 
         return stored_states
 
+    @callback
+    def async_get_dump(self) -> dict[str, Any]:
+        """Return the stored states to dump.
+
+        States are only encoded again when they changed since the last dump,
+        so the journal of the store only has to append the changed states.
+        """
+        now = dt_util.utcnow()
+        states = {}
+        encoded_states = {}
+        for stored_state in self.async_get_stored_states(now):
+            state = stored_state.state
+            encoded = self._encoded_states.get(state.entity_id)
+            if encoded is None or encoded[0] is not state:
+                encoded = (state, _encode_complex(state.as_dict()))
+            encoded_states[state.entity_id] = encoded
+            item = {"state": encoded[1]}
+            # Entities present now are seen at the time of the dump
+            if stored_state.last_seen != now:
+                item["last_seen"] = stored_state.last_seen.isoformat()
+            states[state.entity_id] = item
+        self._encoded_states = encoded_states
+        return {"dumped_at": now.isoformat(), "states": states}
+
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(self.async_get_dump())
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import suppress
+import copy
+import json
 from json import JSONEncoder
 import logging
 import os
@@ -13,13 +15,21 @@ from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, c
 from homeassistant.helpers.event import async_call_later
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
+from homeassistant.util.uuid import random_uuid_hex
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
 
 STORAGE_DIR = ".storage"
+JOURNAL_SUFFIX = ".journal"
+# The key in the snapshot identifying the journal that belongs to it
+JOURNAL_KEY = "journal"
 _LOGGER = logging.getLogger(__name__)
 
+_OP_SET = "s"
+_OP_DELETE = "d"
+_OP_TRUNCATE = "t"
+
 
 @bind_hass
 async def async_migrator(
@@ -63,6 +73,194 @@ async def async_migrator(
     return config
 
 
+def _journal_diff(path: list, old: Any, new: Any, ops: list) -> None:
+    """Append the operations turning old into new to ops."""
+    if type(old) is dict and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append([_OP_DELETE, [*path, key]])
+        for key, value in new.items():
+            if key in old:
+                _journal_diff([*path, key], old[key], value, ops)
+            else:
+                ops.append([_OP_SET, [*path, key], value])
+        return
+
+    if type(old) is list and isinstance(new, (list, tuple)):
+        common = min(len(old), len(new))
+        for index in range(common):
+            _journal_diff([*path, index], old[index], new[index], ops)
+        if len(new) < len(old):
+            ops.append([_OP_TRUNCATE, path, len(new)])
+        for index in range(common, len(new)):
+            ops.append([_OP_SET, [*path, index], new[index]])
+        return
+
+    if type(old) is not type(new) or old != new:
+        ops.append([_OP_SET, path, new])
+
+
+def _journal_apply(data: Any, ops: list) -> Any:
+    """Apply journaled operations to data and return the result."""
+    for op in ops:
+        kind, path = op[0], op[1]
+        if kind == _OP_SET and not path:
+            data = op[2]
+            continue
+        parent = data
+        for key in path[:-1]:
+            parent = parent[key]
+        if kind == _OP_SET:
+            if type(parent) is list and path[-1] == len(parent):
+                parent.append(op[2])
+            else:
+                parent[path[-1]] = op[2]
+        elif kind == _OP_DELETE:
+            del parent[path[-1]]
+        else:
+            target = parent[path[-1]] if path else parent
+            del target[op[2] :]
+    return data
+
+
+class StorageJournal:
+    """Journal of the changes made to a stored JSON file since its snapshot.
+
+    Every write appends one line with the differences to the previous
+    write, so the cost of a write grows with the size of the change and
+    not with the size of the data. Once the journal grows larger than the
+    snapshot, the data is written as a new snapshot and the journal starts
+    over.
+
+    The snapshot and the header of the journal share a random token. A
+    journal that does not match its snapshot, because writing a new
+    snapshot was interrupted, is ignored.
+
+    Not thread safe, the journal is only used from the executor while the
+    write lock of the store is held.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        private: bool = False,
+        encoder: type[JSONEncoder] | None = None,
+    ) -> None:
+        """Initialize the journal."""
+        self.path = path
+        self.journal_path = path + JOURNAL_SUFFIX
+        self._private = private
+        self._encoder = encoder
+        # The data as written, None if the next write needs a snapshot
+        self._data: Any = None
+        self._snapshot_size = 0
+        self._journal_size = 0
+
+    def load(self) -> dict | list:
+        """Load the snapshot and replay the journal."""
+        data = json_util.load_json(self.path)
+        token = data.pop(JOURNAL_KEY, None) if isinstance(data, dict) else None
+        self._data = None
+        if not data:
+            return data
+
+        try:
+            with open(self.journal_path, encoding="utf-8") as file:
+                header_line = file.readline()
+                header = json.loads(header_line)
+                if token is None or header.get("snapshot") != token:
+                    _LOGGER.debug("Ignoring outdated journal %s", self.journal_path)
+                    return data
+                journal_size = len(header_line)
+                for line in file:
+                    try:
+                        ops = json.loads(line)
+                    except ValueError:
+                        # Later records depend on this one, write a new snapshot
+                        _LOGGER.warning(
+                            "Skipping corrupt journal records in %s", self.journal_path
+                        )
+                        return data
+                    data = _journal_apply(data, ops)
+                    journal_size += len(line)
+        except FileNotFoundError:
+            return data
+        except ValueError:
+            _LOGGER.warning("Ignoring corrupt journal %s", self.journal_path)
+            return data
+
+        self._data = copy.deepcopy(data)
+        self._snapshot_size = os.path.getsize(self.path)
+        self._journal_size = journal_size
+        return data
+
+    def write(self, data: dict) -> None:
+        """Append the changes since the last write or write a snapshot."""
+        if self._data is None:
+            self._write_snapshot(data)
+            return
+
+        ops: list = []
+        _journal_diff([], self._data, data, ops)
+        if not ops:
+            return
+        try:
+            line = json.dumps(ops, cls=self._encoder) + "\n"
+        except TypeError:
+            # Let the snapshot report where the data is not serializable
+            self._write_snapshot(data)
+            return
+        if self._journal_size + len(line) > self._snapshot_size:
+            self._write_snapshot(data)
+            return
+
+        try:
+            with open(self.journal_path, "a", encoding="utf-8") as file:
+                file.write(line)
+        except OSError as error:
+            _LOGGER.exception("Appending to journal failed: %s", self.journal_path)
+            self._data = None
+            raise json_util.WriteError(error) from error
+        self._data = _journal_apply(self._data, json.loads(line))
+        self._journal_size += len(line)
+
+    def _write_snapshot(self, data: dict) -> None:
+        """Write the data as a new snapshot and start a new journal."""
+        self._data = None
+        token = random_uuid_hex()
+        json_util.save_json(
+            self.path,
+            {**data, JOURNAL_KEY: token},
+            self._private,
+            encoder=self._encoder,
+        )
+        header = json.dumps({"snapshot": token}) + "\n"
+        try:
+            with open(
+                os.open(
+                    self.journal_path,
+                    os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                    0o600 if self._private else 0o644,
+                ),
+                "w",
+                encoding="utf-8",
+            ) as file:
+                file.write(header)
+        except OSError as error:
+            _LOGGER.exception("Starting journal failed: %s", self.journal_path)
+            raise json_util.WriteError(error) from error
+        self._data = json.loads(json.dumps(data, cls=self._encoder))
+        self._snapshot_size = os.path.getsize(self.path)
+        self._journal_size = len(header)
+
+    def remove(self) -> None:
+        """Remove the snapshot and the journal."""
+        self._data = None
+        for path in (self.path, self.journal_path):
+            with suppress(FileNotFoundError):
+                os.unlink(path)
+
+
 @bind_hass
 class Store:
     """Class to help storing data."""
@@ -75,8 +273,13 @@ class Store:
         private: bool = False,
         *,
         encoder: type[JSONEncoder] | None = None,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        Stores written often can use a journal, so writes only append the
+        changes instead of rewriting the whole file.
+        """
         self.version = version
         self.key = key
         self.hass = hass
@@ -87,6 +290,9 @@ class Store:
         self._write_lock = asyncio.Lock()
         self._load_task: asyncio.Future | None = None
         self._encoder = encoder
+        self._journal: StorageJournal | None = None
+        if journal:
+            self._journal = StorageJournal(self.path, private, encoder)
 
     @property
     def path(self):
@@ -124,9 +330,7 @@ class Store:
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
         else:
-            data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
-            )
+            data = await self.hass.async_add_executor_job(self._load_data, self.path)
 
             if data == {}:
                 return None
@@ -143,6 +347,12 @@ class Store:
 
         return stored
 
+    def _load_data(self, path: str) -> dict | list:
+        """Load the data from disk."""
+        if self._journal is not None:
+            return self._journal.load()
+        return json_util.load_json(path)
+
     async def async_save(self, data: dict | list) -> None:
         """Save data."""
         self._data = {"version": self.version, "key": self.key, "data": data}
@@ -233,6 +443,9 @@ class Store:
             os.makedirs(os.path.dirname(path))
 
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
+        if self._journal is not None:
+            self._journal.write(data)
+            return
         json_util.save_json(path, data, self._private, encoder=self._encoder)
 
     async def _async_migrate_func(self, old_version, old_data):
@@ -244,5 +457,9 @@ class Store:
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
 
+        if self._journal is not None:
+            await self.hass.async_add_executor_job(self._journal.remove)
+            return
+
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
@@ -17,9 +17,9 @@ from operator import attrgetter
 import random
 import re
 import sys
+from types import CodeType
 from typing import Any, Callable, cast
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
 from jinja2 import contextfunction, pass_context
@@ -48,6 +48,7 @@ from homeassistant.helpers.typing import TemplateVarsType
 from homeassistant.loader import bind_hass
 from homeassistant.util import convert, dt as dt_util, location as loc_util
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.lru import LRU
 from homeassistant.util.thread import ThreadWithException
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -61,6 +62,9 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 
+# The number of compiled templates kept by the compiled code cache
+COMPILED_CODE_CACHE_SIZE = 2048
+
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -1397,6 +1401,34 @@ class LoggingUndefined(jinja2.Undefined):
         return super().__bool__()
 
 
+class CompiledCodeCache:
+    """Compiled code of templates shared by all template environments.
+
+    Identical templates of automations, template entities and integrations
+    are compiled once per process, also across reloads.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize the cache."""
+        self._codes: LRU = LRU(size)
+
+    def get(self, kind: str, source: str) -> CodeType | None:
+        """Return the compiled code of a template."""
+        code: CodeType | None = self._codes.get((kind, source))
+        return code
+
+    def set(self, kind: str, source: str, code: CodeType) -> None:
+        """Store the compiled code of a template."""
+        self._codes[(kind, source)] = code
+
+    def clear(self) -> None:
+        """Remove all compiled code."""
+        self._codes.clear()
+
+
+COMPILED_CODE = CompiledCodeCache(COMPILED_CODE_CACHE_SIZE)
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -1408,7 +1440,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.hass = hass
-        self.template_cache = weakref.WeakValueDictionary()
+        if limited:
+            self.kind = "limited"
+        elif strict:
+            self.kind = "strict"
+        else:
+            self.kind = "normal"
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1554,10 +1591,11 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        cached = self.template_cache.get(source)
+        cached = COMPILED_CODE.get(self.kind, source)
 
         if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
+            cached = super().compile(source)
+            COMPILED_CODE.set(self.kind, source, cached)
 
         return cached
 
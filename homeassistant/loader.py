@@ -12,6 +12,7 @@ import functools as ft
 import importlib
 import json
 import logging
+import os
 import pathlib
 import sys
 from types import ModuleType
@@ -28,6 +29,7 @@ from homeassistant.generated.mqtt import MQTT
 from homeassistant.generated.ssdp import SSDP
 from homeassistant.generated.zeroconf import HOMEKIT, ZEROCONF
 from homeassistant.util.async_ import gather_with_concurrency
+from homeassistant.util.startup_profile import PHASE_IMPORT, startup_phase
 
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
@@ -44,6 +46,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_INDEX = "manifest_index"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -98,6 +101,92 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+def _mtime(path: str) -> int | None:
+    """Return the modification time of a path or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class ManifestIndex:
+    """Index of parsed manifests, directory listings and dependencies.
+
+    Every entry records the modification time of the file or directory it
+    was read from, so an index persisted by an earlier run is reused for the
+    files that did not change. The resolved dependencies are only reused
+    when nothing changed at all.
+    """
+
+    def __init__(self, data: dict[str, Any] | None = None) -> None:
+        """Initialize the index from its persisted data."""
+        data = data or {}
+        self.manifests: dict[str, dict[str, Any]] = data.get("manifests", {})
+        self.directories: dict[str, dict[str, Any]] = data.get("directories", {})
+        self.dependencies: dict[str, list[str]] = data.get("dependencies", {})
+        self.dirty = False
+
+    def validate(self) -> None:
+        """Drop the entries of files and directories that changed.
+
+        Does blocking I/O, must be run in the executor.
+        """
+        for entries in (self.manifests, self.directories):
+            for path, entry in list(entries.items()):
+                if _mtime(path) != entry["mtime"]:
+                    del entries[path]
+                    self.dirty = True
+        if self.dirty:
+            self.dependencies.clear()
+
+    def get_manifest(self, manifest_path: pathlib.Path) -> Manifest | None:
+        """Return a copy of a cached manifest."""
+        if (entry := self.manifests.get(str(manifest_path))) is None:
+            return None
+        return cast(Manifest, dict(entry["manifest"]))
+
+    def add_manifest(self, manifest_path: pathlib.Path, manifest: Manifest) -> None:
+        """Add a manifest read from disk."""
+        self.manifests[str(manifest_path)] = {
+            "mtime": _mtime(str(manifest_path)),
+            "manifest": dict(manifest),
+        }
+        self.dirty = True
+
+    def get_sub_directories(self, path: str) -> list[pathlib.Path]:
+        """Return the sub directories of a path, listing it if not cached."""
+        if (entry := self.directories.get(path)) is not None:
+            return [pathlib.Path(path) / name for name in entry["names"]]
+        mtime = _mtime(path)
+        dirs = [entry for entry in pathlib.Path(path).iterdir() if entry.is_dir()]
+        self.directories[path] = {
+            "mtime": mtime,
+            "names": [entry.name for entry in dirs],
+        }
+        self.dirty = True
+        return dirs
+
+    def get_dependencies(self, domain: str) -> set[str] | None:
+        """Return the cached dependencies of an integration."""
+        if (dependencies := self.dependencies.get(domain)) is None:
+            return None
+        return set(dependencies)
+
+    def add_dependencies(self, domain: str, dependencies: set[str]) -> None:
+        """Add the resolved dependencies of an integration."""
+        self.dependencies[domain] = sorted(dependencies)
+        self.dirty = True
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        self.dirty = False
+        return {
+            "manifests": dict(self.manifests),
+            "directories": dict(self.directories),
+            "dependencies": dict(self.dependencies),
+        }
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -110,6 +199,25 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
+    index: ManifestIndex | None = hass.data.get(DATA_MANIFEST_INDEX)
+
+    if index is not None:
+        # Resolved from the index, one job avoids the executor overhead
+        def resolve_custom_components() -> list[Integration | None]:
+            """Resolve all custom integrations."""
+            return [
+                Integration.resolve_from_root(hass, custom_components, entry.name)
+                for path in custom_components.__path__
+                for entry in index.get_sub_directories(path)  # type: ignore[union-attr]
+            ]
+
+        integrations = await hass.async_add_executor_job(resolve_custom_components)
+        return {
+            integration.domain: integration
+            for integration in integrations
+            if integration is not None
+        }
+
     def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
         """Return all sub directories in a set of paths."""
         return [
@@ -276,19 +384,28 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        index: ManifestIndex | None = hass.data.get(DATA_MANIFEST_INDEX)
         for base in root_module.__path__:  # type: ignore
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
-            try:
-                manifest = json.loads(manifest_path.read_text())
-            except ValueError as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
+            if index is not None and (
+                cached_manifest := index.get_manifest(manifest_path)
+            ):
+                manifest = cached_manifest
+            elif not manifest_path.is_file():
                 continue
+            else:
+                try:
+                    manifest = json.loads(manifest_path.read_text())
+                except ValueError as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s",
+                        manifest_path,
+                        err,
+                    )
+                    continue
+                if index is not None:
+                    index.add_manifest(manifest_path, manifest)
 
             integration = cls(
                 hass,
@@ -339,9 +456,15 @@ class Integration:
         self.manifest = manifest
         manifest["is_built_in"] = self.is_built_in
 
+        index: ManifestIndex | None = hass.data.get(DATA_MANIFEST_INDEX)
         if self.dependencies:
             self._all_dependencies_resolved: bool | None = None
             self._all_dependencies: set[str] | None = None
+            if index is not None and (
+                dependencies := index.get_dependencies(self.domain)
+            ):
+                self._all_dependencies_resolved = True
+                self._all_dependencies = dependencies
         else:
             self._all_dependencies_resolved = True
             self._all_dependencies = set()
@@ -465,6 +588,9 @@ class Integration:
             dependencies.discard(self.domain)
             self._all_dependencies = dependencies
             self._all_dependencies_resolved = True
+            index: ManifestIndex | None = self.hass.data.get(DATA_MANIFEST_INDEX)
+            if index is not None:
+                index.add_dependencies(self.domain, dependencies)
         except IntegrationNotFound as err:
             _LOGGER.error(
                 "Unable to resolve dependencies for %s:  we are unable to resolve (sub)dependency %s",
@@ -487,7 +613,10 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
-            cache[self.domain] = importlib.import_module(self.pkg_path)
+            with startup_phase(
+                self.hass, self.domain, PHASE_IMPORT, f"import {self.domain}"
+            ):
+                cache[self.domain] = importlib.import_module(self.pkg_path)
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -495,7 +624,10 @@ class Integration:
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         full_name = f"{self.domain}.{platform_name}"
         if full_name not in cache:
-            cache[full_name] = self._import_platform(platform_name)
+            with startup_phase(
+                self.hass, self.domain, PHASE_IMPORT, f"import {full_name}"
+            ):
+                cache[full_name] = self._import_platform(platform_name)
         return cache[full_name]  # type: ignore
 
     def _import_platform(self, platform_name: str) -> ModuleType:
@@ -604,7 +736,13 @@ def _load_file(
 
     for path in (f"{base}.{comp_or_platform}" for base in base_paths):
         try:
-            module = importlib.import_module(path)
+            with startup_phase(
+                hass,
+                comp_or_platform.split(".")[0],
+                PHASE_IMPORT,
+                f"import {comp_or_platform}",
+            ):
+                module = importlib.import_module(path)
 
             # In Python 3 you can import files from directories that do not
             # contain the file __init__.py. A directory is a valid module if
@@ -11,6 +11,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.loader import Integration, IntegrationNotFound, async_get_integration
 import homeassistant.util.package as pkg_util
+from homeassistant.util.startup_profile import PHASE_REQUIREMENTS, startup_phase
 
 # mypy: disallow-any-generics
 
@@ -149,18 +150,19 @@ async def async_process_requirements(
     kwargs = pip_kwargs(hass.config.config_dir)
 
     async with pip_lock:
-        for req in requirements:
-            if pkg_util.is_installed(req):
-                continue
+        with startup_phase(hass, name, PHASE_REQUIREMENTS):
+            for req in requirements:
+                if pkg_util.is_installed(req):
+                    continue
 
-            def _install(req: str, kwargs: dict[str, Any]) -> bool:
-                """Install requirement."""
-                return pkg_util.install_package(req, **kwargs)
+                def _install(req: str, kwargs: dict[str, Any]) -> bool:
+                    """Install requirement."""
+                    return pkg_util.install_package(req, **kwargs)
 
-            ret = await hass.async_add_executor_job(_install, req, kwargs)
+                ret = await hass.async_add_executor_job(_install, req, kwargs)
 
-            if not ret:
-                raise RequirementsNotFound(name, [req])
+                if not ret:
+                    raise RequirementsNotFound(name, [req])
 
 
 def pip_kwargs(config_dir: str | None) -> dict[str, Any]:
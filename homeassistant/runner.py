@@ -44,6 +44,7 @@ class RuntimeConfig:
 
     debug: bool = False
     open_ui: bool = False
+    profile_startup: bool = False
 
 
 class HassEventLoopPolicy(asyncio.DefaultEventLoopPolicy):  # type: ignore[valid-type,misc]
@@ -390,6 +390,98 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def json_serialize_states_json_encoder(hass):
+    """Serialize million states with the json module and JSONEncoder."""
+    states = [
+        core.State("light.kitchen", "on", {"friendly_name": "Kitchen Lights"})
+        for _ in range(10 ** 6)
+    ]
+
+    start = timer()
+    json.dumps(states, cls=JSONEncoder, allow_nan=False)
+    return timer() - start
+
+
+@benchmark
+async def json_serialize_events(hass):
+    """Serialize 100k state changed event messages with websocket default encoder."""
+    messages = _state_changed_event_messages()
+
+    start = timer()
+    for message in messages:
+        JSON_DUMP(message)
+    return timer() - start
+
+
+@benchmark
+async def json_serialize_events_json_encoder(hass):
+    """Serialize 100k state changed event messages with the json module and JSONEncoder."""
+    messages = _state_changed_event_messages()
+
+    start = timer()
+    for message in messages:
+        json.dumps(message, cls=JSONEncoder, allow_nan=False)
+    return timer() - start
+
+
+def _state_changed_event_messages():
+    """Return 100k websocket messages of state changed events."""
+    messages = []
+    for idx in range(10 ** 5):
+        entity_id = f"sensor.temperature_{idx}"
+        attributes = {"unit_of_measurement": "°C", "friendly_name": "Temperature"}
+        event = core.Event(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": entity_id,
+                "old_state": core.State(entity_id, "20.5", attributes),
+                "new_state": core.State(entity_id, "21.0", attributes),
+            },
+        )
+        messages.append({"id": 1, "type": "event", "event": event})
+    return messages
+
+
+@benchmark
+async def mqtt_dispatch(hass):
+    """Dispatch 100k MQTT messages to 1500 subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.mqtt.trie import TopicTrie
+
+    count = 0
+    messages_to_dispatch = 10 ** 5
+
+    @core.callback
+    def listener(_):
+        """Handle message."""
+        nonlocal count
+        count += 1
+
+    job = core.HassJob(listener)
+    subscriptions = TopicTrie()
+    for idx in range(500):
+        subscriptions.add(f"zigbee2mqtt/device_{idx}", job)
+        subscriptions.add(f"zigbee2mqtt/device_{idx}/availability", job)
+        subscriptions.add(f"tele/tasmota_{idx}/+", job)
+    subscriptions.add("homeassistant/+/+/config", job)
+    subscriptions.add("homeassistant/+/+/+/config", job)
+    topics = [f"tele/tasmota_{idx}/SENSOR" for idx in range(500)] + [
+        f"zigbee2mqtt/device_{idx}" for idx in range(500)
+    ]
+    size = len(topics)
+
+    start = timer()
+
+    for i in range(messages_to_dispatch):
+        for matched_job in subscriptions.match(topics[i % size]):
+            hass.async_run_hass_job(matched_job, None)
+
+    assert count == messages_to_dispatch
+
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
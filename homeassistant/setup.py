@@ -19,6 +19,13 @@ from homeassistant.const import (
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util, ensure_unique_string
+from homeassistant.util.startup_profile import (
+    PHASE_CONFIG,
+    PHASE_CONFIG_ENTRIES,
+    PHASE_DEPENDENCIES,
+    PHASE_SETUP,
+    startup_phase,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -140,9 +147,10 @@ async def _async_process_dependencies(
         )
 
     async with hass.timeout.async_freeze(integration.domain):
-        results = await asyncio.gather(
-            *dependencies_tasks.values(), *after_dependencies_tasks.values()
-        )
+        with startup_phase(hass, integration.domain, PHASE_DEPENDENCIES):
+            results = await asyncio.gather(
+                *dependencies_tasks.values(), *after_dependencies_tasks.values()
+            )
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -205,9 +213,10 @@ async def _async_setup_component(
         _LOGGER.exception("Setup failed for %s: unknown error", domain)
         return False
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with startup_phase(hass, domain, PHASE_CONFIG):
+        processed_config = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
 
     if processed_config is None:
         log_error("Invalid config.", integration.documentation)
@@ -278,12 +287,13 @@ async def _async_setup_component(
         await asyncio.sleep(0)
         await hass.config_entries.flow.async_wait_init_flow_finish(domain)
 
-        await asyncio.gather(
-            *[
-                entry.async_setup(hass, integration=integration)
-                for entry in hass.config_entries.async_entries(domain)
-            ]
-        )
+        with startup_phase(hass, domain, PHASE_CONFIG_ENTRIES):
+            await asyncio.gather(
+                *[
+                    entry.async_setup(hass, integration=integration)
+                    for entry in hass.config_entries.async_entries(domain)
+                ]
+            )
 
         hass.config.components.add(domain)
 
@@ -463,7 +473,14 @@ def async_start_setup(hass: core.HomeAssistant, components: Iterable) -> Generat
         unique_components[unique] = domain
         setup_started[unique] = started
 
-    yield
+    with contextlib.ExitStack() as stack:
+        for domain in unique_components.values():
+            stack.enter_context(
+                startup_phase(
+                    hass, domain.split(".")[-1], PHASE_SETUP, f"setup {domain}"
+                )
+            )
+        yield
 
     setup_time = hass.data.setdefault(DATA_SETUP_TIME, {})
     time_taken = dt_util.utcnow() - started
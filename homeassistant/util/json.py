@@ -10,6 +10,7 @@ from typing import Any, Callable
 
 from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import json_dumps_stable
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,7 +55,7 @@ def save_json(
     Returns True on success.
     """
     try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
+        json_data = json_dumps_stable(data, indent=4, encoder=encoder)
     except TypeError as error:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
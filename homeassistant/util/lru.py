@@ -0,0 +1,35 @@
+"""A mapping that evicts the least recently used item when full."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+
+class LRU(OrderedDict):
+    """OrderedDict limited in size that evicts the least recently used item."""
+
+    def __init__(self, size_limit: int) -> None:
+        """Initialize OrderedDict limited in size."""
+        super().__init__()
+        self.size_limit = size_limit
+
+    def __getitem__(self, key: Any) -> Any:
+        """Get item and mark it as recently used."""
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Set item and evict the least recently used item if needed."""
+        if key in self:
+            self.move_to_end(key)
+        super().__setitem__(key, value)
+        if len(self) > self.size_limit:
+            del self[next(iter(self))]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get item and mark it as recently used."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
@@ -0,0 +1,112 @@
+"""Record a timeline of the startup in the Chrome trace event format."""
+from __future__ import annotations
+
+from collections.abc import Generator
+from contextlib import contextmanager
+import os
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+DATA_STARTUP_PROFILE = "startup_profile"
+
+PHASE_CONFIG = "config"
+PHASE_CONFIG_ENTRIES = "config_entries"
+PHASE_DEPENDENCIES = "dependencies"
+PHASE_IMPORT = "import"
+PHASE_REQUIREMENTS = "requirements"
+PHASE_SETUP = "setup"
+PHASE_STAGE = "stage"
+
+
+class StartupProfile:
+    """Collect the phases of setting up each integration.
+
+    Each integration gets its own track in the timeline. The trace can be
+    opened with chrome://tracing or https://ui.perfetto.dev.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the profile."""
+        self.finished = False
+        self._start = perf_counter()
+        self._pid = os.getpid()
+        self._tracks: dict[str, int] = {}
+        self._events: list[dict[str, Any]] = []
+
+    def _track(self, name: str) -> int:
+        """Return the id of the track of an integration."""
+        track = self._tracks.get(name)
+        if track is None:
+            track = self._tracks[name] = len(self._tracks) + 1
+        return track
+
+    @contextmanager
+    def phase(
+        self, integration: str, phase: str, name: str | None = None
+    ) -> Generator[None, None, None]:
+        """Record the time spent in a phase of setting up an integration."""
+        if self.finished:
+            yield
+            return
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            end = perf_counter()
+            self._events.append(
+                {
+                    "name": name or phase,
+                    "cat": phase,
+                    "ph": "X",
+                    "ts": round((start - self._start) * 1_000_000),
+                    "dur": round((end - start) * 1_000_000),
+                    "pid": self._pid,
+                    "tid": self._track(integration),
+                }
+            )
+
+    def finish(self) -> None:
+        """Stop recording, startup has finished."""
+        self.finished = True
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the profile in the Chrome trace event format."""
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self._pid,
+                "tid": track,
+                "args": {"name": integration},
+            }
+            for integration, track in self._tracks.items()
+        ]
+        return {
+            "traceEvents": [
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": self._pid,
+                    "args": {"name": "Home Assistant startup"},
+                },
+                *metadata,
+                *self._events,
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+
+@contextmanager
+def startup_phase(
+    hass: HomeAssistant, integration: str, phase: str, name: str | None = None
+) -> Generator[None, None, None]:
+    """Record a startup phase if profiling the startup is enabled."""
+    profile: StartupProfile | None = hass.data.get(DATA_STARTUP_PROFILE)
+    if profile is None:
+        yield
+        return
+    with profile.phase(integration, phase, name):
+        yield
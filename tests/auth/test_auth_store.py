@@ -216,6 +216,38 @@ async def test_loading_empty_data(hass, hass_storage):
     assert len(users) == 0
 
 
+async def test_refresh_token_index(hass, hass_storage):
+    """Test refresh tokens are found by id after creating and removing them."""
+    store = auth_store.AuthStore(hass)
+    user = await store.async_create_user("Paulus")
+    other_user = await store.async_create_user("Other")
+    token = await store.async_create_refresh_token(user, "http://localhost:8123/")
+    other_token = await store.async_create_refresh_token(
+        other_user, "http://localhost:8123/"
+    )
+    assert await store.async_get_refresh_token(token.id) is token
+    assert await store.async_get_refresh_token_by_token(token.token) is token
+
+    await store.async_remove_refresh_token(token)
+    assert await store.async_get_refresh_token(token.id) is None
+    assert token.id not in user.refresh_tokens
+
+    await store.async_remove_user(other_user)
+    assert await store.async_get_refresh_token(other_token.id) is None
+
+    # The index is rebuilt when loading the tokens
+    token = await store.async_create_refresh_token(user, "http://localhost:8123/")
+    await hass.async_block_till_done()
+    hass_storage[auth_store.STORAGE_KEY] = {
+        "version": auth_store.STORAGE_VERSION,
+        "data": store._data_to_save(),
+    }
+    store = auth_store.AuthStore(hass)
+    loaded = await store.async_get_refresh_token(token.id)
+    assert loaded.token == token.token
+    assert loaded.user.id == user.id
+
+
 async def test_system_groups_store_id_and_name(hass, hass_storage):
     """Test that for system groups we store the ID and name.
 
@@ -1,5 +1,6 @@
 """Tests for the Home Assistant auth module."""
 from datetime import timedelta
+import time
 from unittest.mock import Mock, patch
 
 import jwt
@@ -360,6 +361,41 @@ async def test_cannot_retrieve_expired_access_token(hass):
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_verified_access_token_cache(hass):
+    """Test verified access tokens are cached until expired or revoked."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch("homeassistant.auth.jwt.decode", side_effect=AssertionError):
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    # Expired, the token is verified again
+    with patch(
+        "homeassistant.auth.time.time",
+        return_value=time.time()
+        + auth_const.ACCESS_TOKEN_EXPIRATION.total_seconds()
+        + auth_const.ACCESS_TOKEN_LEEWAY
+        + 1,
+    ), patch(
+        "homeassistant.auth.jwt.decode",
+        side_effect=jwt.ExpiredSignatureError,
+    ) as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is None
+    assert len(mock_decode.mock_calls) == 1
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    await manager.async_deactivate_user(user)
+    assert await manager.async_validate_access_token(access_token) is None
+
+    await manager.async_activate_user(user)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
 async def test_generating_system_user(hass):
     """Test that we can add a system user."""
     events = []
@@ -2,12 +2,16 @@
 import asyncio
 import base64
 import io
-from unittest.mock import Mock, PropertyMock, mock_open, patch
+from unittest.mock import AsyncMock, Mock, PropertyMock, mock_open, patch
 
 import pytest
 
 from homeassistant.components import camera
-from homeassistant.components.camera.const import DOMAIN, PREF_PRELOAD_STREAM
+from homeassistant.components.camera.const import (
+    DATA_STILL_STREAMS,
+    DOMAIN,
+    PREF_PRELOAD_STREAM,
+)
 from homeassistant.components.camera.prefs import CameraEntityPreferences
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.config import async_process_ha_core_config
@@ -75,6 +79,35 @@ async def test_get_image_from_camera(hass, image_mock_url):
     assert image.content == b"Test"
 
 
+async def test_get_image_from_stream(hass, mock_camera, hass_client):
+    """Grab an image from the running stream of a camera."""
+    demo_camera = hass.data[DOMAIN].get_entity("camera.demo_camera")
+    demo_camera.stream = Mock(async_get_image=AsyncMock(return_value=b"Keyframe"))
+
+    image = await camera.async_get_image(hass, "camera.demo_camera")
+    assert image.content == b"Keyframe"
+    assert image.content_type == "image/jpeg"
+
+    client = await hass_client()
+    response = await client.get("/api/camera_proxy/camera.demo_camera")
+    assert response.status == HTTP_OK
+    assert await response.read() == b"Keyframe"
+
+    # Fall back to the camera when the stream has no image
+    demo_camera.stream.async_get_image.return_value = None
+    image = await camera.async_get_image(hass, "camera.demo_camera")
+    assert image.content == b"Test"
+
+    with patch(
+        "homeassistant.components.camera.Camera.use_stream_for_stills",
+        new_callable=PropertyMock,
+        return_value=False,
+    ):
+        demo_camera.stream.async_get_image.return_value = b"Keyframe"
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+    assert image.content == b"Test"
+
+
 async def test_get_stream_source_from_camera(hass, mock_camera):
     """Fetch stream source from camera entity."""
 
@@ -375,3 +408,80 @@ async def test_camera_proxy_stream(hass, mock_camera, hass_client):
     ):
         response = await client.get("/api/camera_proxy_stream/camera.demo_camera")
         assert response.status == HTTP_BAD_GATEWAY
+
+
+async def test_still_stream_shared(hass, mock_camera, hass_client):
+    """Test viewers of a still stream share the fetched images."""
+    images = asyncio.Queue()
+    calls = 0
+
+    async def camera_image(self):
+        """Return the next image."""
+        nonlocal calls
+        calls += 1
+        return await images.get()
+
+    def chunk(image):
+        """Return the multipart chunk of an image."""
+        return (
+            b"--frameboundary\r\nContent-Type: image/jpeg\r\n"
+            + f"Content-Length: {len(image)}\r\n\r\n".encode()
+            + image
+            + b"\r\n"
+        )
+
+    url = "/api/camera_proxy_stream/camera.demo_camera?interval=0.5"
+    client = await hass_client()
+    images.put_nowait(b"first")
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        camera_image,
+    ):
+        response1 = await client.get(url)
+        assert response1.status == HTTP_OK
+        expected = chunk(b"first") * 2
+        assert await response1.content.readexactly(len(expected)) == expected
+
+        # A new viewer gets the current image without fetching it again
+        response2 = await client.get(url)
+        assert await response2.content.readexactly(len(expected)) == expected
+        streams = hass.data[DATA_STILL_STREAMS]
+        assert len(streams) == 1
+        stream = next(iter(streams.values()))
+        assert stream.viewers == 2
+
+        images.put_nowait(b"second")
+        expected = chunk(b"second")
+        assert await response1.content.readexactly(len(expected)) == expected
+        assert await response2.content.readexactly(len(expected)) == expected
+        assert calls == 2
+
+        response1.close()
+        response2.close()
+        for _ in range(10):
+            if stream.closed:
+                break
+            await asyncio.sleep(0.1)
+
+    # Fetching stops when the last viewer leaves
+    assert stream.closed
+    assert stream.viewers == 0
+    assert hass.data[DATA_STILL_STREAMS] == {}
+
+
+async def test_still_stream_ends_without_image(hass, mock_camera, hass_client):
+    """Test the still stream ends for all viewers when there is no image."""
+    client = await hass_client()
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=None,
+    ):
+        response = await client.get(
+            "/api/camera_proxy_stream/camera.demo_camera?interval=0.5"
+        )
+        assert response.status == HTTP_OK
+        assert await response.read() == b""
+
+    assert hass.data[DATA_STILL_STREAMS] == {}
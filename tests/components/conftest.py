@@ -22,3 +22,15 @@ def prevent_io():
         return_value=[],
     ):
         yield
+
+
+@pytest.fixture(autouse=True)
+def polling_spread():
+    """Poll all entities at the start of the scan interval.
+
+    Integration tests move the time forward by the scan interval and expect
+    the entities to be polled. The spread is tested in the entity platform
+    tests.
+    """
+    with patch("homeassistant.helpers.entity_platform.POLLING_SPREAD", 0):
+        yield
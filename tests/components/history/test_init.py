@@ -612,6 +612,41 @@ async def test_fetch_period_api_with_minimal_response(hass, hass_client):
     assert response.status == 200
 
 
+async def test_fetch_period_api_with_max_points(hass, hass_client):
+    """Test the fetch period view for history with max_points."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    for value in range(20):
+        hass.states.async_set("sensor.power", value, {"unit_of_measurement": "W"})
+        await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    end = start + timedelta(hours=1)
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}",
+        params={"end_time": end.isoformat(), "max_points": 10},
+    )
+    assert response.status == 200
+    response_json = await response.json()
+    assert len(response_json) == 1
+    states = response_json[0]
+    # All states are recorded in the first bucket, its first point is a full state
+    assert len(states) == 1
+    assert states[0]["entity_id"] == "sensor.power"
+    assert states[0]["state"] == "9.5"
+    assert states[0]["attributes"] == {"unit_of_measurement": "W"}
+
+    for params in ({"max_points": 0}, {"resolution": "x"}, {"resolution": -1}):
+        response = await client.get(
+            f"/api/history/period/{start.isoformat()}", params=params
+        )
+        assert response.status == 400
+
+
 async def test_fetch_period_api_with_no_timestamp(hass, hass_client):
     """Test the fetch period view for history with no timestamp."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -897,6 +932,56 @@ async def test_statistics_during_period(hass, hass_ws_client):
     }
 
 
+async def test_statistics_during_period_5minute(hass, hass_ws_client):
+    """Test statistics_during_period with the 5 minute period."""
+    now = dt_util.utcnow()
+
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {"history": {}})
+    await async_setup_component(hass, "sensor", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    hass.states.async_set(
+        "sensor.test",
+        10,
+        attributes={"device_class": "temperature", "state_class": "measurement"},
+    )
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+
+    hass.data[recorder.DATA_INSTANCE].do_adhoc_statistics(period="5minute", start=now)
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    for period, expected in (("hour", {}), ("5minute", {"sensor.test": 1})):
+        await client.send_json(
+            {
+                "id": len(period),
+                "type": "history/statistics_during_period",
+                "start_time": now.isoformat(),
+                "statistic_id": "sensor.test",
+                "period": period,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        statistics = response["result"]["statistics"]
+        assert {key: len(value) for key, value in statistics.items()} == expected
+
+    await client.send_json(
+        {
+            "id": 10,
+            "type": "history/statistics_during_period",
+            "start_time": now.isoformat(),
+            "period": "day",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
 async def test_statistics_during_period_bad_start_time(hass, hass_ws_client):
     """Test statistics_during_period."""
     await hass.async_add_executor_job(init_recorder_component, hass)
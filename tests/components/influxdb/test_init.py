@@ -1522,6 +1522,77 @@ async def test_event_listener_backlog_full(
         assert get_write_api(mock_client).call_count == 0
 
 
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api, get_mock_call",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_spool(
+    hass, mock_client, config_ext, get_write_api, get_mock_call, tmp_path
+):
+    """Test events are spooled while InfluxDB is unreachable and written later."""
+    hass.config.config_dir = str(tmp_path)
+    config = {"spool": True}
+    config.update(config_ext)
+    handler_method = await _setup(hass, mock_client, config, get_write_api)
+    instance = hass.data[influxdb.DOMAIN]
+
+    def _event(value):
+        state = MagicMock(
+            state=value,
+            domain="fake",
+            entity_id="entity.id",
+            object_id="entity",
+            attributes={},
+        )
+        return MagicMock(data={"new_state": state}, time_fired=12345)
+
+    def _body(value):
+        return {
+            "measurement": "entity.id",
+            "tags": {"domain": "fake", "entity_id": "entity"},
+            "time": 12345,
+            "fields": {"value": value},
+        }
+
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = OSError("foo")
+
+    with patch.object(influxdb, "RETRY_DELAY", 0.1):
+        handler_method(_event(1))
+        instance.block_till_done()
+        handler_method(_event(2))
+        instance.block_till_done()
+        assert instance.spool.pending == 2
+        assert (tmp_path / "influxdb_spool").is_dir()
+
+        failed_calls = write_api.call_count
+        write_api.side_effect = None
+        handler_method(_event(3))
+        instance.block_till_done()
+
+    assert instance.spool.pending == 0
+    written = [
+        point
+        for write_call in write_api.call_args_list[failed_calls:]
+        for point in write_call.kwargs.get("record") or write_call.args[0]
+    ]
+    assert written == [_body(1.0), _body(2.0), _body(3.0)]
+
+
 @pytest.mark.parametrize(
     "mock_client, config_ext, get_write_api, get_mock_call",
     [
@@ -0,0 +1,151 @@
+"""The tests for the InfluxDB spool."""
+import datetime
+
+from homeassistant.components.influxdb.spool import InfluxSpool
+
+
+def _points(start, stop):
+    """Return test points."""
+    return [
+        {"measurement": "test", "fields": {"value": idx}} for idx in range(start, stop)
+    ]
+
+
+def _values(points):
+    """Return the values of test points."""
+    return [point["fields"]["value"] for point in points]
+
+
+def test_read_in_order(tmp_path):
+    """Test points are read back in the order they were appended."""
+    spool = InfluxSpool(str(tmp_path), 1024 * 1024, segment_size=200)
+    spool.append(_points(0, 5))
+    spool.append(_points(5, 12))
+    assert spool.pending == 12
+    assert len(list(tmp_path.iterdir())) > 1
+
+    assert _values(spool.read(5)) == [0, 1, 2, 3, 4]
+    # Reading again without commit returns the same points
+    assert _values(spool.read(5)) == [0, 1, 2, 3, 4]
+    spool.commit()
+    assert spool.pending == 7
+
+    assert _values(spool.read(100)) == [5, 6, 7, 8, 9, 10, 11]
+    spool.commit()
+    assert spool.pending == 0
+    assert spool.size == 0
+    assert list(tmp_path.iterdir()) == []
+    assert spool.read(100) == []
+
+
+def test_serializes_datetime(tmp_path):
+    """Test datetimes are stored as ISO strings."""
+    spool = InfluxSpool(str(tmp_path), 1024 * 1024)
+    time = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+    spool.append([{"measurement": "test", "time": time, "fields": {}}])
+
+    assert spool.read(1) == [
+        {"measurement": "test", "time": "2021-01-01T00:00:00+00:00", "fields": {}}
+    ]
+
+
+def test_resume_after_restart(tmp_path):
+    """Test the spool picks up the points left by an earlier run."""
+    spool = InfluxSpool(str(tmp_path), 1024 * 1024, segment_size=200)
+    spool.append(_points(0, 10))
+
+    spool = InfluxSpool(str(tmp_path), 1024 * 1024, segment_size=200)
+    assert spool.pending == 10
+    spool.append(_points(10, 12))
+    assert _values(spool.read(100)) == list(range(12))
+
+
+def test_drop_oldest_segments_when_full(tmp_path, caplog):
+    """Test the oldest segments are dropped when the spool is full."""
+    spool = InfluxSpool(str(tmp_path), 500, segment_size=200)
+    for idx in range(20):
+        spool.append(_points(idx, idx + 1))
+
+    assert spool.size <= 500
+    assert spool.dropped > 0
+    assert spool.pending == 20 - spool.dropped
+    assert "Spool is full" in caplog.text
+
+    values = _values(spool.read(100))
+    assert values == list(range(spool.dropped, 20))
+
+
+def test_drop_partially_read_segment(tmp_path):
+    """Test dropping a segment that was partially written already."""
+    spool = InfluxSpool(str(tmp_path), 500, segment_size=200)
+    spool.append(_points(0, 5))
+    spool.read(2)
+    spool.commit()
+    assert spool.pending == 3
+
+    for idx in range(5, 20):
+        spool.append(_points(idx, idx + 1))
+
+    assert spool.pending == 18 - spool.dropped
+    assert _values(spool.read(100))[-1] == 19
+
+
+def test_skip_unserializable_and_corrupt_points(tmp_path, caplog):
+    """Test points that can not be stored or read are skipped."""
+    spool = InfluxSpool(str(tmp_path), 1024 * 1024)
+    spool.append([{"fields": {"value": object()}}])
+    assert spool.pending == 0
+    assert "Point is not JSON serializable" in caplog.text
+
+    spool.append(_points(0, 1))
+    segment = next(tmp_path.iterdir())
+    with open(segment, "ab") as file:
+        file.write(b'{"broken\n')
+    spool = InfluxSpool(str(tmp_path), 1024 * 1024)
+    spool.append(_points(1, 2))
+
+    assert _values(spool.read(100)) == [0, 1]
+    assert "Skipping corrupt spooled point" in caplog.text
+    spool.commit()
+    assert spool.pending == 0
+
+
+def test_only_corrupt_points_left(tmp_path, caplog):
+    """Test corrupt points are removed when no valid points are left."""
+    spool = InfluxSpool(str(tmp_path), 1024 * 1024)
+    spool.append(_points(0, 1))
+    segment = next(tmp_path.iterdir())
+    with open(segment, "ab") as file:
+        file.write(b'{"broken\n{"broken\n')
+    spool = InfluxSpool(str(tmp_path), 1024 * 1024)
+    assert spool.pending == 3
+
+    assert _values(spool.read(1)) == [0]
+    spool.commit()
+    assert spool.pending == 2
+
+    assert spool.read(100) == []
+    assert spool.pending == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_truncate_corrupt_tail(tmp_path, caplog):
+    """Test a partially written point is cut off when the spool is loaded."""
+    spool = InfluxSpool(str(tmp_path), 1024 * 1024)
+    spool.append(_points(0, 2))
+    segment = next(tmp_path.iterdir())
+    size = segment.stat().st_size
+    with open(segment, "ab") as file:
+        file.write(b'{"measurement": "te')
+
+    spool = InfluxSpool(str(tmp_path), 1024 * 1024)
+    assert "Dropping partially spooled point" in caplog.text
+    assert segment.stat().st_size == size
+    assert spool.pending == 2
+    assert spool.size == size
+
+    spool.append(_points(2, 3))
+    assert _values(spool.read(100)) == [0, 1, 2]
+    assert "Skipping corrupt spooled point" not in caplog.text
+    spool.commit()
+    assert spool.pending == 0
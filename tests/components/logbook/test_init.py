@@ -5,7 +5,9 @@ from datetime import datetime, timedelta
 import json
 from unittest.mock import Mock, patch
 
+import aiohttp
 import pytest
+from sqlalchemy.exc import SQLAlchemyError
 import voluptuous as vol
 
 from homeassistant.components import logbook, recorder
@@ -317,6 +319,233 @@ async def test_logbook_view(hass, hass_client):
     assert response.status == 200
 
 
+async def test_logbook_view_streams_batches(hass, hass_client):
+    """Test the logbook view streams the entries in batches."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    client = await hass_client()
+
+    response = await client.get(f"/api/logbook/{start.isoformat()}")
+    assert response.status == 200
+    assert await response.json() == []
+
+    for idx in range(7):
+        hass.states.async_set("switch.test", STATE_ON if idx % 2 else STATE_OFF)
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    with patch("homeassistant.components.logbook.STREAM_BATCH_SIZE", 3):
+        response = await client.get(f"/api/logbook/{start.isoformat()}")
+    assert response.status == 200
+    assert response.headers["Content-Type"] == "application/json"
+    response_json = await response.json()
+    # The initial state is not a state change
+    assert [entry["state"] for entry in response_json] == [
+        STATE_ON if idx % 2 else STATE_OFF for idx in range(1, 7)
+    ]
+
+
+async def test_logbook_view_error_before_streaming(hass, hass_client):
+    """Test an error fetching the first entries returns an error status."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    client = await hass_client()
+
+    with patch(
+        "homeassistant.components.logbook._iter_events",
+        side_effect=SQLAlchemyError,
+    ):
+        response = await client.get(f"/api/logbook/{dt_util.utcnow().isoformat()}")
+    assert response.status == 500
+
+
+async def test_logbook_view_error_while_streaming(hass, hass_client, caplog):
+    """Test an error after the first entries ends the response incomplete."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    client = await hass_client()
+
+    def iter_events(*args):
+        yield {"name": "one"}
+        raise SQLAlchemyError
+
+    with patch(
+        "homeassistant.components.logbook._iter_events", side_effect=iter_events
+    ), patch("homeassistant.components.logbook.STREAM_BATCH_SIZE", 1):
+        response = await client.get(f"/api/logbook/{dt_util.utcnow().isoformat()}")
+        assert response.status == 200
+        with pytest.raises(aiohttp.ClientPayloadError):
+            await response.read()
+    assert "Error streaming the logbook" in caplog.text
+
+
+async def test_event_stream(hass, hass_ws_client):
+    """Test the event stream sends the recorded entries and then new ones."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+
+    hass.states.async_set("switch.test", STATE_OFF)
+    hass.states.async_set("switch.test", STATE_ON)
+    hass.states.async_set("switch.other", STATE_OFF)
+    hass.states.async_set("switch.other", STATE_ON)
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/event_stream",
+            "start_time": start.isoformat(),
+            "entity_ids": ["switch.test"],
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["id"] == 1
+    assert msg["success"]
+
+    msg = await client.receive_json()
+    assert msg["type"] == "event"
+    assert [
+        (entry["entity_id"], entry["state"]) for entry in msg["event"]["events"]
+    ] == [("switch.test", STATE_ON)]
+
+    context = ha.Context(
+        id="ac5bd62de45711eaaeb351041eec8dd9",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {ATTR_DOMAIN: "switch", ATTR_SERVICE: "turn_off"},
+        context=context,
+    )
+    hass.states.async_set("switch.other", STATE_OFF)
+    hass.states.async_set("switch.test", STATE_OFF, context=context)
+    # Attribute changes are not logged
+    hass.states.async_set("switch.test", STATE_OFF, {"attr": 1})
+    await hass.async_block_till_done()
+
+    msg = await client.receive_json()
+    assert msg["type"] == "event"
+    entries = msg["event"]["events"]
+    assert len(entries) == 1
+    assert entries[0]["entity_id"] == "switch.test"
+    assert entries[0]["state"] == STATE_OFF
+    assert entries[0]["context_user_id"] == "b400facee45711eaa9308bfd3d19e474"
+    assert entries[0]["context_event_type"] == EVENT_CALL_SERVICE
+    assert entries[0]["context_domain"] == "switch"
+    assert entries[0]["context_service"] == "turn_off"
+
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    msg = await client.receive_json()
+    assert msg["id"] == 2
+    assert msg["success"]
+
+    hass.states.async_set("switch.test", STATE_ON)
+    await hass.async_block_till_done()
+    hass.bus.async_fire(
+        logbook.EVENT_LOGBOOK_ENTRY,
+        {logbook.ATTR_NAME: "Alarm", logbook.ATTR_MESSAGE: "is triggered"},
+    )
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 3, "type": "ping"})
+    msg = await client.receive_json()
+    assert msg["id"] == 3
+    assert msg["type"] == "pong"
+
+
+async def test_event_stream_uncommitted_events(hass, hass_ws_client):
+    """Test events the recorder has not committed yet are sent exactly once."""
+    await hass.async_add_executor_job(
+        init_recorder_component, hass, {recorder.CONF_COMMIT_INTERVAL: 1000}
+    )
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    client = await hass_ws_client()
+
+    hass.states.async_set("switch.test", STATE_OFF)
+    hass.states.async_set("switch.test", STATE_ON)
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/event_stream",
+            "start_time": start.isoformat(),
+            "entity_ids": ["switch.test"],
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["id"] == 1
+    assert msg["success"]
+
+    msg = await client.receive_json()
+    assert msg["type"] == "event"
+    assert [
+        (entry["entity_id"], entry["state"]) for entry in msg["event"]["events"]
+    ] == [("switch.test", STATE_ON)]
+
+    await client.send_json({"id": 2, "type": "ping"})
+    msg = await client.receive_json()
+    assert msg["id"] == 2
+    assert msg["type"] == "pong"
+
+
+async def test_event_stream_logbook_entries(hass, hass_ws_client):
+    """Test the event stream sends new logbook entries."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/event_stream",
+            "start_time": dt_util.utcnow().isoformat(),
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+
+    await hass.services.async_call(
+        logbook.DOMAIN,
+        "log",
+        {logbook.ATTR_NAME: "Alarm", logbook.ATTR_MESSAGE: "is triggered"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    msg = await client.receive_json()
+    assert msg["type"] == "event"
+    entries = msg["event"]["events"]
+    assert len(entries) == 1
+    assert entries[0]["name"] == "Alarm"
+    assert entries[0]["message"] == "is triggered"
+
+
+async def test_event_stream_invalid_start_time(hass, hass_ws_client):
+    """Test the event stream with an invalid start time."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {"id": 1, "type": "logbook/event_stream", "start_time": "invalid"}
+    )
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "invalid_start_time"
+
+
 async def test_logbook_view_period_entity(hass, hass_client):
     """Test the logbook view with period and entity."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -0,0 +1,97 @@
+"""The tests for the MQTT topic trie."""
+import pytest
+
+from homeassistant.components.mqtt.trie import TopicTrie
+
+
+@pytest.mark.parametrize(
+    "topic_filter,topic,matches",
+    [
+        ("test/topic", "test/topic", True),
+        ("test/topic", "test/topic/sub", False),
+        ("test/topic", "test", False),
+        ("test/+/on", "test/topic/on", True),
+        ("test/+/on", "test/topic/off", False),
+        ("test/+", "test", False),
+        ("+", "test", True),
+        ("+/+", "/test", True),
+        ("test/#", "test", True),
+        ("test/#", "test/topic/sub", True),
+        ("test/#", "other/topic", False),
+        ("#", "test/topic", True),
+        ("+/topic/#", "test/topic", True),
+        ("+/topic/#", "test/other", False),
+        ("#", "$SYS/uptime", False),
+        ("+/uptime", "$SYS/uptime", False),
+        ("$SYS/#", "$SYS/uptime", True),
+        ("$SYS/+", "$SYS/uptime", True),
+        ("test/+/#", "test/$topic", True),
+        ("/test", "/test", True),
+        ("/test", "test", False),
+    ],
+)
+def test_match(topic_filter, topic, matches):
+    """Test matching a topic against a topic filter."""
+    trie = TopicTrie()
+    trie.add(topic_filter, "value")
+
+    assert trie.match(topic) == (["value"] if matches else [])
+
+
+def test_match_in_insertion_order():
+    """Test matches are returned in the order they were added."""
+    trie = TopicTrie()
+    trie.add("test/topic", 1)
+    trie.add("#", 2)
+    trie.add("test/+", 3)
+    trie.add("test/topic", 4)
+    trie.add("test/#", 5)
+    trie.add("other/topic", 6)
+
+    assert trie.match("test/topic") == [1, 2, 3, 4, 5]
+    assert trie.match("other/topic") == [2, 6]
+    assert trie.match("other") == [2]
+
+
+def test_remove():
+    """Test removing values from the trie."""
+    trie = TopicTrie()
+    first = object()
+    second = object()
+    trie.add("test/+/on", first)
+    trie.add("test/+/on", second)
+    trie.add("test/#", first)
+    assert len(trie) == 3
+
+    trie.remove("test/+/on", first)
+    assert len(trie) == 2
+    assert trie.match("test/topic/on") == [second, first]
+    assert trie.has_topic_filter("test/+/on")
+
+    trie.remove("test/+/on", second)
+    assert trie.match("test/topic/on") == [first]
+    assert not trie.has_topic_filter("test/+/on")
+    assert not trie.has_topic_filter("test/+")
+
+    trie.remove("test/#", first)
+    assert len(trie) == 0
+    assert trie.match("test/topic/on") == []
+    # pylint: disable=protected-access
+    assert trie._root.children == {}
+
+
+def test_remove_unknown():
+    """Test removing a value that was not added raises."""
+    trie = TopicTrie()
+    trie.add("test/topic", "value")
+
+    with pytest.raises(KeyError):
+        trie.remove("test/other", "value")
+
+    with pytest.raises(KeyError):
+        trie.remove("test/topic", "other")
+
+    with pytest.raises(KeyError):
+        trie.remove("test", "value")
+
+    assert trie.match("test/topic") == ["value"]
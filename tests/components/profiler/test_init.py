@@ -1,21 +1,31 @@
 """Test the Profiler config flow."""
 from datetime import timedelta
 import os
+import threading
+import time
 from unittest.mock import patch
 
+import pytest
+
 from homeassistant import setup
 from homeassistant.components.profiler import (
+    CONF_INTERVAL,
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
+    SERVICE_DUMP_SAMPLES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_MEMORY,
     SERVICE_START,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_START_SAMPLER,
     SERVICE_STOP_LOG_OBJECTS,
+    SERVICE_STOP_SAMPLER,
 )
 from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.components.profiler.sampler import StackSampler
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
+from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -192,3 +202,66 @@ async def test_log_scheduled(hass, caplog):
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_sampler(hass, tmpdir):
+    """Test sampling the stacks of the threads."""
+    test_dir = tmpdir.mkdir("profiles")
+
+    await setup.async_setup_component(hass, "persistent_notification", {})
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(DOMAIN, SERVICE_DUMP_SAMPLES, {}, blocking=True)
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_SAMPLER, {CONF_INTERVAL: 0.001}, blocking=True
+    )
+    await hass.async_add_executor_job(time.sleep, 0.05)
+
+    last_filename = None
+
+    def _mock_path(filename):
+        nonlocal last_filename
+        last_filename = f"{test_dir}/{filename}"
+        return last_filename
+
+    with patch.object(hass.config, "path", _mock_path):
+        await hass.services.async_call(DOMAIN, SERVICE_DUMP_SAMPLES, {}, blocking=True)
+
+    with open(last_filename) as file:
+        lines = file.read().splitlines()
+    assert any(line.startswith("MainThread;") for line in lines)
+    assert any(line.startswith("SyncWorker_") for line in lines)
+    for line in lines:
+        assert int(line.rsplit(" ", 1)[1]) > 0
+
+    await hass.services.async_call(DOMAIN, SERVICE_STOP_SAMPLER, {}, blocking=True)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_sampler_blocked_event_loop(hass, tmpdir, caplog):
+    """Test the samples are written when the event loop is blocked."""
+    test_dir = tmpdir.mkdir("profiles")
+    sampler = StackSampler(hass, 0.01, 1, 0.1)
+    # pylint: disable=protected-access
+    sampler._loop_thread_id = threading.get_ident()
+    sampler.sample({threading.get_ident(): "MainThread"})
+    sampler._heartbeat = time.monotonic() - 1
+
+    with patch.object(hass.config, "path", lambda name: f"{test_dir}/{name}"):
+        sampler._check_blocked(time.monotonic())
+        sampler._check_blocked(time.monotonic())
+
+    assert len(test_dir.listdir()) == 1
+    assert "The event loop has been blocked" in caplog.text
+    assert "test_sampler_blocked_event_loop" in test_dir.listdir()[0].read()
+
+    sampler._heartbeat = time.monotonic()
+    sampler._check_blocked(time.monotonic())
+    assert not sampler._blocked
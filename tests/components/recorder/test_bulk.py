@@ -0,0 +1,205 @@
+"""The tests for the recorder bulk insert write path."""
+# pylint: disable=protected-access
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.exc import OperationalError
+
+from homeassistant.components.recorder import (
+    CONF_BULK_INSERT,
+    CONF_SHARED_ATTRIBUTES,
+    bulk,
+)
+from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.components.recorder.models import Events, StateAttributes, States
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import STATE_LOCKED, STATE_UNLOCKED
+
+from .common import wait_recording_done
+
+
+def test_bulk_saving_state_and_event(hass_recorder):
+    """Test states and events are saved and linked."""
+    hass = hass_recorder({CONF_BULK_INSERT: True})
+    assert hass.data[DATA_INSTANCE].bulk_writer is not None
+
+    hass.bus.fire("test_event", {"some_data": 42})
+    hass.states.set("test.one", "on", {"test_attr": 5})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        events = list(session.query(Events).filter_by(event_type="test_event"))
+        assert len(events) == 1
+        assert events[0].to_native().data == {"some_data": 42}
+        assert events[0].created == events[0].time_fired
+
+        states = list(session.query(States))
+        assert len(states) == 1
+        state = states[0].to_native()
+        assert state.state == "on"
+        assert state.attributes == {"test_attr": 5}
+        assert state.last_updated == hass.states.get("test.one").last_updated
+        event = session.query(Events).get(states[0].event_id)
+        assert event.event_type == "state_changed"
+        assert event.event_data == "{}"
+
+
+def test_bulk_saving_sets_old_state(hass_recorder):
+    """Test old_state_id is set within a batch and across commits."""
+    hass = hass_recorder({CONF_BULK_INSERT: True})
+
+    hass.states.set("test.one", "on", {})
+    hass.states.set("test.two", "on", {})
+    hass.states.set("test.one", "off", {})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "on", {})
+    hass.states.set("test.two", "off", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert [(state.entity_id, state.state) for state in states] == [
+            ("test.one", "on"),
+            ("test.two", "on"),
+            ("test.one", "off"),
+            ("test.one", "on"),
+            ("test.two", "off"),
+        ]
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id is None
+        assert states[2].old_state_id == states[0].state_id
+        assert states[3].old_state_id == states[2].state_id
+        assert states[4].old_state_id == states[1].state_id
+
+    bulk_writer = hass.data[DATA_INSTANCE].bulk_writer
+    assert bulk_writer.rows_per_commit == 4
+    assert bulk_writer.events_per_second > 0
+
+
+def test_bulk_saving_state_and_removing_entity(hass_recorder):
+    """Test saving the state of a removed entity."""
+    hass = hass_recorder({CONF_BULK_INSERT: True})
+    entity_id = "lock.mine"
+    hass.states.set(entity_id, STATE_LOCKED)
+    hass.states.set(entity_id, STATE_UNLOCKED)
+    hass.states.async_remove(entity_id)
+    wait_recording_done(hass)
+    hass.states.set(entity_id, STATE_LOCKED)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert [state.state for state in states] == [
+            STATE_LOCKED,
+            STATE_UNLOCKED,
+            None,
+            STATE_LOCKED,
+        ]
+        assert states[2].old_state_id == states[1].state_id
+        assert states[3].old_state_id is None
+
+
+def test_bulk_saving_many_states(hass_recorder):
+    """Test saving more states than fit in a single insert statement."""
+    hass = hass_recorder({CONF_BULK_INSERT: True})
+
+    with patch("homeassistant.components.recorder.bulk.MAX_ROWS_TO_INSERT", 7):
+        for idx in range(25):
+            hass.states.set(f"test.entity_{idx % 10}", str(idx), {})
+        wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 25
+        by_id = {state.state_id: state for state in states}
+        for state in states:
+            idx = int(state.state)
+            assert state.entity_id == f"test.entity_{idx % 10}"
+            if idx < 10:
+                assert state.old_state_id is None
+            else:
+                assert by_id[state.old_state_id].state == str(idx - 10)
+            assert session.query(Events).get(state.event_id) is not None
+
+
+def test_bulk_saving_retries_after_failure(hass_recorder):
+    """Test pending rows are kept when the commit fails."""
+    hass = hass_recorder({CONF_BULK_INSERT: True})
+    instance = hass.data[DATA_INSTANCE]
+    original_commit = instance.event_session.commit
+    failures = 1
+
+    def _commit_fails_once():
+        nonlocal failures
+        if failures:
+            failures -= 1
+            raise OperationalError("insert", {}, Exception("database is locked"))
+        original_commit()
+
+    with patch.object(
+        instance.event_session, "commit", side_effect=_commit_fails_once
+    ), patch("homeassistant.components.recorder.time.sleep"):
+        hass.states.set("test.one", "on", {})
+        hass.states.set("test.one", "off", {})
+        wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 2
+        assert states[1].old_state_id == states[0].state_id
+
+
+def test_bulk_saving_with_shared_attributes(hass_recorder):
+    """Test identical attributes are only stored once."""
+    hass = hass_recorder({CONF_BULK_INSERT: True, CONF_SHARED_ATTRIBUTES: True})
+    attributes = {"unit_of_measurement": "W"}
+
+    hass.states.set("sensor.one", "1", attributes)
+    hass.states.set("sensor.two", "2", attributes)
+    hass.states.set("sensor.three", "3", {})
+    wait_recording_done(hass)
+    hass.data[DATA_INSTANCE].state_attributes_ids.clear()
+    hass.states.set("sensor.one", "4", attributes)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 2
+        states = list(session.query(States))
+        assert len(states) == 4
+        assert all(state.attributes is None for state in states)
+        assert states[0].attributes_id == states[1].attributes_id
+        assert states[0].attributes_id == states[3].attributes_id
+        assert states[2].to_native().attributes == {}
+        assert states[3].to_native().attributes == attributes
+
+
+def test_insert_rows_mysql_non_consecutive_ids():
+    """Test rows are inserted one by one when MySQL ids may not be consecutive."""
+    connection = MagicMock(info={})
+    connection.dialect.name = "mysql"
+    connection.execute.return_value.first.return_value = (2, 1)
+    connection.execute.return_value.inserted_primary_key = [7]
+
+    assert bulk._insert_rows(
+        connection, Events.__table__, ("event_type",), [("one",), ("two",)]
+    ) == [7, 7]
+    assert connection.info == {bulk.MYSQL_CONSECUTIVE_IDS: False}
+    # The settings query and one insert per row
+    assert connection.execute.call_count == 3
+
+
+def test_insert_rows_mysql_consecutive_ids():
+    """Test MySQL rows get ids counted from the first id of a multi-row insert."""
+    connection = MagicMock(info={bulk.MYSQL_CONSECUTIVE_IDS: True})
+    connection.dialect.name = "mysql"
+    connection.execute.return_value.lastrowid = 10
+
+    assert (
+        bulk._insert_rows(
+            connection,
+            Events.__table__,
+            ("event_type",),
+            [("one",), ("two",), ("three",)],
+        )
+        == [10, 11, 12]
+    )
+    assert connection.execute.call_count == 1
@@ -1,10 +1,14 @@
 """The tests the History component."""
 # pylint: disable=protected-access,invalid-name
+from contextlib import nullcontext
 from copy import copy
 from datetime import timedelta
 import json
 from unittest.mock import patch, sentinel
 
+import pytest
+from pytest import approx
+
 from homeassistant.components.recorder import history
 from homeassistant.components.recorder.models import process_timestamp
 import homeassistant.core as ha
@@ -430,3 +434,71 @@ def record_states(hass):
         )
 
     return zero, four, states
+
+
+@pytest.mark.parametrize("numeric_in_sql", [True, False])
+def test_get_significant_states_downsampled(hass_recorder, numeric_in_sql):
+    """Test states are reduced to buckets, in SQL or while streaming."""
+    hass = hass_recorder()
+    zero = dt_util.utcnow().replace(microsecond=0) + timedelta(minutes=1)
+
+    def record(entity_id, state, when):
+        """Record a state at a point in time."""
+        mock_state_change_event(
+            hass,
+            ha.State(
+                entity_id,
+                state,
+                {"unit_of_measurement": "W"},
+                last_changed=when,
+                last_updated=when,
+            ),
+        )
+
+    record("sensor.power", "100", zero - timedelta(seconds=30))
+    for idx in range(60):
+        record("sensor.power", str(idx), zero + timedelta(seconds=10 * idx + 5))
+        if idx == 29:
+            record("sensor.power", "unavailable", zero + timedelta(seconds=298))
+    record("sensor.new", "3", zero + timedelta(seconds=330))
+    record("sensor.new", "4", zero + timedelta(seconds=340))
+    wait_recording_done(hass)
+
+    with nullcontext() if numeric_in_sql else patch(
+        "homeassistant.components.recorder.history.numeric_state_filter",
+        return_value=None,
+    ):
+        hist = history.get_significant_states_downsampled(
+            hass, zero, zero + timedelta(minutes=10), timedelta(minutes=1)
+        )
+
+    assert list(hist) == ["sensor.power", "sensor.new"]
+    power = hist["sensor.power"]
+    assert power[0].state == "100"
+    assert power[0].last_changed == zero
+    expected = []
+    for minute in range(10):
+        expected.append(
+            {
+                "state": approx(6 * minute + 2.5),
+                "min": 6 * minute,
+                "max": 6 * minute + 5,
+                "last_changed": (zero + timedelta(minutes=minute)).isoformat(),
+            }
+        )
+        if minute == 4:
+            expected.append(
+                {
+                    "state": "unavailable",
+                    "last_changed": (zero + timedelta(seconds=298)).isoformat(),
+                }
+            )
+    assert power[1:] == expected
+
+    # The first point of an entity without a start state is a full state
+    new = hist["sensor.new"]
+    assert len(new) == 1
+    assert new[0].entity_id == "sensor.new"
+    assert new[0].state == "3.5"
+    assert new[0].attributes == {"unit_of_measurement": "W"}
+    assert new[0].last_changed == zero + timedelta(minutes=5)
@@ -11,6 +11,7 @@ from homeassistant.components import recorder
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_DB_URL,
+    CONF_SHARED_ATTRIBUTES,
     CONFIG_SCHEMA,
     DOMAIN,
     KEEPALIVE_TIME,
@@ -25,7 +26,13 @@ from homeassistant.components.recorder import (
     run_information_with_session,
 )
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.history import get_significant_states
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
@@ -141,6 +148,21 @@ async def test_saving_state(
     assert state == _state_empty_context(hass, entity_id)
 
 
+async def test_commit_waits_for_queued_events(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test async_commit returns once the events fired before are committed."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 1000}
+    )
+
+    hass.states.async_set("test.recorder", "on")
+    await instance.async_commit()
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 1
+
+
 async def test_saving_many_states(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -707,11 +729,24 @@ def test_auto_statistics(hass_recorder):
     with patch(
         "homeassistant.components.recorder.statistics.compile_statistics",
         return_value=True,
-    ) as compile_statistics:
+    ) as compile_statistics, patch(
+        "homeassistant.components.recorder.statistics.compile_short_term_statistics",
+        return_value=True,
+    ) as compile_short_term_statistics:
         # Advance one hour, and the statistics task should run
         test_time = test_time + timedelta(hours=1)
         run_tasks_at_time(hass, test_time)
         assert len(compile_statistics.mock_calls) == 1
+        assert len(compile_short_term_statistics.mock_calls) == 1
+
+        compile_statistics.reset_mock()
+        compile_short_term_statistics.reset_mock()
+
+        # Advance 5 minutes, and only the short term statistics task should run
+        test_time = test_time + timedelta(minutes=5)
+        run_tasks_at_time(hass, test_time)
+        assert len(compile_statistics.mock_calls) == 0
+        assert len(compile_short_term_statistics.mock_calls) == 1
 
         compile_statistics.reset_mock()
 
@@ -761,6 +796,52 @@ def test_saving_sets_old_state(hass_recorder):
         assert states[3].old_state_id == states[1].state_id
 
 
+def test_saving_state_with_shared_attributes(hass_recorder):
+    """Test identical attributes are only stored once."""
+    hass = hass_recorder({CONF_SHARED_ATTRIBUTES: True})
+    start = dt_util.utcnow()
+    attributes = {"unit_of_measurement": "W", "friendly_name": "Power"}
+
+    hass.states.set("sensor.one", "1", attributes)
+    hass.states.set("sensor.two", "2", attributes)
+    wait_recording_done(hass)
+    hass.states.set("sensor.one", "3", attributes)
+    hass.states.set("sensor.two", "4", {"friendly_name": "Other"})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        shared = list(session.query(StateAttributes))
+        assert len(shared) == 2
+        states = list(session.query(States))
+        assert len(states) == 4
+        assert all(state.attributes is None for state in states)
+        assert states[0].attributes_id == states[1].attributes_id
+        assert states[0].attributes_id == states[2].attributes_id
+        assert states[3].attributes_id != states[0].attributes_id
+        assert states[2].to_native().attributes == attributes
+
+    history = get_significant_states(hass, start)
+    assert history["sensor.one"][-1].attributes == attributes
+    assert history["sensor.two"][-1].attributes == {"friendly_name": "Other"}
+
+
+def test_saving_state_with_shared_attributes_after_restart(hass_recorder):
+    """Test shared attributes already in the database are reused."""
+    hass = hass_recorder({CONF_SHARED_ATTRIBUTES: True})
+    attributes = {"unit_of_measurement": "W"}
+
+    hass.states.set("sensor.one", "1", attributes)
+    wait_recording_done(hass)
+    hass.data[DATA_INSTANCE].state_attributes_ids.clear()
+    hass.states.set("sensor.one", "2", attributes)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 1
+        states = list(session.query(States))
+        assert states[0].attributes_id == states[1].attributes_id
+
+
 def test_saving_state_with_serializable_data(hass_recorder, caplog):
     """Test saving data that cannot be serialized does not crash."""
     hass = hass_recorder()
@@ -8,7 +8,13 @@ from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -57,6 +63,27 @@ async def test_purge_old_states(
         assert states.count() == 2
 
 
+async def test_purge_old_states_with_shared_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test deleting old states removes shared attributes no longer used."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass, instance, shared_attributes=True)
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        shared_attributes = session.query(StateAttributes)
+        assert states.count() == 6
+        assert shared_attributes.count() == 3
+
+        finished = purge_old_data(instance, 4, repack=False)
+        assert not finished
+        assert states.count() == 2
+        assert shared_attributes.count() == 1
+        assert states[0].to_native().attributes == {"test_attr": "dontpurgeme"}
+
+
 async def test_purge_old_states_encouters_database_corruption(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -195,6 +222,34 @@ async def test_purge_old_recorder_runs(
         assert recorder_runs.count() == 1
 
 
+async def test_purge_old_short_term_statistics(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test short term statistics are purged with their own retention period."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_SHORT_TERM_STATISTICS_KEEP_DAYS: 7}
+    )
+    await async_wait_recording_done(hass, instance)
+
+    utcnow = dt_util.utcnow()
+    with session_scope(hass=hass) as session:
+        for days in (11, 8, 5, 0):
+            session.add(
+                StatisticsShortTerm(
+                    statistic_id="sensor.test",
+                    start=utcnow - timedelta(days=days),
+                    mean=days,
+                )
+            )
+
+    with session_scope(hass=hass) as session:
+        # Keeping all states and events does not keep the short term statistics
+        finished = purge_old_data(instance, 30, repack=False)
+        assert finished
+        statistics = session.query(StatisticsShortTerm)
+        assert sorted(statistic.mean for statistic in statistics) == [0, 5]
+
+
 async def test_purge_method(
     hass: HomeAssistant,
     async_setup_recorder_instance: SetupRecorderInstanceT,
@@ -769,7 +824,9 @@ async def test_purge_entities(
         assert states.count() == 0
 
 
-async def _add_test_states(hass: HomeAssistant, instance: recorder.Recorder):
+async def _add_test_states(
+    hass: HomeAssistant, instance: recorder.Recorder, shared_attributes=False
+):
     """Add multiple states to the db for testing."""
     utcnow = dt_util.utcnow()
     five_days_ago = utcnow - timedelta(days=5)
@@ -801,11 +858,20 @@ async def _add_test_states(hass: HomeAssistant, instance: recorder.Recorder):
             )
             session.add(event)
             session.flush()
+            shared_attrs = None
+            if shared_attributes:
+                # Each pair of states shares the same attributes
+                if event_id % 2 == 0:
+                    pair_attrs = StateAttributes.from_shared_attrs(
+                        json.dumps({"test_attr": state})
+                    )
+                shared_attrs = pair_attrs
             state = States(
                 entity_id="test.recorder2",
                 domain="sensor",
                 state=state,
-                attributes=json.dumps(attributes),
+                attributes=None if shared_attributes else json.dumps(attributes),
+                state_attributes=shared_attrs,
                 last_changed=timestamp,
                 last_updated=timestamp,
                 created=timestamp,
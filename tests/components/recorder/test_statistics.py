@@ -8,7 +8,11 @@ from pytest import approx
 from homeassistant.components.recorder import history
 from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import process_timestamp_to_utc_isoformat
-from homeassistant.components.recorder.statistics import statistics_during_period
+from homeassistant.components.recorder.statistics import (
+    get_last_statistics,
+    get_latest_statistics,
+    statistics_during_period,
+)
 from homeassistant.setup import setup_component
 import homeassistant.util.dt as dt_util
 
@@ -43,6 +47,148 @@ def test_compile_hourly_statistics(hass_recorder):
     }
 
 
+def test_get_latest_statistics(hass_recorder):
+    """Test fetching the most recent statistics of several statistic_ids."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    zero, four, states = record_states(hass)
+    hass.states.set(
+        "sensor.test4",
+        "5",
+        {"device_class": "temperature", "state_class": "measurement"},
+    )
+    wait_recording_done(hass)
+
+    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    wait_recording_done(hass)
+    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=1))
+    wait_recording_done(hass)
+
+    expected = {
+        **get_last_statistics(hass, 1, "sensor.test1"),
+        **get_last_statistics(hass, 1, "sensor.test4"),
+    }
+    assert expected["sensor.test1"][0]["start"] == process_timestamp_to_utc_isoformat(
+        zero + timedelta(hours=1)
+    )
+    assert len(expected["sensor.test4"]) == 1
+
+    with patch("homeassistant.components.recorder.statistics.SQLITE_MAX_BIND_VARS", 1):
+        stats = get_latest_statistics(
+            hass, ["sensor.test1", "sensor.test2", "sensor.test4", "sensor.unknown"]
+        )
+    assert stats == expected
+    assert get_latest_statistics(hass, []) == {}
+
+
+def test_compile_short_term_statistics_and_rollup(hass_recorder):
+    """Test compiling 5 minute statistics and rolling them up to the hour."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    zero, four, states = record_states(hass)
+
+    for period in range(12):
+        recorder.do_adhoc_statistics(
+            period="5minute", start=zero + timedelta(minutes=5 * period)
+        )
+    wait_recording_done(hass)
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert [stat["mean"] for stat in stats["sensor.test1"]] == approx(
+        [10, 10, 10, 14, 15, 15, 15, 15, 15, 19, 20, 20]
+    )
+    assert statistics_during_period(hass, zero) == {}
+    assert get_latest_statistics(hass, ["sensor.test1"])["sensor.test1"][0][
+        "start"
+    ] == process_timestamp_to_utc_isoformat(zero + timedelta(minutes=55))
+
+    # The hourly statistics are rolled up from the 5 minute statistics
+    with patch(
+        "homeassistant.components.sensor.recorder.compile_statistics"
+    ) as compile_statistics:
+        recorder.do_adhoc_statistics(period="hourly", start=zero)
+        wait_recording_done(hass)
+    assert compile_statistics.mock_calls == []
+
+    stats = statistics_during_period(hass, zero)
+    assert stats == {
+        "sensor.test1": [
+            {
+                "statistic_id": "sensor.test1",
+                "start": process_timestamp_to_utc_isoformat(zero),
+                "mean": approx(178 / 12),
+                "min": approx(10.0),
+                "max": approx(20.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ]
+    }
+    # The 5 minute statistic of the last period wins the tie with the hour
+    assert get_latest_statistics(hass, ["sensor.test1"])["sensor.test1"][0][
+        "start"
+    ] == process_timestamp_to_utc_isoformat(zero + timedelta(minutes=55))
+
+
+def test_compile_partial_hour_from_states(hass_recorder):
+    """Test an hour with missed 5 minute periods is compiled from the states."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    zero, four, states = record_states(hass)
+
+    # Home Assistant was started 40 minutes into the hour
+    for period in range(8, 12):
+        recorder.do_adhoc_statistics(
+            period="5minute", start=zero + timedelta(minutes=5 * period)
+        )
+    wait_recording_done(hass)
+    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    wait_recording_done(hass)
+
+    stats = statistics_during_period(hass, zero)
+    assert [stat["mean"] for stat in stats["sensor.test1"]] == [
+        approx(14.915254237288135)
+    ]
+
+
+def test_statistics_during_period_tiers(hass_recorder):
+    """Test 5 minute statistics older than their retention are read hourly."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    zero, four, states = record_states(hass)
+
+    for period in range(12):
+        recorder.do_adhoc_statistics(
+            period="5minute", start=zero + timedelta(minutes=5 * period)
+        )
+    wait_recording_done(hass)
+    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    wait_recording_done(hass)
+
+    hourly = statistics_during_period(hass, zero)
+    assert len(hourly["sensor.test1"]) == 1
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert len(stats["sensor.test1"]) == 12
+
+    recorder.short_term_statistics_keep_days = 1
+    with patch(
+        "homeassistant.components.recorder.statistics.dt_util.utcnow",
+        return_value=zero + timedelta(days=2),
+    ):
+        assert statistics_during_period(hass, zero, period="5minute") == hourly
+        assert (
+            statistics_during_period(
+                hass, zero, four, statistic_id="sensor.test1", period="5minute"
+            )
+            == hourly
+        )
+
+
 def record_states(hass):
     """Record some test states.
 
@@ -104,6 +104,84 @@ def test_compile_hourly_energy_statistics(hass_recorder):
     }
 
 
+def test_compile_short_term_energy_statistics(hass_recorder):
+    """Test the sum is continued across the 5 minute and the hourly statistics."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    sns1_attr = {"device_class": "energy", "state_class": "measurement"}
+    sns2_attr = {"device_class": "energy"}
+    sns3_attr = {}
+
+    zero, four, eight, states = record_energy_states(
+        hass, sns1_attr, sns2_attr, sns3_attr
+    )
+
+    for period in range(12):
+        recorder.do_adhoc_statistics(
+            period="5minute", start=zero + timedelta(minutes=5 * period)
+        )
+    wait_recording_done(hass)
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert [stat["sum"] for stat in stats["sensor.test1"]] == approx(
+        [0, 0, 0, 5, 5, 5, 5, 5, 5, 10, 10, 10]
+    )
+
+    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    wait_recording_done(hass)
+    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=1))
+    wait_recording_done(hass)
+    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=2))
+    wait_recording_done(hass)
+    stats = statistics_during_period(hass, zero)
+    assert [
+        (stat["last_reset"], stat["state"], stat["sum"])
+        for stat in stats["sensor.test1"]
+    ] == [
+        (process_timestamp_to_utc_isoformat(zero), approx(20.0), approx(10.0)),
+        (process_timestamp_to_utc_isoformat(four), approx(40.0), approx(10.0)),
+        (process_timestamp_to_utc_isoformat(four), approx(70.0), approx(40.0)),
+    ]
+
+
+def test_compile_hourly_energy_statistics_after_short_term(hass_recorder):
+    """Test the sum of an hour is not continued from later 5 minute statistics."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    sns1_attr = {"device_class": "energy", "state_class": "measurement"}
+    sns2_attr = {"device_class": "energy"}
+    sns3_attr = {}
+
+    zero, four, eight, states = record_energy_states(
+        hass, sns1_attr, sns2_attr, sns3_attr
+    )
+
+    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    wait_recording_done(hass)
+    # The 5 minute statistics of the next hour are compiled before the
+    # hourly statistics, which are compiled from the states
+    for period in range(2):
+        recorder.do_adhoc_statistics(
+            period="5minute", start=zero + timedelta(hours=2, minutes=5 * period)
+        )
+    wait_recording_done(hass)
+    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=1))
+    wait_recording_done(hass)
+
+    stats = statistics_during_period(hass, zero)
+    assert stats["sensor.test1"][1] == {
+        "statistic_id": "sensor.test1",
+        "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=1)),
+        "max": None,
+        "mean": None,
+        "min": None,
+        "last_reset": process_timestamp_to_utc_isoformat(four),
+        "state": approx(40.0),
+        "sum": approx(10.0),
+    }
+
+
 def test_compile_hourly_energy_statistics2(hass_recorder):
     """Test compiling hourly statistics."""
     hass = hass_recorder()
@@ -11,6 +11,7 @@ from homeassistant.components.stream.const import (
     HLS_PROVIDER,
     MAX_SEGMENTS,
     NUM_PLAYLIST_SEGMENTS,
+    RECORDER_PROVIDER,
 )
 from homeassistant.components.stream.core import Part, Segment
 from homeassistant.const import HTTP_NOT_FOUND
@@ -429,3 +430,47 @@ async def test_hls_max_segments_discontinuity(hass, hls_stream, stream_worker_sy
 
     stream_worker_sync.resume()
     stream.stop()
+
+
+def test_segment_data():
+    """Test a complete segment serves its parts from a single buffer."""
+    segment = Segment(sequence=0, init=INIT_BYTES)
+    segment.parts = [
+        Part(duration=1, has_keyframe=True, data=b"part-1"),
+        Part(duration=1, has_keyframe=False, data=b"part-2"),
+    ]
+    assert segment.get_bytes_without_init() == b"part-1part-2"
+    assert segment.get_bytes() == INIT_BYTES + b"part-1part-2"
+    assert segment.size == len(INIT_BYTES) + 12
+
+    data = INIT_BYTES + b"part-1part-2"
+    segment.set_data(data)
+
+    assert segment.get_bytes() is data
+    segment_bytes = segment.get_bytes_without_init()
+    assert segment_bytes.obj is data
+    assert segment_bytes == b"part-1part-2"
+    assert [part.data.obj is data for part in segment.parts] == [True, True]
+    assert [bytes(part.data) for part in segment.parts] == [b"part-1", b"part-2"]
+    assert segment.size == len(INIT_BYTES) + len(data)
+
+
+async def test_stream_memory_usage(hass):
+    """Test the memory usage counts segments shared by outputs once."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    stream = create_stream(hass, STREAM_SOURCE, {})
+    hls = stream.add_provider(HLS_PROVIDER)
+    recorder = stream.add_provider(RECORDER_PROVIDER)
+    assert stream.memory_usage == 0
+
+    segment = Segment(sequence=0, init=INIT_BYTES)
+    segment.set_data(INIT_BYTES + FAKE_PAYLOAD)
+    hls.put(segment)
+    recorder.put(segment)
+    await hass.async_block_till_done()
+
+    assert hls.memory_usage == recorder.memory_usage == segment.size
+    assert stream.memory_usage == segment.size
+
+    stream.stop()
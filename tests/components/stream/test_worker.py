@@ -17,6 +17,7 @@ import fractions
 import io
 import math
 import threading
+import time
 from unittest.mock import patch
 
 import av
@@ -24,10 +25,12 @@ import av
 from homeassistant.components.stream import Stream, create_stream
 from homeassistant.components.stream.const import (
     HLS_PROVIDER,
+    KEYFRAME_IMAGE_MAX_AGE_SEGMENTS,
     MAX_MISSING_DTS,
     PACKETS_TO_WAIT_FOR_AUDIO,
     TARGET_SEGMENT_DURATION,
 )
+from homeassistant.components.stream.core import KeyFrameConverter, Part, Segment
 from homeassistant.components.stream.worker import SegmentBuffer, stream_worker
 from homeassistant.setup import async_setup_component
 
@@ -718,3 +721,49 @@ async def test_has_keyframe(hass, record_worker_sync):
     await record_worker_sync.join()
 
     stream.stop()
+
+
+async def test_keyframe_converter(hass):
+    """Test converting the keyframe of the latest segment to a JPEG image."""
+    converter = KeyFrameConverter(hass, min_interval=60)
+    assert await converter.async_get_image() is None
+
+    # A complete mp4 as init decodes the same as an init with its first part
+    video = generate_h264_video().getvalue()
+
+    def make_segment(sequence):
+        return Segment(
+            sequence=sequence,
+            init=video,
+            parts=[Part(duration=1, has_keyframe=True, data=b"")],
+        )
+
+    converter.set_segment(make_segment(0))
+    image = await converter.async_get_image()
+    assert image.startswith(b"\xff\xd8")
+    assert image.endswith(b"\xff\xd9")
+
+    # The image is cached for the same segment and within the minimum interval
+    with patch.object(converter, "_generate_image") as mock_generate:
+        assert await converter.async_get_image() is image
+        converter.set_segment(make_segment(1))
+        assert await converter.async_get_image() is image
+    assert not mock_generate.called
+
+    converter = KeyFrameConverter(hass, min_interval=0)
+    converter.set_segment(make_segment(2))
+    assert await converter.async_get_image() == image
+
+    # The keyframe goes stale when the worker stops setting new segments
+    stale = (
+        time.monotonic() + KEYFRAME_IMAGE_MAX_AGE_SEGMENTS * TARGET_SEGMENT_DURATION + 1
+    )
+    with patch("homeassistant.components.stream.core.monotonic", return_value=stale):
+        assert await converter.async_get_image() is None
+
+
+async def test_keyframe_converter_not_running(hass):
+    """Test a stream that is not running has no keyframe image."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+    stream = create_stream(hass, STREAM_SOURCE, {})
+    assert await stream.async_get_image() is None
@@ -1,10 +1,19 @@
 """Test Trace websocket API."""
 import asyncio
+import threading
+from unittest.mock import patch
 
 import pytest
 
 from homeassistant.bootstrap import async_setup_component
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.trace import ActionTrace, async_store_trace
+from homeassistant.components.trace.const import (
+    DATA_TRACE,
+    DATA_TRACE_BUDGET,
+    DEFAULT_RUNNING_TRACE_SIZE,
+    DEFAULT_STORED_TRACES,
+    MAX_VARIABLE_SIZE,
+)
 from homeassistant.core import Context, callback
 from homeassistant.helpers.typing import UNDEFINED
 
@@ -425,6 +434,160 @@ async def test_trace_overflow(hass, hass_ws_client, domain, stored_traces):
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_memory_budget(hass, hass_ws_client, domain):
+    """Test traces of all scripts or automations share a memory budget."""
+    id = 1
+
+    def next_id():
+        nonlocal id
+        id += 1
+        return id
+
+    assert await async_setup_component(hass, "trace", {"trace": {"memory_budget": 2}})
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    moon_config = {
+        "id": "moon",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "action": {"event": "another_event"},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config, moon_config])
+    budget = hass.data[DATA_TRACE_BUDGET]
+
+    client = await hass_ws_client()
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    sun_run_id = _find_run_id(response["result"], domain, "sun")
+    await client.send_json(
+        {
+            "id": next_id(),
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "sun",
+            "run_id": sun_run_id,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    sun_trace = response["result"]
+    assert sun_trace["state"] == "stopped"
+    assert sun_trace["trace"]
+    _assert_raw_config(domain, sun_config, sun_trace)
+
+    # Run "moon" more often than the default number of stored traces
+    runs = DEFAULT_STORED_TRACES * 10
+    for _ in range(runs):
+        await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+        await hass.async_block_till_done()
+
+    assert 0 < budget.size <= budget.max_size
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    moon_traces = _find_traces(response["result"], domain, "moon")
+    assert DEFAULT_STORED_TRACES < len(moon_traces) < runs
+    assert _find_traces(response["result"], domain, "sun") == []
+    assert moon_traces[-1]["last_step"] == sun_trace["last_step"]
+
+    await client.send_json(
+        {
+            "id": next_id(),
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "moon",
+            "run_id": moon_traces[-1]["run_id"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    moon_trace = response["result"]
+    assert set(moon_trace["trace"]) == set(sun_trace["trace"])
+    _assert_raw_config(domain, moon_config, moon_trace)
+
+
+async def test_trace_memory_budget_running_traces(hass):
+    """Test running traces count against the budget and are compacted later."""
+    assert await async_setup_component(hass, "trace", {"trace": {"memory_budget": 2}})
+    budget = hass.data[DATA_TRACE_BUDGET]
+    stored = hass.data[DATA_TRACE]
+    key = ("automation", "sun")
+
+    traces = []
+    for _ in range(3):
+        trace = ActionTrace(key, {}, None, Context())
+        async_store_trace(hass, trace, DEFAULT_STORED_TRACES)
+        traces.append(trace)
+    # The oldest running trace is evicted to make room for the newest
+    assert budget.size == 2 * DEFAULT_RUNNING_TRACE_SIZE
+    assert list(stored[key]) == [traces[1].run_id, traces[2].run_id]
+
+    compact_threads = []
+    compact = ActionTrace.compact
+
+    def mock_compact(self):
+        compact_threads.append(threading.get_ident())
+        return compact(self)
+
+    with patch.object(ActionTrace, "compact", mock_compact):
+        traces[0].finished()
+        traces[2].finished()
+        await hass.async_block_till_done()
+
+    # Evicted traces are not compacted, compacting runs in the executor
+    assert len(compact_threads) == 1
+    assert compact_threads[0] != threading.get_ident()
+    compact_size = traces[2].compact()
+    assert budget.size == DEFAULT_RUNNING_TRACE_SIZE + compact_size
+
+    # Running traces are counted with the size of the last finished trace
+    trace = ActionTrace(key, {}, None, Context())
+    async_store_trace(hass, trace, DEFAULT_STORED_TRACES)
+    assert budget.size == DEFAULT_RUNNING_TRACE_SIZE + 2 * compact_size
+
+
+async def test_trace_memory_budget_truncates_variables(hass, hass_ws_client):
+    """Test large variables are truncated in compact traces."""
+    assert await async_setup_component(hass, "trace", {"trace": {"memory_budget": 64}})
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(hass, "automation", [sun_config])
+
+    client = await hass_ws_client()
+
+    hass.bus.async_fire("test_event", {"payload": "x" * MAX_VARIABLE_SIZE})
+    await hass.async_block_till_done()
+    await client.send_json({"id": 1, "type": "trace/list", "domain": "automation"})
+    response = await client.receive_json()
+    run_id = _find_run_id(response["result"], "automation", "sun")
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "trace/get",
+            "domain": "automation",
+            "item_id": "sun",
+            "run_id": run_id,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    trigger = response["result"]["trace"]["trigger/0"][0]["changed_variables"][
+        "trigger"
+    ]
+    assert trigger.endswith("... (truncated)")
+    assert len(trigger) < MAX_VARIABLE_SIZE + 100
+
+
 @pytest.mark.parametrize("domain", ["automation", "script"])
 async def test_trace_no_traces(hass, hass_ws_client, domain):
     """Test the storing traces for a script or automation can be disabled."""
@@ -20,6 +20,11 @@ from homeassistant.helpers import entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.util.startup_profile import (
+    DATA_STARTUP_PROFILE,
+    PHASE_SETUP,
+    StartupProfile,
+)
 
 from tests.common import MockEntity, MockEntityPlatform, async_mock_service
 
@@ -412,6 +417,116 @@ async def test_get_states(hass, websocket_client):
     assert msg["result"] == states
 
 
+async def test_subscribe_entities(hass, websocket_client):
+    """Test subscribe_entities command."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    original_state = hass.states.get("light.permitted")
+
+    await websocket_client.send_json({"id": 5, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "a": {"color": "red"},
+                "c": original_state.context.id,
+                "lc": original_state.last_changed.timestamp(),
+                "s": "off",
+            }
+        }
+    }
+
+    hass.states.async_set("light.permitted", "on", {"effect": "help"})
+    new_state = hass.states.get("light.permitted")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "a": {"effect": "help"},
+                    "c": new_state.context.id,
+                    "lc": new_state.last_changed.timestamp(),
+                    "s": "on",
+                },
+                "-": {"a": ["color"]},
+            }
+        }
+    }
+
+    hass.states.async_set(
+        "light.permitted",
+        "on",
+        {"effect": "rainbow"},
+        context=Context(user_id="abc"),
+    )
+    new_state = hass.states.get("light.permitted")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "a": {"effect": "rainbow"},
+                    "c": {
+                        "id": new_state.context.id,
+                        "parent_id": None,
+                        "user_id": "abc",
+                    },
+                    "lu": new_state.last_updated.timestamp(),
+                },
+            }
+        }
+    }
+
+    hass.states.async_remove("light.permitted")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.permitted"]}
+
+    hass.states.async_set("light.permitted", "off")
+    new_state = hass.states.get("light.permitted")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"a": {"light.permitted": new_state.as_compressed_state()}}
+
+
+async def test_subscribe_entities_with_entity_ids(
+    hass, hass_admin_user, websocket_client
+):
+    """Test subscribe_entities only forwards requested and visible entities."""
+    hass_admin_user.mock_policy(
+        {"entities": {"entity_ids": {"light.permitted": True, "light.other": True}}}
+    )
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.other", "off")
+    hass.states.async_set("light.not_permitted", "off")
+
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.permitted", "light.not_permitted"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.permitted"]
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.permitted", "on")
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["c"]) == ["light.permitted"]
+
+
 async def test_get_services(hass, websocket_client):
     """Test get_services command."""
     await websocket_client.send_json({"id": 5, "type": "get_services"})
@@ -1189,3 +1304,66 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
         {"domain": "august", "seconds": 12.5},
         {"domain": "isy994", "seconds": 12.8},
     ]
+
+
+async def test_entity_poll_stats(hass, websocket_client, hass_admin_user):
+    """Test getting the poll statistics of the entity platforms."""
+    platform = MockEntityPlatform(hass)
+    await platform.async_add_entities([MockEntity(should_poll=True)])
+    await websocket_client.send_json({"id": 7, "type": "entity/poll_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+    assert msg["result"] == {}
+
+    platform.poll_stats.add(0.5)
+    await websocket_client.send_json({"id": 8, "type": "entity/poll_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+    assert msg["result"] == {
+        "test_domain.test_platform": {
+            "polls": 1,
+            "overruns": 0,
+            "last": 0.5,
+            "mean": 0.5,
+            "max": 0.5,
+        }
+    }
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 9, "type": "entity/poll_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_integration_startup_profile(hass, websocket_client, hass_admin_user):
+    """Test getting the startup profile."""
+    await websocket_client.send_json({"id": 7, "type": "integration/startup_profile"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    profile = hass.data[DATA_STARTUP_PROFILE] = StartupProfile()
+    with profile.phase("august", PHASE_SETUP):
+        pass
+    await websocket_client.send_json({"id": 8, "type": "integration/startup_profile"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+    assert msg["result"] == profile.as_dict()
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 9, "type": "integration/startup_profile"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
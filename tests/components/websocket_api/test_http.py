@@ -80,3 +80,52 @@ async def test_non_json_message(hass, websocket_client, caplog):
         f"Unable to serialize to JSON. Bad data found at $.result[0](State: test_domain.entity).attributes.bad={bad_data}(<class 'object'>"
         in caplog.text
     )
+
+
+async def test_coalesced_messages(hass, websocket_client):
+    """Test pending messages are sent as one frame when the client supports it."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["success"]
+
+    await websocket_client.send_json(
+        {"id": 2, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 2
+    assert msg["success"]
+
+    for idx in range(3):
+        hass.bus.async_fire("test_event", {"idx": idx})
+
+    msg = await websocket_client.receive_json()
+    assert [event["event"]["data"]["idx"] for event in msg] == [0, 1, 2]
+    assert all(event["id"] == 2 for event in msg)
+
+    # A single pending message is not wrapped
+    hass.bus.async_fire("test_event", {"idx": 3})
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["data"]["idx"] == 3
+
+
+async def test_messages_not_coalesced_by_default(hass, websocket_client):
+    """Test pending messages are sent one frame each by default."""
+    await websocket_client.send_json(
+        {"id": 1, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    for idx in range(3):
+        hass.bus.async_fire("test_event", {"idx": idx})
+
+    for idx in range(3):
+        msg = await websocket_client.receive_json()
+        assert msg["event"]["data"]["idx"] == idx
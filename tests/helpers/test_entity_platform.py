@@ -36,6 +36,14 @@ DOMAIN = "test_domain"
 PLATFORM = "test_platform"
 
 
+@pytest.fixture
+def no_polling_spread():
+    """Poll all entities at the start of the scan interval."""
+    with patch.object(entity_platform, "POLLING_SPREAD", 0):
+        yield
+
+
+@pytest.mark.usefixtures("no_polling_spread")
 async def test_polling_only_updates_entities_it_should_poll(hass):
     """Test the polling of only updated entities."""
     component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
@@ -68,6 +76,7 @@ async def test_polling_disabled_by_config_entry(hass):
     assert entity_platform._async_unsub_polling is None
 
 
+@pytest.mark.usefixtures("no_polling_spread")
 async def test_polling_updates_entities_with_exception(hass):
     """Test the updated entities that not break with an exception."""
     component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
@@ -105,6 +114,104 @@ async def test_polling_updates_entities_with_exception(hass):
     assert len(update_err) == 1
 
 
+async def test_polling_spread_over_interval(hass):
+    """Test entities are polled at their own offset within the interval."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    ent1 = MockEntity(should_poll=True)
+    ent1.async_update = Mock()
+    ent2 = MockEntity(should_poll=True)
+    ent2.async_update = Mock()
+
+    with patch.object(entity_platform, "POLLING_SPREAD", 0.5), patch(
+        "homeassistant.helpers.entity_platform.random.random",
+        side_effect=[0, 0.25],
+    ):
+        await component.async_add_entities([ent1, ent2])
+        ent1.async_update.reset_mock()
+        ent2.async_update.reset_mock()
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+        await hass.async_block_till_done()
+        assert ent1.async_update.called
+        assert not ent2.async_update.called
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+        await hass.async_block_till_done()
+        assert ent2.async_update.called
+
+    stats = entity_platform.async_get_poll_stats(hass)
+    assert stats[f"{DOMAIN}.{DOMAIN}"]["polls"] == 2
+    assert stats[f"{DOMAIN}.{DOMAIN}"]["overruns"] == 0
+
+
+async def test_polling_spread_with_random_offsets(hass):
+    """Test every entity is polled once within the spread of the interval."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    entities = [MockEntity(should_poll=True) for _ in range(10)]
+    for ent in entities:
+        ent.async_update = Mock()
+    await component.async_add_entities(entities)
+
+    start = dt_util.utcnow() + timedelta(seconds=20)
+    async_fire_time_changed(hass, start)
+    await hass.async_block_till_done()
+    assert not any(ent.async_update.called for ent in entities)
+
+    # The offsets spread the polls over the first half of the interval
+    async_fire_time_changed(hass, start + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert [ent.async_update.call_count for ent in entities] == [1] * 10
+
+    platform = component._platforms[DOMAIN]
+    offsets = [poll.offset for poll in platform._polls.values()]
+    assert all(0 < offset < 10 for offset in offsets)
+    assert len(set(offsets)) == 10
+    assert platform.poll_stats.polls == 10
+
+
+@pytest.mark.usefixtures("no_polling_spread")
+async def test_polling_backs_off_overrunning_entities(hass, caplog):
+    """Test entities that keep overrunning are polled less often."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    updates = []
+    blocked = asyncio.Event()
+
+    async def slow_update():
+        """Mock an update that does not finish."""
+        updates.append(None)
+        await blocked.wait()
+
+    ent = MockEntity(should_poll=True)
+    ent.async_update = slow_update
+    await component.async_add_entities([ent])
+
+    now = dt_util.utcnow()
+    for interval in range(1, 5):
+        async_fire_time_changed(hass, now + timedelta(seconds=20 * interval))
+        await asyncio.sleep(0)
+
+    assert len(updates) == 1
+    assert f"Updating {ent.entity_id} took longer" in caplog.text
+    platform = component._platforms[DOMAIN]
+    assert platform.poll_stats.overruns == 2
+
+    blocked.set()
+    await hass.async_block_till_done()
+    assert platform.poll_stats.polls == 1
+    assert platform.poll_stats.max >= 0
+
+    # Polled again after skipping the backed off intervals
+    for interval in range(5, 8):
+        async_fire_time_changed(hass, now + timedelta(seconds=20 * interval))
+        await hass.async_block_till_done()
+    assert len(updates) == 1
+    async_fire_time_changed(hass, now + timedelta(seconds=20 * 8))
+    await hass.async_block_till_done()
+    assert len(updates) == 2
+    assert platform.poll_stats.overruns == 2
+
+
+@pytest.mark.usefixtures("no_polling_spread")
 async def test_update_state_adds_entities(hass):
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
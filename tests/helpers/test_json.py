@@ -1,10 +1,20 @@
 """Test Home Assistant remote methods and classes."""
 from datetime import timedelta
+import json
+from unittest.mock import patch
 
 import pytest
 
 from homeassistant import core
-from homeassistant.helpers.json import ExtendedJSONEncoder, JSONEncoder
+from homeassistant.helpers import json as json_helper
+from homeassistant.helpers.json import (
+    ExtendedJSONEncoder,
+    JSONEncoder,
+    json_bytes,
+    json_dumps,
+    json_dumps_stable,
+    json_encoder_default,
+)
 from homeassistant.util import dt as dt_util
 
 
@@ -63,3 +73,63 @@ def test_trace_json_encoder(hass):
     # Default method falls back to repr(o)
     o = object()
     assert ha_json_enc.default(o) == {"__type": str(type(o)), "repr": repr(o)}
+
+
+@pytest.mark.parametrize("orjson", [json_helper.orjson, None])
+def test_json_bytes(orjson):
+    """Test serializing to compact JSON with and without orjson."""
+    state = core.State("test.test", "hello", {"float": 1.5, "none": None})
+    event = core.Event("test_event", {"state": state, "values": {1, 2}})
+    now = dt_util.utcnow()
+    data = {"state": state, "event": event, "now": now, 1: "one", "big": 2 ** 70}
+
+    with patch("homeassistant.helpers.json.orjson", orjson):
+        result = json_bytes(data)
+        assert json_dumps(data) == result.decode()
+
+    assert b", " not in result
+    assert json.loads(result) == {
+        "state": state.as_dict(),
+        "event": json.loads(json.dumps(event.as_dict(), cls=JSONEncoder)),
+        "now": now.isoformat(),
+        "1": "one",
+        "big": 2 ** 70,
+    }
+
+
+@pytest.mark.parametrize("orjson", [json_helper.orjson, None])
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"value": float("nan")},
+        [None, float("inf")],
+        core.State("test.test", "hello", {"nested": [float("-inf")]}),
+        core.Event("test_event", {"value": float("nan")}),
+    ],
+)
+def test_json_bytes_not_allows_nan(orjson, data):
+    """Test NaN and infinite floats are rejected with and without orjson."""
+    with patch("homeassistant.helpers.json.orjson", orjson), pytest.raises(ValueError):
+        json_bytes(data)
+
+
+def test_json_bytes_not_serializable():
+    """Test serializing an unsupported object raises TypeError."""
+    with pytest.raises(TypeError):
+        json_bytes({"value": object()})
+
+    with pytest.raises(TypeError):
+        json_encoder_default(object())
+
+
+def test_json_dumps_stable():
+    """Test the stable output is the same as json.dumps with the encoder."""
+    state = core.State("test.test", "hello", {"float": float("nan")})
+    data = {"state": state, "values": ["a", 1]}
+
+    assert json_dumps_stable(data) == json.dumps(data, cls=JSONEncoder)
+    assert json_dumps_stable(data, indent=4) == json.dumps(
+        data, indent=4, cls=JSONEncoder
+    )
+    with pytest.raises(TypeError):
+        json_dumps_stable(data, encoder=None)
@@ -186,7 +186,7 @@ async def test_dump_data(hass):
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = args[0]["states"]
 
     # b0 should not be written, since it didn't extend RestoreEntity
     # b1 should be written, since it is present in the current run
@@ -194,13 +194,17 @@ async def test_dump_data(hass):
     # b3 should be written, since it is still not expired
     # b4 should not be written, since it is now expired
     # b5 should be written, since current state is restored by entity registry
-    assert len(written_states) == 3
-    assert written_states[0]["state"]["entity_id"] == "input_boolean.b1"
-    assert written_states[0]["state"]["state"] == "on"
-    assert written_states[1]["state"]["entity_id"] == "input_boolean.b3"
-    assert written_states[1]["state"]["state"] == "off"
-    assert written_states[2]["state"]["entity_id"] == "input_boolean.b5"
-    assert written_states[2]["state"]["state"] == "off"
+    assert list(written_states) == [
+        "input_boolean.b1",
+        "input_boolean.b3",
+        "input_boolean.b5",
+    ]
+    assert written_states["input_boolean.b1"]["state"]["state"] == "on"
+    # b1 was seen at the time of the dump
+    assert "last_seen" not in written_states["input_boolean.b1"]
+    assert written_states["input_boolean.b3"]["state"]["state"] == "off"
+    assert written_states["input_boolean.b3"]["last_seen"] == now.isoformat()
+    assert written_states["input_boolean.b5"]["state"]["state"] == "off"
 
     # Test that removed entities are not persisted
     await entity.async_remove()
@@ -212,12 +216,61 @@ async def test_dump_data(hass):
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
-    assert len(written_states) == 2
-    assert written_states[0]["state"]["entity_id"] == "input_boolean.b3"
-    assert written_states[0]["state"]["state"] == "off"
-    assert written_states[1]["state"]["entity_id"] == "input_boolean.b5"
-    assert written_states[1]["state"]["state"] == "off"
+    written_states = args[0]["states"]
+    assert list(written_states) == ["input_boolean.b3", "input_boolean.b5"]
+    assert written_states["input_boolean.b3"]["state"]["state"] == "off"
+    assert written_states["input_boolean.b5"]["state"]["state"] == "off"
+
+
+async def test_dump_reuses_unchanged_states(hass):
+    """Test only states that changed since the last dump are encoded again."""
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    await entity.async_internal_added_to_hass()
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b2"
+    await entity.async_internal_added_to_hass()
+    hass.states.async_set("input_boolean.b1", "on")
+    hass.states.async_set("input_boolean.b2", "on")
+
+    data = await RestoreStateData.async_get_instance(hass)
+    first = data.async_get_dump()["states"]
+    hass.states.async_set("input_boolean.b2", "off")
+    second = data.async_get_dump()["states"]
+
+    assert second["input_boolean.b1"]["state"] is first["input_boolean.b1"]["state"]
+    assert second["input_boolean.b2"]["state"]["state"] == "off"
+
+
+async def test_restoring_dumped_states(hass, hass_storage):
+    """Test restoring the states of both storage versions."""
+    now = dt_util.utcnow()
+    hass_storage[STORAGE_KEY] = {
+        "version": 2,
+        "key": STORAGE_KEY,
+        "data": {
+            "dumped_at": now.isoformat(),
+            "states": {
+                "input_boolean.b1": {
+                    "state": State("input_boolean.b1", "on").as_dict(),
+                },
+                "input_boolean.b2": {
+                    "state": State("input_boolean.b2", "off").as_dict(),
+                    "last_seen": datetime(2021, 1, 1, tzinfo=dt_util.UTC).isoformat(),
+                },
+            },
+        },
+    }
+
+    data = await RestoreStateData.async_get_instance(hass)
+    assert data.last_states["input_boolean.b1"].state.state == "on"
+    assert data.last_states["input_boolean.b1"].last_seen == now
+    assert data.last_states["input_boolean.b2"].state.state == "off"
+    assert data.last_states["input_boolean.b2"].last_seen == datetime(
+        2021, 1, 1, tzinfo=dt_util.UTC
+    )
 
 
 async def test_dump_error(hass):
@@ -279,3 +279,78 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+def test_journal_appends_changes(tmp_path):
+    """Test the journal only appends the changes and replays them."""
+    path = str(tmp_path / "journaled")
+    journal = storage.StorageJournal(path)
+    data = {
+        "version": 1,
+        "key": "journaled",
+        "data": {"items": [{"id": idx, "name": f"Item {idx}"} for idx in range(50)]},
+    }
+    journal.write(data)
+    snapshot = (tmp_path / "journaled").read_text()
+
+    data["data"]["items"][3]["name"] = "Renamed"
+    journal.write(data)
+    del data["data"]["items"][40:]
+    data["data"]["items"].append({"id": 100, "name": "New"})
+    data["data"]["extra"] = (1, 2)
+    journal.write(data)
+    del data["data"]["extra"]
+    data["version"] = 2
+    journal.write(data)
+
+    # The snapshot is unchanged and the journal holds one line per write
+    assert (tmp_path / "journaled").read_text() == snapshot
+    assert len((tmp_path / "journaled.journal").read_text().splitlines()) == 4
+
+    assert storage.StorageJournal(path).load() == data
+
+
+def test_journal_compacts(tmp_path):
+    """Test a new snapshot is written once the journal grows too large."""
+    path = str(tmp_path / "journaled")
+    journal = storage.StorageJournal(path)
+    data = {"version": 1, "key": "journaled", "data": {"value": 0}}
+    journal.write(data)
+
+    for value in range(1, 20):
+        data["data"]["value"] = value
+        journal.write(data)
+
+    assert json.loads((tmp_path / "journaled").read_text())["data"]["value"] > 0
+    journal_lines = (tmp_path / "journaled.journal").read_text().splitlines()
+    assert len(journal_lines) < 20
+    assert storage.StorageJournal(path).load() == data
+
+
+def test_journal_outdated_and_corrupt(tmp_path, caplog):
+    """Test journals not matching the snapshot and corrupt records are skipped."""
+    path = str(tmp_path / "journaled")
+    journal = storage.StorageJournal(path)
+    data = {"version": 1, "key": "journaled", "data": {"items": list(range(50))}}
+    journal.write(data)
+    data["data"]["items"][0] = "first"
+    journal.write(data)
+    data["data"]["items"][1] = "second"
+    journal.write(data)
+
+    journal_path = tmp_path / "journaled.journal"
+    lines = journal_path.read_text().splitlines(keepends=True)
+    journal_path.write_text(lines[0] + lines[1] + lines[2][:5])
+    journal = storage.StorageJournal(path)
+    loaded = journal.load()
+    assert loaded["data"]["items"][:2] == ["first", 1]
+    assert "Skipping corrupt journal records" in caplog.text
+
+    # The next write starts over from a new snapshot
+    journal.write(data)
+    assert len(journal_path.read_text().splitlines()) == 1
+    assert storage.StorageJournal(path).load() == data
+
+    # An interrupted snapshot leaves a journal of the previous snapshot
+    journal_path.write_text(lines[0] + lines[1])
+    assert storage.StorageJournal(path).load() == data
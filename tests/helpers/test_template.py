@@ -4,6 +4,7 @@ import math
 import random
 from unittest.mock import patch
 
+import jinja2
 import pytest
 import voluptuous as vol
 
@@ -2170,35 +2171,39 @@ def test_urlencode(hass):
     assert tpl.async_render() == "the%20quick%20brown%20fox%20%3D%20true"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_compiled_code_cache(hass):
+    """Test compiled templates are shared and outlive the templates."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
+    tpl = template.Template(template_string, hass)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-
-    tpl2 = template.Template(
-        (template_string),
-    )
-    tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    code = template.COMPILED_CODE.get("normal", template_string)
+    assert code is not None
 
     del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    tpl2 = template.Template(template_string, hass)
+    with patch(
+        "jinja2.sandbox.ImmutableSandboxedEnvironment.compile",
+        side_effect=AssertionError,
+    ):
+        tpl2.ensure_valid()
+    assert tpl2._compiled_code is code  # pylint: disable=protected-access
+
+    tpl3 = template.Template(template_string, hass)
+    assert tpl3.async_render(limited=True) == "foo=x%26y&bar=42"
+    assert template.COMPILED_CODE.get("limited", template_string) is None
+
+
+def test_compiled_code_cache_size():
+    """Test the compiled code cache drops the least recently used code."""
+    cache = template.CompiledCodeCache(2)
+    env = template.TemplateEnvironment(None)
+    for source in ("{{ 1 }}", "{{ 2 }}", "{{ 3 }}"):
+        cache.set("normal", source, env.compile(source))
+    assert cache.get("normal", "{{ 1 }}") is None
+    code = cache.get("normal", "{{ 3 }}")
+    assert jinja2.Template.from_code(env, code, env.globals, None).render() == "3"
 
 
 def test_is_template_string():
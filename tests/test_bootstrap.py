@@ -12,6 +12,7 @@ import homeassistant.config as config_util
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 import homeassistant.util.dt as dt_util
+from homeassistant.util.startup_profile import DATA_STARTUP_PROFILE
 
 from tests.common import (
     MockModule,
@@ -81,6 +82,18 @@ async def test_empty_setup(hass):
         assert domain in hass.config.components, domain
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_manifest_index_saved(hass, hass_storage):
+    """Test the manifest index is saved after setting up the integrations."""
+    await bootstrap.async_from_config_dict({}, hass)
+
+    index = hass_storage[bootstrap.MANIFEST_INDEX_STORAGE_KEY]["data"]
+    assert any(
+        entry["manifest"]["domain"] == "persistent_notification"
+        for entry in index["manifests"].values()
+    )
+
+
 async def test_core_failure_loads_safe_mode(hass, caplog):
     """Test failing core setup aborts further setup."""
     with patch(
@@ -411,6 +424,46 @@ async def test_setup_hass(
     assert len(mock_process_ha_config_upgrade.mock_calls) == 1
 
 
+async def test_setup_hass_profile_startup(
+    mock_enable_logging,
+    mock_is_virtual_env,
+    mock_mount_local_lib_path,
+    mock_ensure_config_exists,
+    mock_process_ha_config_upgrade,
+    loop,
+):
+    """Test the startup profile is written when enabled."""
+    with patch(
+        "homeassistant.config.async_hass_config_yaml",
+        return_value={"browser": {}},
+    ), patch.object(bootstrap, "save_json") as mock_save_json:
+        hass = await bootstrap.async_setup_hass(
+            runner.RuntimeConfig(
+                config_dir=get_test_config_dir(),
+                skip_pip=True,
+                profile_startup=True,
+            ),
+        )
+
+    assert "browser" in hass.config.components
+    assert len(mock_save_json.mock_calls) == 1
+    path, trace = mock_save_json.mock_calls[0][1]
+    assert path == hass.config.path(bootstrap.STARTUP_PROFILE_FILENAME)
+    events = trace["traceEvents"]
+    tracks = {
+        event["args"]["name"]: event["tid"]
+        for event in events
+        if event["name"] == "thread_name"
+    }
+    phases = {(event["tid"], event["name"]) for event in events if event["ph"] == "X"}
+    assert (tracks["browser"], "setup browser") in phases
+    assert (tracks["browser"], "config") in phases
+    assert (tracks["bootstrap"], "stage 2") in phases
+
+    profile = hass.data[DATA_STARTUP_PROFILE]
+    assert profile.finished
+
+
 async def test_setup_hass_takes_longer_than_log_slow_startup(
     mock_enable_logging,
     mock_is_virtual_env,
@@ -383,6 +383,42 @@ def test_state_as_dict():
     assert state.as_dict() is state.as_dict()
 
 
+def test_state_as_compressed_state():
+    """Test a State as compressed state."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0, tzinfo=dt_util.UTC)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        last_updated=last_time,
+        last_changed=last_time,
+    )
+    expected = {
+        "a": {"pig": "dog"},
+        "c": state.context.id,
+        "lc": last_time.timestamp(),
+        "s": "on",
+    }
+    assert state.as_compressed_state() == expected
+    # 2nd time to verify cache
+    assert state.as_compressed_state() is state.as_compressed_state()
+
+    state = ha.State(
+        "happy.happy",
+        "on",
+        last_updated=last_time + timedelta(seconds=1),
+        last_changed=last_time,
+        context=ha.Context(user_id="abc"),
+    )
+    assert state.as_compressed_state() == {
+        "a": {},
+        "c": {"id": state.context.id, "parent_id": None, "user_id": "abc"},
+        "lc": last_time.timestamp(),
+        "lu": (last_time + timedelta(seconds=1)).timestamp(),
+        "s": "on",
+    }
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -1518,6 +1554,33 @@ async def test_async_entity_ids_count(hass):
     assert hass.states.async_entity_ids_count("light") == 3
 
 
+async def test_statemachine_domain_index(hass):
+    """Test the domain index is kept in sync with the states."""
+
+    hass.states.async_set("switch.link", "on")
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.bowl", "off")
+    hass.states.async_reserve("light.frog")
+
+    assert hass.states.async_entity_ids("light") == ["light.bowl"]
+    assert hass.states.async_entity_ids("LIGHT") == ["light.bowl"]
+    assert hass.states.async_all("light")[0].state == "off"
+    assert hass.states.async_entity_ids_count(["light", "switch"]) == 2
+
+    hass.states.async_set("light.frog", "on")
+    assert hass.states.async_entity_ids(["light", "sensor"]) == [
+        "light.bowl",
+        "light.frog",
+    ]
+
+    assert hass.states.async_remove("light.bowl")
+    assert hass.states.async_remove("light.frog")
+    assert hass.states.async_entity_ids("light") == []
+    assert hass.states.async_all("light") == []
+    assert hass.states.async_entity_ids_count("light") == 0
+    assert hass.states.async_entity_ids() == ["switch.link"]
+
+
 async def test_hassjob_forbid_coroutine():
     """Test hassjob forbids coroutines."""
 
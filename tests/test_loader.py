@@ -1,4 +1,6 @@
 """Test to verify that we can load components."""
+import json
+import os
 from unittest.mock import patch
 
 import pytest
@@ -481,3 +483,64 @@ async def test_custom_integration_missing(hass, caplog):
 
         with pytest.raises(loader.IntegrationNotFound):
             await loader.async_get_integration(hass, "test1")
+
+
+async def test_manifest_index(hass, enable_custom_integrations):
+    """Test integrations are resolved from the manifest index."""
+    index = hass.data[loader.DATA_MANIFEST_INDEX] = loader.ManifestIndex()
+    integration = await loader.async_get_integration(hass, "logbook")
+    assert await integration.resolve_dependencies()
+    custom_integration = await loader.async_get_integration(hass, "test_package")
+    assert index.dirty
+
+    data = json.loads(json.dumps(index.as_dict()))
+    assert not index.dirty
+    manifest_path = str(integration.file_path / "manifest.json")
+    assert data["manifests"][manifest_path]["manifest"]["domain"] == "logbook"
+    assert data["dependencies"]["logbook"] == sorted(integration.all_dependencies)
+
+    # Resolve again without reading the manifests
+    hass.data.pop(loader.DATA_INTEGRATIONS)
+    hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+    index = loader.ManifestIndex(data)
+    await hass.async_add_executor_job(index.validate)
+    assert not index.dirty
+    hass.data[loader.DATA_MANIFEST_INDEX] = index
+    with patch("pathlib.Path.read_text", side_effect=AssertionError), patch(
+        "pathlib.Path.iterdir", side_effect=AssertionError
+    ), patch(
+        "homeassistant.loader._async_component_dependencies",
+        side_effect=AssertionError,
+    ):
+        cached = await loader.async_get_integration(hass, "logbook")
+        assert await cached.resolve_dependencies()
+        cached_custom = await loader.async_get_integration(hass, "test_package")
+
+    assert cached.manifest == integration.manifest
+    assert cached.all_dependencies == integration.all_dependencies
+    assert cached_custom.manifest == custom_integration.manifest
+    assert not index.dirty
+
+
+async def test_manifest_index_validate(hass):
+    """Test changed manifests are dropped from the index."""
+    integration = await loader.async_get_integration(hass, "hue")
+    manifest_path = str(integration.file_path / "manifest.json")
+    index = loader.ManifestIndex(
+        {
+            "manifests": {
+                manifest_path: {
+                    "mtime": os.stat(manifest_path).st_mtime_ns,
+                    "manifest": integration.manifest,
+                },
+                "/non/existing/manifest.json": {"mtime": 1, "manifest": {}},
+            },
+            "directories": {},
+            "dependencies": {"hue": ["http"]},
+        }
+    )
+    await hass.async_add_executor_job(index.validate)
+
+    assert list(index.manifests) == [manifest_path]
+    assert index.dependencies == {}
+    assert index.dirty
@@ -0,0 +1,30 @@
+"""Test Home Assistant LRU mapping."""
+from homeassistant.util.lru import LRU
+
+
+def test_lru_evicts_least_recently_used():
+    """Test the least recently used item is evicted."""
+    lru = LRU(2)
+    lru["a"] = 1
+    lru["b"] = 2
+    assert lru["a"] == 1
+    lru["c"] = 3
+
+    assert dict(lru) == {"a": 1, "c": 3}
+
+    assert lru.get("a") == 1
+    lru["d"] = 4
+    assert dict(lru) == {"a": 1, "d": 4}
+
+
+def test_lru_get_missing_and_update():
+    """Test get with a missing key and updating a key."""
+    lru = LRU(2)
+    lru["a"] = 1
+    lru["b"] = 2
+    lru["a"] = 5
+    lru["c"] = 3
+
+    assert lru.get("b") is None
+    assert lru.get("b", 7) == 7
+    assert dict(lru) == {"a": 5, "c": 3}
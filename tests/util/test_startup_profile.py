@@ -0,0 +1,75 @@
+"""Test the startup profile."""
+from unittest.mock import Mock
+
+from homeassistant.util import startup_profile
+
+
+def test_phases_are_recorded_per_integration():
+    """Test each integration gets its own track."""
+    profile = startup_profile.StartupProfile()
+    with profile.phase("hue", startup_profile.PHASE_IMPORT, "import hue"):
+        pass
+    with profile.phase("hue", startup_profile.PHASE_SETUP):
+        with profile.phase("light", startup_profile.PHASE_CONFIG):
+            pass
+
+    trace = profile.as_dict()
+    assert trace["displayTimeUnit"] == "ms"
+    events = trace["traceEvents"]
+    assert events[0]["name"] == "process_name"
+    assert [(event["tid"], event["args"]["name"]) for event in events[1:3]] == [
+        (1, "hue"),
+        (2, "light"),
+    ]
+
+    phases = events[3:]
+    assert [(event["tid"], event["name"], event["cat"]) for event in phases] == [
+        (1, "import hue", "import"),
+        (2, "config", "config"),
+        (1, "setup", "setup"),
+    ]
+    for event in phases:
+        assert event["ph"] == "X"
+        assert event["dur"] >= 0
+    setup, config = phases[2], phases[1]
+    assert setup["ts"] <= config["ts"]
+    assert config["ts"] + config["dur"] <= setup["ts"] + setup["dur"]
+
+
+def test_phases_are_recorded_on_error():
+    """Test a phase raising an exception is recorded."""
+    profile = startup_profile.StartupProfile()
+    try:
+        with profile.phase("hue", startup_profile.PHASE_SETUP):
+            raise ValueError
+    except ValueError:
+        pass
+
+    assert profile.as_dict()["traceEvents"][-1]["name"] == "setup"
+
+
+def test_finish_stops_recording():
+    """Test no phases are recorded after the startup finished."""
+    profile = startup_profile.StartupProfile()
+    profile.finish()
+    with profile.phase("hue", startup_profile.PHASE_SETUP):
+        pass
+
+    assert len(profile.as_dict()["traceEvents"]) == 1
+
+
+def test_startup_phase():
+    """Test startup_phase only records when the profile is enabled."""
+    hass = Mock(data={})
+    with startup_profile.startup_phase(hass, "hue", startup_profile.PHASE_SETUP):
+        pass
+
+    profile = hass.data[
+        startup_profile.DATA_STARTUP_PROFILE
+    ] = startup_profile.StartupProfile()
+    with startup_profile.startup_phase(
+        hass, "hue", startup_profile.PHASE_SETUP, "setup hue"
+    ):
+        pass
+
+    assert profile.as_dict()["traceEvents"][-1]["name"] == "setup hue"